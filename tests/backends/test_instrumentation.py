@@ -0,0 +1,166 @@
+from unittest.mock import patch
+
+from tests.testmodels import Tournament
+from tortoise import connections
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+from tortoise.contrib.test.condition import NotEQ
+from tortoise.exceptions import OperationalError
+from tortoise.instrumentation import Histogram, InMemoryCollector
+from tortoise.transactions import in_transaction
+
+
+class TestHistogram(test.SimpleTestCase):
+    def test_observe(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0, 3.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 2])
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.sum, 5.65)
+        self.assertEqual(histogram.cumulative_counts(), [(0.1, 2), (1.0, 3), (float("inf"), 5)])
+
+
+class TestInstrumentation(test.TruncationTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.db = connections.get("models")
+        self.collector = InMemoryCollector()
+        self.db.instrumentation = self.collector
+
+    async def asyncTearDown(self) -> None:
+        self.db.instrumentation = None
+        await super().asyncTearDown()
+
+    async def test_queries(self):
+        await Tournament.create(name="Test")
+        await Tournament.create(name="Test 2")
+        self.assertEqual(await Tournament.filter(name="Test").count(), 1)
+        self.assertEqual(len(await Tournament.all()), 2)
+
+        queries = {query: stats for (_, query), stats in self.collector.queries.items()}
+        sql = Tournament.all().sql()
+        self.assertEqual(queries[sql].count, 1)
+        self.assertEqual(queries[sql].rows, 2)
+        self.assertEqual(queries[sql].errors, 0)
+        self.assertGreater(queries[sql].total_time, 0)
+        self.assertGreaterEqual(queries[sql].total_time, queries[sql].max_time)
+        insert_stats = [stats for query, stats in queries.items() if query.startswith("INSERT")]
+        self.assertEqual(insert_stats[0].count, 2)
+
+        query_time = self.collector.query_time[self.db.connection_name]
+        self.assertEqual(query_time.count, 4)
+        acquire_wait = self.collector.acquire_wait[self.db.connection_name]
+        self.assertEqual(acquire_wait.count, 4)
+        self.assertEqual(self.collector.in_use[self.db.connection_name], 0)
+        self.assertEqual(self.collector.max_in_use[self.db.connection_name], 1)
+
+    async def test_query_error(self):
+        with self.assertRaises(OperationalError):
+            await self.db.execute_query("SELECT * FROM nonexistent_table")
+        stats = self.collector.queries[(self.db.connection_name, "SELECT * FROM nonexistent_table")]
+        self.assertEqual((stats.count, stats.errors, stats.rows), (1, 1, 0))
+        self.assertEqual(self.collector.in_use[self.db.connection_name], 0)
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_transaction(self):
+        async with in_transaction() as connection:
+            await Tournament.create(name="Test", using_db=connection)
+            await Tournament.all().using_db(connection).count()
+        # The connection is acquired once for the transaction, not for each query
+        self.assertEqual(self.collector.acquire_wait[self.db.connection_name].count, 1)
+        self.assertEqual(self.collector.max_in_use[self.db.connection_name], 1)
+        self.assertEqual(self.collector.in_use[self.db.connection_name], 0)
+        self.assertEqual(self.collector.query_time[self.db.connection_name].count, 2)
+
+    async def test_query_iter(self):
+        await Tournament.create(name="Test")
+        await Tournament.create(name="Test 2")
+        self.collector.reset()
+        sql = "SELECT name FROM tournament"
+        chunks = [chunk async for chunk in self.db.execute_query_iter(sql, None, 1)]
+        self.assertEqual(len(chunks), 2)
+        stats = self.collector.queries[(self.db.connection_name, sql)]
+        self.assertEqual((stats.count, stats.errors, stats.rows), (1, 0, 2))
+        self.assertEqual(self.collector.in_use[self.db.connection_name], 0)
+
+    async def test_query_iter_error(self):
+        sql = "SELECT * FROM nonexistent_table"
+        with self.assertRaises(OperationalError):
+            async for _ in self.db.execute_query_iter(sql):
+                pass
+        stats = self.collector.queries[(self.db.connection_name, sql)]
+        self.assertEqual((stats.count, stats.errors), (1, 1))
+
+    async def test_max_queries(self):
+        self.collector.max_queries = 1
+        await self.db.execute_query("SELECT 1")
+        await self.db.execute_query("SELECT 2")
+        self.assertEqual(list(self.collector.queries), [(self.db.connection_name, "SELECT 1")])
+        self.assertEqual(self.collector.query_time[self.db.connection_name].count, 2)
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_no_pool_stats(self):
+        self.assertIsNone(self.db.get_pool_stats())
+
+    @test.requireCapability(dialect=NotEQ("sqlite"))
+    async def test_pool_stats(self):
+        await self.db.execute_query("SELECT 1")
+        stats = self.db.get_pool_stats()
+        self.assertEqual(stats["in_use"], stats["size"] - stats["idle"])
+
+
+class TestSlowQueryThreshold(test.SimpleTestCase):
+    def test_connection_param(self):
+        client = SqliteClient(
+            file_path=":memory:", connection_name="slow", slow_query_threshold="0.5"
+        )
+        self.assertEqual(client.slow_query_threshold, 0.5)
+        self.assertNotIn("slow_query_threshold", client.pragmas)
+        self.assertIsNone(
+            SqliteClient(file_path=":memory:", connection_name="fast").slow_query_threshold
+        )
+
+
+class TestSlowQueryLog(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.db = connections.get("models")
+
+    async def asyncTearDown(self) -> None:
+        self.db.slow_query_threshold = None
+        await super().asyncTearDown()
+
+    async def test_slow_query(self):
+        self.db.slow_query_threshold = 0
+        with self.assertLogs("tortoise.slow_query") as logs:
+            await Tournament.filter(name="Test").limit(1)
+        (record,) = logs.records
+        self.assertEqual(record.sql, Tournament.filter(name="Test").limit(1).sql())
+        self.assertEqual(record.params, 2)
+        self.assertEqual(record.rows, 0)
+        self.assertGreaterEqual(record.duration, 0)
+        self.assertEqual(record.origin, "QuerySet(Tournament)")
+        self.assertIn(__file__, record.caller)
+        self.assertIsNone(record.error)
+
+    async def test_slow_query_model_method(self):
+        self.db.slow_query_threshold = 0
+        with self.assertLogs("tortoise.slow_query") as logs:
+            await Tournament.create(name="Test")
+        self.assertEqual(logs.records[0].origin, "Tournament.create")
+
+    async def test_slow_query_error(self):
+        self.db.slow_query_threshold = 0
+        with self.assertLogs("tortoise.slow_query") as logs:
+            with self.assertRaises(OperationalError):
+                await self.db.execute_query("SELECT * FROM nonexistent_table")
+        (record,) = logs.records
+        self.assertIsInstance(record.error, OperationalError)
+        self.assertIsNone(record.origin)
+
+    async def test_below_threshold(self):
+        self.db.slow_query_threshold = 60
+        with patch("tortoise.backends.base.client._log_slow_query") as log_slow_query:
+            await Tournament.filter(name="Test")
+        log_slow_query.assert_not_called()
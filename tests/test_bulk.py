@@ -1,3 +1,5 @@
+from contextlib import ExitStack
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 from tests.testmodels import UniqueName, UUIDPkModel
@@ -163,3 +165,116 @@ class TestBulk(test.TruncationTestCase):
         await UniqueName.bulk_create([name1, name2], ignore_conflicts=True)
         with self.assertRaises(IntegrityError):
             await UniqueName.bulk_create([name1, name2])
+
+    @test.requireCapability(dialect=NotEQ("mssql"))
+    async def test_bulk_create_copy(self):
+        await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(1000)], method="copy")
+        all_ = await UniqueName.all().values_list("name", flat=True)
+        self.assertEqual(sorted(all_), sorted(str(i) for i in range(1000)))
+
+    @test.requireCapability(dialect=NotEQ("mssql"))
+    async def test_bulk_create_copy_uuidpk(self):
+        objs = [UUIDPkModel() for _ in range(100)]
+        await UUIDPkModel.bulk_create(objs, batch_size=30, method="copy")
+        res = await UUIDPkModel.all().values_list("id", flat=True)
+        self.assertEqual(sorted(res), sorted(obj.id for obj in objs))
+
+    @test.requireCapability(dialect=NotEQ("mssql"))
+    async def test_bulk_create_copy_fail(self):
+        with self.assertRaises(IntegrityError):
+            await UniqueName.bulk_create(
+                [UniqueName(name=str(i)) for i in range(10)]
+                + [UniqueName(name=str(i)) for i in range(10)],
+                method="copy",
+            )
+
+    async def test_bulk_create_invalid_method(self):
+        with self.assertRaisesRegex(ValueError, "method must be"):
+            await UniqueName.bulk_create([UniqueName()], method="upsert")
+        with self.assertRaisesRegex(ValueError, "does not support"):
+            await UniqueName.bulk_create([UniqueName()], ignore_conflicts=True, method="copy")
+
+    async def test_bulk_create_multi_row_statements(self):
+        executor_class = UniqueName._meta.db.executor_class
+        if not executor_class.BULK_INSERT_MAX_PARAMS:
+            self.skipTest("Multi-row inserts are not used for this database")
+        executor = executor_class(model=UniqueName, db=UniqueName._meta.db)
+        insert_sql, _ = executor.get_bulk_insert_sql(3)
+        self.assertEqual(insert_sql.count("),("), 2)
+        self.assertIs(executor.get_bulk_insert_sql(3), executor.get_bulk_insert_sql(3))
+
+        with patch.object(executor_class, "BULK_INSERT_MAX_PARAMS", 10):
+            await UniqueName.bulk_create(
+                [UniqueName(name=str(i)) for i in range(25)]
+                + [UniqueName(id=-1 - i, name=f"pk{i}") for i in range(25)],
+                batch_size=23,
+            )
+        names = await UniqueName.all().values_list("name", flat=True)
+        self.assertEqual(
+            sorted(names), sorted([str(i) for i in range(25)] + [f"pk{i}" for i in range(25)])
+        )
+        self.assertEqual(await UniqueName.filter(id__lt=0).count(), 25)
+
+    @test.requireCapability(dialect=NotEQ("mssql"))
+    async def test_bulk_create_multi_row_statements_fail(self):
+        executor_class = UniqueName._meta.db.executor_class
+        with patch.object(executor_class, "BULK_INSERT_MAX_PARAMS", 10):
+            with self.assertRaises(IntegrityError):
+                await UniqueName.bulk_create(
+                    [UniqueName(name=str(i)) for i in range(15)] + [UniqueName(name="0")]
+                )
+        self.assertEqual(await UniqueName.all().count(), 0)
+
+    async def test_bulk_create_return_pks(self):
+        objs = [UniqueName(name=str(i)) for i in range(25)] + [UniqueName(id=-1, name="pk")]
+        executor_class = UniqueName._meta.db.executor_class
+        with patch.object(executor_class, "BULK_INSERT_MAX_PARAMS", 10):
+            await UniqueName.bulk_create(objs, batch_size=23, return_pks=True)
+        self.assertTrue(all(obj._saved_in_db for obj in objs))
+        self.assertEqual(
+            {obj.pk: obj.name for obj in objs},
+            dict(await UniqueName.all().values_list("id", "name")),
+        )
+        self.assertEqual(len({obj.pk for obj in objs}), 26)
+
+    async def test_bulk_create_return_pks_single_statement(self):
+        executor_class = UniqueName._meta.db.executor_class
+        if not executor_class.BULK_INSERT_RETURNING:
+            self.skipTest("multi-row INSERT can't return the generated fields")
+        objs = [UniqueName(name=str(i)) for i in range(30)]
+        db = UniqueName._meta.db
+        methods = ("execute_insert", "execute_query", "execute_query_dict", "execute_many")
+        with ExitStack() as stack:
+            mocks = [
+                stack.enter_context(patch.object(db, method, wraps=getattr(db, method)))
+                for method in methods
+            ]
+            await UniqueName.bulk_create(objs, return_pks=True)
+        self.assertEqual(sum(mock.call_count for mock in mocks), 1)
+        self.assertEqual(
+            [obj.pk for obj in objs],
+            await UniqueName.all().order_by("id").values_list("id", flat=True),
+        )
+        self.assertEqual([obj.name for obj in objs], [str(i) for i in range(30)])
+
+    async def test_bulk_create_return_pks_one_per_statement(self):
+        objs = [UniqueName(name=str(i)) for i in range(3)]
+        executor_class = UniqueName._meta.db.executor_class
+        with patch.object(executor_class, "BULK_INSERT_RETURNING", False):
+            await UniqueName.bulk_create(objs, return_pks=True)
+        self.assertEqual(
+            [obj.pk for obj in objs],
+            await UniqueName.all().order_by("name").values_list("id", flat=True),
+        )
+
+    async def test_bulk_create_return_pks_uuidpk(self):
+        objs = [UUIDPkModel() for _ in range(3)]
+        await UUIDPkModel.bulk_create(objs, return_pks=True)
+        self.assertEqual(
+            sorted(obj.pk for obj in objs),
+            sorted(await UUIDPkModel.all().values_list("id", flat=True)),
+        )
+
+    async def test_bulk_create_return_pks_invalid(self):
+        with self.assertRaisesRegex(ValueError, "return_pks does not support"):
+            await UniqueName.bulk_create([UniqueName()], ignore_conflicts=True, return_pks=True)
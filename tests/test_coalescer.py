@@ -0,0 +1,151 @@
+import asyncio
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+
+from tests.testmodels import Tournament
+from tortoise.coalescer import insert_coalescer
+from tortoise.contrib import test
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+
+class TestInsertCoalescer(test.TruncationTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.executor_class = Tournament._meta.db.executor_class
+        self.enable = patch.object(Tournament._meta, "coalesce_inserts", True)
+        self.enable.start()
+
+    async def asyncTearDown(self) -> None:
+        self.enable.stop()
+        await super().asyncTearDown()
+
+    def count_inserts(self):
+        return (
+            patch.object(
+                self.executor_class,
+                "execute_bulk_insert",
+                autospec=True,
+                side_effect=self.executor_class.execute_bulk_insert,
+            ),
+            patch.object(
+                self.executor_class,
+                "execute_insert",
+                autospec=True,
+                side_effect=self.executor_class.execute_insert,
+            ),
+        )
+
+    @contextmanager
+    def count_statements(self):
+        """
+        Counts the statements sent to the driver.
+        """
+        db = Tournament._meta.db
+        methods = ("execute_insert", "execute_query", "execute_query_dict", "execute_many")
+        with ExitStack() as stack:
+            mocks = [
+                stack.enter_context(patch.object(db, method, wraps=getattr(db, method)))
+                for method in methods
+            ]
+            yield lambda: sum(mock.call_count for mock in mocks)
+
+    def skip_without_bulk_insert_returning(self):
+        if not self.executor_class.BULK_INSERT_RETURNING:
+            self.skipTest("multi-row INSERT can't return the generated fields")
+
+    async def test_concurrent_creates(self):
+        bulk_patch, single_patch = self.count_inserts()
+        with bulk_patch as execute_bulk_insert, single_patch as execute_insert:
+            tournaments = await asyncio.gather(*(Tournament.create(name=str(i)) for i in range(5)))
+        self.assertEqual(execute_bulk_insert.call_count, 1)
+        self.assertEqual(execute_insert.call_count, 0)
+        pks = [t.pk for t in tournaments]
+        self.assertEqual(len(set(pks)), 5)
+        self.assertTrue(all(t._saved_in_db for t in tournaments))
+        for tournament in tournaments:
+            self.assertEqual((await Tournament.get(pk=tournament.pk)).name, tournament.name)
+
+    async def test_concurrent_creates_statements(self):
+        self.skip_without_bulk_insert_returning()
+        with self.count_statements() as statements:
+            tournaments = await asyncio.gather(*(Tournament.create(name=str(i)) for i in range(5)))
+        self.assertEqual(statements(), 1)
+        self.assertEqual(
+            await Tournament.all().order_by("id").values_list("id", "name"),
+            [(t.pk, t.name) for t in tournaments],
+        )
+
+    async def test_save(self):
+        tournaments = [Tournament(name=str(i)) for i in range(3)]
+        await asyncio.gather(*(t.save() for t in tournaments))
+        self.assertEqual(
+            await Tournament.all().order_by("id").values_list("id", "name"),
+            [(t.pk, t.name) for t in tournaments],
+        )
+
+    async def test_single_insert(self):
+        bulk_patch, single_patch = self.count_inserts()
+        with bulk_patch as execute_bulk_insert, single_patch as execute_insert:
+            tournament = await Tournament.create(name="Single")
+        self.assertEqual(execute_bulk_insert.call_count, 0)
+        self.assertEqual(execute_insert.call_count, 1)
+        self.assertIsNotNone(tournament.pk)
+
+    async def test_max_batch_size(self):
+        bulk_patch, single_patch = self.count_inserts()
+        with patch.object(insert_coalescer, "max_batch_size", 2):
+            with bulk_patch as execute_bulk_insert, single_patch as execute_insert:
+                await asyncio.gather(*(Tournament.create(name=str(i)) for i in range(5)))
+        self.assertEqual(execute_bulk_insert.call_count, 2)
+        self.assertEqual(execute_insert.call_count, 1)
+        self.assertEqual(await Tournament.all().count(), 5)
+
+    async def test_max_batch_size_statements(self):
+        self.skip_without_bulk_insert_returning()
+        with patch.object(
+            insert_coalescer, "max_batch_size", 2
+        ), self.count_statements() as statements:
+            await asyncio.gather(*(Tournament.create(name=str(i)) for i in range(5)))
+        self.assertEqual(statements(), 3)
+
+    async def test_max_delay(self):
+        async def create_later(name):
+            await asyncio.sleep(0.01)
+            return await Tournament.create(name=name)
+
+        bulk_patch, _ = self.count_inserts()
+        with patch.object(insert_coalescer, "max_delay", 0.1), bulk_patch as execute_bulk_insert:
+            await asyncio.gather(Tournament.create(name="0"), create_later("1"))
+        self.assertEqual(execute_bulk_insert.call_count, 1)
+        self.assertEqual(await Tournament.all().count(), 2)
+
+    async def test_failed_insert(self):
+        existing = await Tournament.create(name="Existing")
+        results = await asyncio.gather(
+            Tournament.create(name="0"),
+            Tournament.create(id=existing.pk, name="Duplicate"),
+            Tournament.create(id=existing.pk + 100, name="1"),
+            return_exceptions=True,
+        )
+        self.assertIsInstance(results[1], IntegrityError)
+        self.assertEqual(
+            sorted(await Tournament.all().values_list("name", flat=True)), ["0", "1", "Existing"]
+        )
+
+    async def test_disabled(self):
+        bulk_patch, _ = self.count_inserts()
+        with patch.object(insert_coalescer, "enabled", False), bulk_patch as execute_bulk_insert:
+            await asyncio.gather(*(Tournament.create(name=str(i)) for i in range(3)))
+        self.assertEqual(execute_bulk_insert.call_count, 0)
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_not_in_transaction(self):
+        bulk_patch, _ = self.count_inserts()
+        with bulk_patch as execute_bulk_insert:
+            async with in_transaction() as connection:
+                await asyncio.gather(
+                    *(Tournament.create(name=str(i), using_db=connection) for i in range(3))
+                )
+        self.assertEqual(execute_bulk_insert.call_count, 0)
+        self.assertEqual(await Tournament.all().count(), 3)
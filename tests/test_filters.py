@@ -1,5 +1,10 @@
 from decimal import Decimal
 from enum import Enum
+from unittest.mock import patch
+
+from pypika import Table
+from pypika.dialects import PostgreSQLQuery
+from pypika.terms import Parameterizer
 
 from tests.testmodels import (
     BooleanFields,
@@ -8,6 +13,11 @@ from tests.testmodels import (
     CharPkModel,
     DecimalFields,
 )
+from tortoise.backends.base_postgres.executor import (
+    postgres_array_in,
+    postgres_array_not_in,
+)
+from tortoise.backends.sqlite.executor import SqliteExecutor
 from tortoise.contrib import test
 from tortoise.exceptions import FieldError
 from tortoise.fields.base import StrEnum
@@ -381,3 +391,51 @@ class TestCharFkFieldFilters(test.TestCase):
             await CharPkModel.all().order_by("-id").values_list("id", flat=True),
             ["2001", "17", "12"],
         )
+
+
+class TestInFilterArrays(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await CharFields.create(char="moo")
+        await CharFields.create(char="baa", char_null="baa")
+        await CharFields.create(char="oink", char_null="oink")
+
+    def test_postgres_array(self):
+        table = Table("t")
+        query = (
+            PostgreSQLQuery.from_(table)
+            .select(table.id)
+            .where(postgres_array_in(table.id, [1, 2]))
+            .where(postgres_array_not_in(table.name, ["a"]))
+        )
+        parameterizer = Parameterizer()
+        self.assertEqual(
+            query.get_sql(parameterizer=parameterizer),
+            'SELECT "id" FROM "t" WHERE "id"=ANY($1) AND ("name"<>ALL($2) OR "name" IS NULL)',
+        )
+        self.assertEqual(parameterizer.values, [[1, 2], ["a"]])
+        self.assertEqual(
+            query.get_sql(),
+            'SELECT "id" FROM "t" WHERE "id"=ANY(ARRAY[1,2]) '
+            'AND ("name"<>ALL(ARRAY[\'a\']) OR "name" IS NULL)',
+        )
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_json_array(self):
+        with patch.object(SqliteExecutor, "IN_JSON_THRESHOLD", 2):
+            query = CharFields.filter(char__in=["moo", "baa"]).values_list("char", flat=True)
+            self.assertIn("json_each", query.sql())
+            self.assertEqual(
+                query.sql(),
+                CharFields.filter(char__in=["a", "b", "c"]).values_list("char", flat=True).sql(),
+            )
+            self.assertEqual(sorted(await query), ["baa", "moo"])
+            self.assertEqual(
+                await CharFields.filter(char_null__not_in=["baa", "oink"]).values_list(
+                    "char", flat=True
+                ),
+                ["moo"],
+            )
+            self.assertNotIn(
+                "json_each", CharFields.filter(char__in=["moo"]).values_list("char").sql()
+            )
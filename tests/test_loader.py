@@ -0,0 +1,104 @@
+import asyncio
+from unittest.mock import patch
+
+from tests.testmodels import Event, Tournament
+from tortoise.contrib import test
+from tortoise.exceptions import DoesNotExist
+from tortoise.loader import pk_loader
+
+
+class TestPkLoader(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        self.db = Tournament._meta.db
+        self.enable = patch.object(Tournament._meta, "batch_pk_lookups", True)
+        self.enable.start()
+
+    async def asyncTearDown(self) -> None:
+        self.enable.stop()
+        await super().asyncTearDown()
+
+    def count_queries(self):
+        return patch.object(self.db, "execute_query", wraps=self.db.execute_query)
+
+    async def test_concurrent_gets(self):
+        pks = [t.pk for t in self.tournaments]
+        with self.count_queries() as execute_query:
+            tournaments = await asyncio.gather(
+                Tournament.get(pk=pks[0]),
+                Tournament.get_or_none(id=pks[1]),
+                Tournament.filter(pk=pks[2]).first(),
+                Tournament.get_or_none(pk=pks[2] + 1),
+                Tournament.get(pk=pks[0]),
+            )
+        self.assertEqual(execute_query.call_count, 1)
+        self.assertEqual([t.name if t else None for t in tournaments], ["0", "1", "2", None, "0"])
+
+    async def test_does_not_exist(self):
+        results = await asyncio.gather(
+            Tournament.get(pk=self.tournaments[0].pk),
+            Tournament.get(pk=self.tournaments[-1].pk + 1),
+            return_exceptions=True,
+        )
+        self.assertEqual(results[0], self.tournaments[0])
+        self.assertIsInstance(results[1], DoesNotExist)
+
+    async def test_single_get(self):
+        with self.count_queries() as execute_query:
+            tournament = await Tournament.get(pk=self.tournaments[1].pk)
+        self.assertEqual(tournament.name, "1")
+        sql = execute_query.call_args[0][0]
+        self.assertNotIn(" IN ", sql)
+
+    async def test_fk_awaits(self):
+        events = [
+            await Event.create(name=str(i), tournament=tournament)
+            for i, tournament in enumerate(self.tournaments)
+        ]
+        events = await Event.filter(pk__in=[e.pk for e in events]).order_by("name")
+        with self.count_queries() as execute_query:
+            tournaments = await asyncio.gather(*(event.tournament for event in events))
+        self.assertEqual(execute_query.call_count, 1)
+        self.assertEqual(tournaments, self.tournaments)
+
+    async def test_in_bulk(self):
+        pks = [t.pk for t in self.tournaments]
+        with self.count_queries() as execute_query:
+            result, tournament = await asyncio.gather(
+                Tournament.in_bulk([pks[1], pks[0]]), Tournament.get(pk=pks[2])
+            )
+        self.assertEqual(execute_query.call_count, 1)
+        self.assertEqual(list(result), [pks[1], pks[0]])
+        self.assertEqual(tournament.name, "2")
+
+    async def test_not_batched(self):
+        pks = [t.pk for t in self.tournaments]
+        with self.count_queries() as execute_query:
+            await asyncio.gather(
+                Tournament.get(pk=pks[0]),
+                Tournament.get(pk=pks[1]).only("id"),
+                Tournament.get(pk=pks[2], name="2"),
+            )
+        self.assertEqual(execute_query.call_count, 3)
+
+    async def test_disabled(self):
+        pks = [t.pk for t in self.tournaments]
+        with patch.object(pk_loader, "enabled", False), self.count_queries() as execute_query:
+            tournaments = await asyncio.gather(*(Tournament.get(pk=pk) for pk in pks))
+        self.assertEqual(execute_query.call_count, 3)
+        self.assertEqual(tournaments, self.tournaments)
+
+    async def test_not_opted_in(self):
+        pks = [t.pk for t in self.tournaments]
+        with patch.object(Tournament._meta, "batch_pk_lookups", False):
+            with self.count_queries() as execute_query:
+                await asyncio.gather(*(Tournament.get(pk=pk) for pk in pks))
+        self.assertEqual(execute_query.call_count, 3)
+
+    async def test_max_batch_size(self):
+        pks = [t.pk for t in self.tournaments]
+        with patch.object(pk_loader, "max_batch_size", 2), self.count_queries() as execute_query:
+            tournaments = await asyncio.gather(*(Tournament.get(pk=pk) for pk in pks))
+        self.assertEqual(execute_query.call_count, 2)
+        self.assertEqual(tournaments, self.tournaments)
@@ -1,18 +1,28 @@
 import os
+from decimal import Decimal
+from unittest.mock import patch
 from uuid import uuid4
 
 from tests.testmodels import (
+    DatetimeFields,
+    DecimalFields,
+    DefaultUpdate,
     Dest_null,
     Event,
     IntFields,
+    JSONFields,
     Node,
     NoID,
     O2O_null,
     RequiredPKModel,
     Team,
     Tournament,
+    UniqueName,
+    UniqueTogetherFieldsWithFK,
+    UUIDFields,
     UUIDFkRelatedNullModel,
 )
+from tortoise import connections
 from tortoise.contrib import test
 from tortoise.contrib.test.condition import NotEQ
 from tortoise.exceptions import (
@@ -385,6 +395,58 @@ class TestModelMethodsNoID(TestModelMethods):
         self.assertEqual(repr(self.mdl2), "<NoID>")
 
 
+class TestModelUpsert(test.TestCase):
+    async def test_upsert(self):
+        obj, created = await UniqueName.upsert(name="Test", defaults={"optional": "1"})
+        self.assertTrue(created)
+        await UniqueName.filter(pk=obj.pk).update(other_optional="Other")
+
+        obj2, created = await UniqueName.upsert(name="Test", defaults={"optional": "2"})
+        self.assertFalse(created)
+        self.assertEqual(obj2.pk, obj.pk)
+        self.assertEqual((obj2.optional, obj2.other_optional), ("2", "Other"))
+        self.assertEqual(await UniqueName.get(pk=obj.pk).values("optional"), {"optional": "2"})
+
+        obj3, created = await UniqueName.upsert(name="Test")
+        self.assertFalse(created)
+        self.assertEqual((obj3.pk, obj3.optional), (obj.pk, "2"))
+
+    async def test_upsert_unique_together(self):
+        tournament = await Tournament.create(name="Tournament")
+        obj, created = await UniqueTogetherFieldsWithFK.upsert(text="a", tournament=tournament)
+        self.assertTrue(created)
+        obj2, created = await UniqueTogetherFieldsWithFK.upsert(
+            text="a", tournament_id=tournament.pk
+        )
+        self.assertFalse(created)
+        self.assertEqual(obj2.pk, obj.pk)
+
+    async def test_upsert_pk(self):
+        obj = await DefaultUpdate.create()
+        obj2, created = await DefaultUpdate.upsert(pk=obj.pk)
+        self.assertFalse(created)
+        self.assertEqual(obj2.created_at, obj.created_at)
+        self.assertGreater(obj2.updated_at, obj.updated_at)
+        obj3, created = await DefaultUpdate.upsert(pk=obj.pk + 1)
+        self.assertTrue(created)
+        self.assertEqual(obj3.pk, obj.pk + 1)
+
+    async def test_upsert_not_unique(self):
+        with self.assertRaises(ParamsError):
+            await Tournament.upsert(name="Test", defaults={"desc": "Desc"})
+        with self.assertRaisesRegex(ParamsError, "Conflict value with key='name':"):
+            await UniqueName.upsert(name="Test", defaults={"name": "Other"})
+
+    @test.requireCapability(support_upsert=True)
+    async def test_upsert_without_transaction(self):
+        await UniqueName.create(name="Test")
+        db = connections.get("models")
+        with patch.object(db, "_in_transaction", side_effect=AssertionError):
+            obj, created = await UniqueName.upsert(name="Test", defaults={"optional": "1"})
+        self.assertFalse(created)
+        self.assertEqual(obj.optional, "1")
+
+
 class TestModelConstructor(test.TestCase):
     def test_null_in_nonnull_field(self):
         with self.assertRaisesRegex(ValueError, "name is non nullable field, but null was passed"):
@@ -430,3 +492,51 @@ class TestModelConstructor(test.TestCase):
         self.assertIsNone(await NoneAwaitable)
         self.assertFalse(NoneAwaitable)
         self.assertIsNone(await NoneAwaitable)
+
+
+class TestModelInitFromDb(test.TestCase):
+    async def _assert_same_as_setattr(self, model, pk):
+        db = connections.get("models")
+        _, rows = await db.execute_query(model.filter(pk=pk).sql(params_inline=True))
+        self.assertIsNotNone(model._meta.hydrator)
+        instance = model._init_from_db_row(rows[0])
+        with patch.object(model._meta, "hydrator", None):
+            expected = model._init_from_db_row(rows[0])
+        self.assertEqual(vars(instance), vars(expected))
+        self.assertFalse(instance._partial)
+        self.assertTrue(instance._saved_in_db)
+        return instance
+
+    async def test_native_and_complex_fields(self):
+        tournament = await Tournament.create(name="Tournament")
+        event = await Event.create(name="Event", tournament=tournament)
+        instance = await self._assert_same_as_setattr(Event, event.pk)
+        self.assertEqual(instance.modified, event.modified)
+        self.assertEqual(instance.tournament_id, tournament.pk)
+        await instance.save()
+
+    async def test_field_conversions(self):
+        obj = await DecimalFields.create(decimal=Decimal("1.2345"), decimal_nodec=3)
+        await self._assert_same_as_setattr(DecimalFields, obj.pk)
+        obj = await DatetimeFields.create(datetime="2024-01-02T03:04:05.123456+01:00")
+        await self._assert_same_as_setattr(DatetimeFields, obj.pk)
+        obj = await UUIDFields.create(data=uuid4())
+        await self._assert_same_as_setattr(UUIDFields, obj.pk)
+        obj = await JSONFields.create(data={"some": ["data"]})
+        await self._assert_same_as_setattr(JSONFields, obj.pk)
+
+    async def test_partial_row(self):
+        tournament = await Tournament.create(name="Tournament", desc="Desc")
+        instance = await Tournament.get(pk=tournament.pk).only("id", "name")
+        self.assertTrue(instance._partial)
+        self.assertEqual(instance.name, "Tournament")
+        self.assertFalse(hasattr(instance, "desc"))
+
+    def test_no_hydrator_with_custom_setattr(self):
+        def __setattr__(self, key, value):
+            object.__setattr__(self, key, value)
+
+        with patch.object(Tournament, "__setattr__", __setattr__):
+            self.assertIsNone(Tournament._meta._generate_hydrator())
+            self.assertIsNone(Tournament._meta._generate_hydrator("prefix."))
+        self.assertIsNotNone(Tournament._meta._generate_hydrator())
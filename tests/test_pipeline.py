@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise import Tortoise, connections
+from tortoise.contrib import test
+from tortoise.exceptions import OperationalError
+from tortoise.transactions import in_transaction
+
+
+class TestBatch(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.db = connections.get("models")
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        self.event = await Event.create(name="Event", tournament=self.tournaments[0])
+        self.team = await Team.create(name="Team")
+        await self.event.participants.add(self.team)
+
+    def count_pipelines(self):
+        return patch.object(self.db, "execute_pipeline", wraps=self.db.execute_pipeline)
+
+    async def test_results(self):
+        with self.count_pipelines() as execute_pipeline:
+            tournaments, count, names, exists, values = await Tortoise.batch(
+                Tournament.all().order_by("name"),
+                Tournament.filter(name__in=["0", "1"]).count(),
+                Tournament.all().order_by("-name").values_list("name", flat=True),
+                Event.filter(name="Other").exists(),
+                Tournament.filter(name="0").values("name"),
+            )
+        self.assertEqual(execute_pipeline.call_count, 1)
+        self.assertEqual(len(execute_pipeline.call_args[0][0]), 5)
+        self.assertEqual(tournaments, self.tournaments)
+        self.assertEqual(count, 2)
+        self.assertEqual(names, ["2", "1", "0"])
+        self.assertFalse(exists)
+        self.assertEqual(values, [{"name": "0"}])
+
+    async def test_prefetch(self):
+        with self.count_pipelines() as execute_pipeline:
+            events, tournaments = await Tortoise.batch(
+                Event.all().prefetch_related("participants"),
+                Tournament.filter(events__name="Event").prefetch_related("events"),
+            )
+        # The prefetch queries of both are executed together in a second round
+        self.assertEqual(execute_pipeline.call_count, 2)
+        self.assertEqual(list(events[0].participants), [self.team])
+        self.assertEqual(list(tournaments[0].events), [self.event])
+
+    async def test_write(self):
+        updated, count = await Tortoise.batch(
+            Tournament.filter(name="0").update(desc="Updated"),
+            Tournament.filter(desc="Updated").count(),
+        )
+        self.assertEqual((updated, count), (1, 1))
+
+    async def test_other_awaitables(self):
+        async def get_name():
+            return (await Tournament.get(name="1")).name
+
+        name, count = await Tortoise.batch(get_name(), Tournament.all().count())
+        self.assertEqual((name, count), ("1", 3))
+
+    async def test_error(self):
+        with self.assertRaises(OperationalError):
+            await Tortoise.batch(
+                Tournament.all().count(),
+                Tournament.raw("SELECT * FROM nonexistent"),
+            )
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_in_transaction(self):
+        async with in_transaction() as connection:
+            await Tournament.create(name="New", using_db=connection)
+            (count,) = await Tortoise.batch(Tournament.all().using_db(connection).cache().count())
+        self.assertEqual(count, 4)
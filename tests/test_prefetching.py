@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 from tests.testmodels import Address, Event, Team, Tournament
 from tortoise.contrib import test
-from tortoise.exceptions import FieldError, OperationalError
+from tortoise.contrib.test.condition import NotEQ
+from tortoise.exceptions import FieldError, OperationalError, UnSupportedError
 from tortoise.functions import Count
 from tortoise.query_utils import Prefetch
 
@@ -150,3 +153,159 @@ class TestPrefetching(test.TestCase):
             Prefetch("tournament", queryset=Tournament.all(), to_attr="to_attr_tournament")
         )
         self.assertEqual(event.to_attr_tournament.id, tournament.id)
+
+
+class TestPrefetchingInChunks(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.db = Tournament._meta.db
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(5)]
+        self.events = [
+            await Event.create(name=f"{tournament.name}-{i}", tournament=tournament)
+            for tournament in self.tournaments
+            for i in range(2)
+        ]
+
+    def chunked(self):
+        return patch.object(self.db.executor_class, "PREFETCH_CHUNK_SIZE", 2)
+
+    def count_queries(self):
+        return patch.object(self.db, "execute_query", wraps=self.db.execute_query)
+
+    async def test_reverse_relation(self):
+        with self.chunked(), self.count_queries() as execute_query:
+            tournaments = (
+                await Tournament.all()
+                .order_by("id")
+                .prefetch_related(Prefetch("events", queryset=Event.all().order_by("-name")))
+            )
+        # The tournaments, then 3 chunks of events
+        self.assertEqual(execute_query.call_count, 4)
+        self.assertEqual(
+            [[e.name for e in t.events] for t in tournaments],
+            [[f"{i}-1", f"{i}-0"] for i in range(5)],
+        )
+
+    async def test_direct_relation(self):
+        with self.chunked(), self.count_queries() as execute_query:
+            events = await Event.all().order_by("name").prefetch_related("tournament")
+        self.assertEqual(execute_query.call_count, 4)
+        self.assertEqual([e.tournament.name for e in events], [e.name[0] for e in events])
+
+    async def test_reverse_o2o_relation(self):
+        for event in self.events[::2]:
+            await Address.create(city=event.name, street="Street", event=event)
+        with self.chunked():
+            events = await Event.all().order_by("name").prefetch_related("address")
+        self.assertEqual(
+            [e.address.city if e.address else None for e in events],
+            [e.name if e.name.endswith("0") else None for e in events],
+        )
+
+    async def test_m2m_relation(self):
+        teams = [await Team.create(name=str(i)) for i in range(3)]
+        for event, team in zip(self.events, teams * 4):
+            await event.participants.add(team)
+        with self.chunked(), self.count_queries() as execute_query:
+            events = (
+                await Event.all()
+                .order_by("name")
+                .prefetch_related(
+                    Prefetch("participants", queryset=Team.filter(name__in=["0", "1"]))
+                )
+            )
+        self.assertEqual(execute_query.call_count, 6)
+        self.assertEqual(
+            [[t.name for t in e.participants] for e in events],
+            [[str(i % 3)] if i % 3 < 2 else [] for i in range(10)],
+        )
+
+
+class TestPrefetchingPerParent(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        self.teams = [await Team.create(name=str(i)) for i in range(4)]
+        for tournament in self.tournaments:
+            for i in range(4):
+                event = await Event.create(name=f"{tournament.name}-{i}", tournament=tournament)
+                await event.participants.add(*self.teams[: i + 1])
+
+    async def test_reverse_relation_limit(self):
+        tournaments = (
+            await Tournament.all()
+            .order_by("id")
+            .prefetch_related(Prefetch("events", queryset=Event.all().order_by("-name").limit(2)))
+        )
+        self.assertEqual(
+            [[e.name for e in t.events] for t in tournaments],
+            [[f"{i}-3", f"{i}-2"] for i in range(3)],
+        )
+
+    async def test_reverse_relation_offset(self):
+        with patch.object(Tournament._meta.db.executor_class, "PREFETCH_CHUNK_SIZE", 2):
+            tournaments = (
+                await Tournament.all()
+                .order_by("id")
+                .prefetch_related(
+                    Prefetch(
+                        "events",
+                        queryset=Event.filter(name__not_in=["1-2"])
+                        .order_by("name")
+                        .offset(1)
+                        .limit(2),
+                        to_attr="later_events",
+                    ),
+                )
+            )
+        self.assertEqual(
+            [[e.name for e in t.later_events] for t in tournaments],
+            [["0-1", "0-2"], ["1-1", "1-3"], ["2-1", "2-2"]],
+        )
+
+    async def test_reverse_relation_nested(self):
+        tournament = await Tournament.get(name="0").prefetch_related(
+            Prefetch(
+                "events",
+                queryset=Event.all()
+                .order_by("-name")
+                .limit(1)
+                .select_related("tournament")
+                .prefetch_related("participants"),
+            )
+        )
+        (event,) = tournament.events
+        self.assertEqual(event.name, "0-3")
+        self.assertEqual(event.tournament.name, "0")
+        self.assertEqual(len(event.participants), 4)
+
+    async def test_m2m_limit(self):
+        events = (
+            await Event.filter(name__startswith="0-")
+            .order_by("name")
+            .prefetch_related(
+                Prefetch(
+                    "participants", queryset=Team.filter(name__not="0").order_by("-name").limit(2)
+                )
+            )
+        )
+        self.assertEqual(
+            [[t.name for t in e.participants] for e in events],
+            [[], ["1"], ["2", "1"], ["3", "2"]],
+        )
+
+    @test.requireCapability(dialect=NotEQ("postgres"))
+    async def test_without_window_functions(self):
+        capabilities = Tournament._meta.db.capabilities
+        with patch.dict(capabilities.__dict__, {"support_window_functions": False}):
+            with self.assertRaises(UnSupportedError):
+                await Tournament.all().prefetch_related(
+                    Prefetch("events", queryset=Event.all().limit(2))
+                )
+            with self.assertRaises(UnSupportedError):
+                await Event.all().prefetch_related(
+                    Prefetch("participants", queryset=Team.all().offset(1))
+                )
+            # Without limit and offset, the related objects are fetched in one query
+            tournaments = await Tournament.all().prefetch_related("events")
+        self.assertEqual([len(t.events) for t in tournaments], [4, 4, 4])
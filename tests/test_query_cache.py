@@ -0,0 +1,208 @@
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise import connections
+from tortoise.cache import InMemoryCache, get_model_tables, get_query_tables, query_cache
+from tortoise.contrib import test
+from tortoise.exceptions import OperationalError
+from tortoise.expressions import Subquery
+from tortoise.transactions import in_transaction
+
+
+class TestInMemoryCache(test.SimpleTestCase):
+    async def test_lru(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", [{"id": 1}], None, frozenset({"t1"}))
+        await cache.set("b", [{"id": 2}], None, frozenset({"t2"}))
+        self.assertEqual(await cache.get("a"), [{"id": 1}])
+        await cache.set("c", [{"id": 3}], None, frozenset({"t1", "t2"}))
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+        await cache.invalidate(["t2"])
+        self.assertEqual(await cache.get("a"), [{"id": 1}])
+        self.assertIsNone(await cache.get("c"))
+
+    async def test_ttl(self):
+        cache = InMemoryCache()
+        await cache.set("a", [], 0, frozenset({"t1"}))
+        self.assertIsNone(await cache.get("a"))
+        self.assertEqual(len(cache), 0)
+        await cache.set("b", [], 60, frozenset({"t1"}))
+        self.assertEqual(await cache.get("b"), [])
+
+
+class TestQueryTables(test.TestCase):
+    def test_select_related(self):
+        query = Event.filter(tournament__name="Test").select_related("reporter")
+        query._make_query()
+        self.assertEqual(get_query_tables(query.query), {"event", "tournament", "re_port_er"})
+
+    def test_subquery(self):
+        query = Event.filter(
+            tournament_id__in=Subquery(Tournament.filter(name="Test").values("id"))
+        )
+        query.sql()
+        self.assertEqual(get_query_tables(query.query), {"event", "tournament"})
+
+    def test_model_tables(self):
+        self.assertEqual(get_model_tables(Team)[0], "team")
+        self.assertIn("event_team", get_model_tables(Team))
+        self.assertIn("event_team", get_model_tables(Tournament))
+
+
+class TestQueryCache(test.TruncationTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.db = connections.get("models")
+        self.tournament = await Tournament.create(name="Test")
+
+    async def _rename_behind_orm(self, name: str) -> None:
+        await self.db.execute_query("UPDATE tournament SET name=?", [name])
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_queryset(self):
+        self.assertEqual([t.name for t in await Tournament.filter(name="Test").cache()], ["Test"])
+        await self._rename_behind_orm("Renamed")
+        self.assertEqual([t.name for t in await Tournament.filter(name="Test").cache()], ["Test"])
+        self.assertEqual(await Tournament.filter(name="Test").count(), 0)
+
+        await Tournament.filter(id=self.tournament.id).update(desc="Updated")
+        self.assertEqual(await Tournament.filter(name="Test").cache(), [])
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_values_and_count(self):
+        self.assertEqual(await Tournament.all().cache().values_list("name", flat=True), ["Test"])
+        self.assertEqual(await Tournament.all().cache().values("name"), [{"name": "Test"}])
+        self.assertEqual(await Tournament.all().cache().count(), 1)
+        await self._rename_behind_orm("Renamed")
+        await self.db.execute_query("DELETE FROM tournament")
+        self.assertEqual(await Tournament.all().cache().values_list("name", flat=True), ["Test"])
+        self.assertEqual(await Tournament.all().cache().values("name"), [{"name": "Test"}])
+        self.assertEqual(await Tournament.all().cache().count(), 1)
+
+        await Tournament.create(name="New")
+        self.assertEqual(await Tournament.all().cache().values_list("name", flat=True), ["New"])
+        self.assertEqual(await Tournament.all().cache().count(), 1)
+
+    async def test_results_are_copies(self):
+        (result,) = await Tournament.all().cache().values("name")
+        result["name"] = "Changed"
+        tournament = await Tournament.get(id=self.tournament.id).cache()
+        tournament.name = "Changed"
+        self.assertEqual(await Tournament.all().cache().values("name"), [{"name": "Test"}])
+        self.assertEqual((await Tournament.get(id=self.tournament.id).cache()).name, "Test")
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_meta_policy(self):
+        with patch.object(Tournament._meta, "cache", True):
+            await Tournament.all()
+            await Tournament.all().values_list("name", flat=True)
+            await self._rename_behind_orm("Renamed")
+            self.assertEqual((await Tournament.all())[0].name, "Test")
+            self.assertEqual(await Tournament.all().values_list("name", flat=True), ["Test"])
+            self.assertEqual(
+                await Tournament.all().cache(enabled=False).values_list("name", flat=True),
+                ["Renamed"],
+            )
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_ttl(self):
+        await Tournament.all().cache(ttl=0)
+        await self._rename_behind_orm("Renamed")
+        self.assertEqual((await Tournament.all().cache(ttl=0))[0].name, "Renamed")
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_instance_writes_invalidate(self):
+        await Tournament.all().cache()
+        await self._rename_behind_orm("Renamed")
+        self.tournament.desc = "Saved"
+        await self.tournament.save()
+        self.assertEqual((await Tournament.all().cache())[0].name, "Test")
+
+        await Event.all().cache()
+        event = await Event.create(name="Event", tournament=self.tournament)
+        self.assertEqual([e.pk for e in await Event.all().cache()], [event.pk])
+
+        await self.tournament.delete()
+        self.assertEqual(await Tournament.all().cache(), [])
+        self.assertEqual(await Event.all().cache(), [])
+
+    async def test_bulk_writes_invalidate(self):
+        self.assertEqual(await Team.all().cache().count(), 0)
+        await Team.bulk_create([Team(name="A"), Team(name="B")])
+        self.assertEqual(await Team.all().cache().count(), 2)
+        teams = await Team.all()
+        for team in teams:
+            team.name = "C"
+        self.assertEqual(await Team.filter(name="C").cache().count(), 0)
+        await Team.bulk_update(teams, fields=["name"])
+        self.assertEqual(await Team.filter(name="C").cache().count(), 2)
+        await Team.filter(name="C").delete()
+        self.assertEqual(await Team.all().cache().count(), 0)
+
+    async def test_m2m_invalidate(self):
+        event = await Event.create(name="Event", tournament=self.tournament)
+        team = await Team.create(name="Team")
+        self.assertEqual(await Team.filter(events=event).cache(), [])
+        await event.participants.add(team)
+        self.assertEqual(await Team.filter(events=event).cache(), [team])
+        await event.participants.remove(team)
+        self.assertEqual(await Team.filter(events=event).cache(), [])
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_not_cached_in_transaction(self):
+        async with in_transaction():
+            await Tournament.all().cache()
+        self.assertEqual(len(query_cache.backend), 0)
+        await Tournament.all().cache()
+        self.assertEqual(len(query_cache.backend), 1)
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_failed_commit_ends_transaction(self):
+        await Tournament.all().cache()
+        with ExitStack() as stack, self.assertRaises(OperationalError):
+            async with in_transaction() as connection:
+                await Tournament.filter(id=self.tournament.id).using_db(connection).update(
+                    name="New"
+                )
+                stack.enter_context(
+                    patch.object(connection, "commit", side_effect=OperationalError)
+                )
+        self.assertEqual(query_cache._pending, {})
+        self.assertEqual(len(query_cache.backend), 0)
+
+    async def test_write_during_read_is_not_cached(self):
+        execute_query = self.db.execute_query
+
+        async def write_while_reading(sql, values=None):
+            result = await execute_query(sql, values)
+            await Tournament.create(name="Concurrent")
+            return result
+
+        with patch.object(self.db, "execute_query", write_while_reading):
+            self.assertEqual(len(await Tournament.all().cache()), 1)
+        self.assertEqual(len(await Tournament.all().cache()), 2)
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_concurrent_reader_in_transaction(self):
+        written = asyncio.Event()
+
+        async def read_during_transaction():
+            await written.wait()
+            return await Tournament.all().cache().values_list("name", flat=True)
+
+        await Tournament.all().cache().values_list("name", flat=True)
+        # Started outside of the transaction, so it reads on another connection
+        reader = asyncio.ensure_future(read_during_transaction())
+        async with in_transaction() as connection:
+            await Tournament.filter(id=self.tournament.id).using_db(connection).update(name="New")
+            # Invalidated once the transaction ends
+            self.assertEqual(len(query_cache.backend), 1)
+            written.set()
+            # SQLite only has one connection, the reader waits for the transaction there
+            await asyncio.wait([reader], timeout=0.1)
+        await reader
+        self.assertEqual(await Tournament.all().cache().values_list("name", flat=True), ["New"])
@@ -25,6 +25,7 @@ from tortoise.exceptions import (
 )
 from tortoise.expressions import F, RawSQL, Subquery
 from tortoise.functions import Avg
+from tortoise.queryset import QUERY_SHAPE_CACHE
 
 # TODO: Test the many exceptions in QuerySet
 # TODO: .filter(intnum_null=None) does not work as expected
@@ -486,6 +487,134 @@ class TestQueryset(test.TestCase):
 
         self.assertEqual(await IntFields.all().count(), counter)
 
+    async def test_iterator(self):
+        values = [obj.intnum async for obj in IntFields.all().order_by("intnum").iterator(5)]
+        self.assertEqual(values, list(range(10, 100, 3)))
+
+    async def test_iterator_break(self):
+        async for obj in IntFields.filter(intnum__gte=50).order_by("intnum").iterator(2):
+            self.assertEqual(obj.intnum, 52)
+            break
+        # The cursor must not keep the connection busy
+        self.assertEqual(await IntFields.all().count(), 30)
+
+    async def test_iterator_chunk_size(self):
+        with self.assertRaises(ParamsError):
+            async for _ in IntFields.all().iterator(chunk_size=0):
+                pass
+
+    async def test_iterator_prefetch_related(self):
+        tournament = await Tournament.create(name="Tournament")
+        for i in range(5):
+            await Event.create(name=f"Event {i}", tournament=tournament)
+
+        events = [e async for e in Event.all().prefetch_related("tournament").iterator(2)]
+        self.assertEqual([e.name for e in events], [f"Event {i}" for i in range(5)])
+        self.assertEqual({e.tournament.name for e in events}, {"Tournament"})
+
+        tournaments = [t async for t in Tournament.all().prefetch_related("events").iterator()]
+        self.assertEqual(len(tournaments[0].events), 5)
+
+    async def test_iterator_select_related(self):
+        tournament = await Tournament.create(name="Tournament")
+        await Event.create(name="Event", tournament=tournament)
+
+        events = [e async for e in Event.all().select_related("tournament").iterator()]
+        self.assertEqual(events[0].tournament.name, "Tournament")
+
+    async def test_query_shape_cache(self):
+        QUERY_SHAPE_CACHE.clear()
+        for obj in self.intfields[:5]:
+            fetched = await IntFields.filter(id=obj.id, intnum__gte=obj.intnum).limit(5)
+            self.assertEqual(fetched, [obj])
+        self.assertEqual(len(QUERY_SHAPE_CACHE), 1)
+        self.assertIsNotNone(next(iter(QUERY_SHAPE_CACHE.values())))
+
+        self.assertEqual(await IntFields.get(intnum=13), self.intfields[1])
+        self.assertEqual(await IntFields.get(intnum=16), self.intfields[2])
+        self.assertEqual(len(QUERY_SHAPE_CACHE), 2)
+        self.assertEqual(await IntFields.filter(intnum=None).count(), 0)
+        self.assertEqual(await IntFields.filter(intnum_null=None).count(), 30)
+
+    async def test_query_shape_cache_not_cached(self):
+        QUERY_SHAPE_CACHE.clear()
+        # Equal values don't tell the order of the parameters
+        self.assertEqual(await IntFields.filter(intnum=10, intnum_null=10), [])
+        self.assertEqual(QUERY_SHAPE_CACHE, {})
+        # The value is wrapped by the filter, so the SQL is never reused
+        tournament = await Tournament.create(name="Tournament")
+        for _ in range(2):
+            self.assertEqual(await Tournament.filter(name__contains="urnam"), [tournament])
+        self.assertEqual(len(await IntFields.filter(intnum__in=[10, 13])), 2)
+        self.assertEqual(list(QUERY_SHAPE_CACHE.values()), [None, None])
+        # Annotations are never cached
+        self.assertEqual(len(await IntFields.filter(id__gt=0).annotate(avg=Avg("intnum"))), 1)
+        self.assertEqual(len(QUERY_SHAPE_CACHE), 2)
+
+    async def test_query_shape_cache_select_related(self):
+        QUERY_SHAPE_CACHE.clear()
+        for name in ("Tournament1", "Tournament2"):
+            tournament = await Tournament.create(name=name)
+            await Event.create(name=f"Event of {name}", tournament=tournament)
+            event = await Event.get(tournament=tournament).select_related("tournament")
+            self.assertEqual(event.tournament.name, name)
+            self.assertEqual(event.name, f"Event of {name}")
+
+    async def _get_all_pages(self, queryset, size):
+        pages = [await queryset.page_after(size=size)]
+        while pages[-1].has_next:
+            pages.append(await queryset.page_after(pages[-1].next_cursor, size=size))
+        return pages
+
+    async def test_page_after(self):
+        await IntFields.create(intnum=13)
+        await IntFields.create(intnum=13)
+        pages = await self._get_all_pages(IntFields.all().order_by("-intnum"), size=7)
+        self.assertEqual([len(page) for page in pages], [7, 7, 7, 7, 4])
+        self.assertIsNone(pages[-1].next_cursor)
+        self.assertEqual(
+            [obj.id for page in pages for obj in page],
+            await IntFields.all().order_by("-intnum", "-id").values_list("id", flat=True),
+        )
+
+    async def test_page_after_mixed_directions(self):
+        await IntFields.create(intnum=13)
+        queryset = IntFields.filter(intnum__lt=50).order_by("intnum", "-id")
+        pages = await self._get_all_pages(queryset, size=4)
+        self.assertEqual(
+            [obj.id for page in pages for obj in page],
+            await queryset.values_list("id", flat=True),
+        )
+
+    async def test_page_after_default_ordering(self):
+        # Tournament has no default ordering, so it is paged by pk
+        for i in range(5):
+            await Tournament.create(name=f"Tournament {i}")
+        pages = await self._get_all_pages(Tournament.all(), size=2)
+        self.assertEqual(
+            [obj.name for page in pages for obj in page], [f"Tournament {i}" for i in range(5)]
+        )
+        pages = await self._get_all_pages(Tournament.all().order_by("-created"), size=2)
+        self.assertEqual(
+            [obj.name for page in pages for obj in page],
+            [f"Tournament {i}" for i in reversed(range(5))],
+        )
+
+    async def test_page_after_errors(self):
+        page = await IntFields.all().order_by("intnum").page_after(size=5)
+        with self.assertRaisesRegex(ParamsError, "doesn't match"):
+            await IntFields.all().order_by("-intnum").page_after(page.next_cursor)
+        with self.assertRaisesRegex(ParamsError, "Invalid cursor"):
+            await IntFields.all().order_by("intnum").page_after("not a cursor")
+        with self.assertRaisesRegex(ParamsError, "limit or offset"):
+            await IntFields.all().order_by("intnum").limit(5).page_after()
+        with self.assertRaisesRegex(ParamsError, "positive"):
+            await IntFields.all().page_after(size=0)
+        with self.assertRaisesRegex(FieldError, "nullable"):
+            await IntFields.all().order_by("intnum_null").page_after()
+        with self.assertRaisesRegex(FieldError, "fields of Event"):
+            await Event.all().order_by("tournament__name").page_after()
+
     async def test_update_basic(self):
         obj0 = await IntFields.create(intnum=2147483647)
         await IntFields.filter(id=obj0.id).update(intnum=2147483646)
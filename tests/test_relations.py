@@ -335,6 +335,24 @@ class TestRelations(test.TestCase):
         self.assertEqual(retrieved_root.left, left_1st_lvl)
         self.assertEqual(retrieved_root.left.left, left_2nd_lvl)
 
+    async def test_select_related_many_rows(self) -> None:
+        tournament = await Tournament.create(name="Tournament")
+        reporter = await Reporter.create(name="Reporter")
+        await Event.create(name="1", tournament=tournament, reporter=reporter)
+        await Event.create(name="2", tournament=tournament)
+        await Event.create(name="3", tournament=tournament, reporter=reporter)
+
+        events = (
+            await Event.all()
+            .select_related("tournament", "reporter", "tournament")
+            .order_by("name")
+        )
+        self.assertEqual([event.name for event in events], ["1", "2", "3"])
+        self.assertEqual([event.tournament for event in events], [tournament] * 3)
+        self.assertEqual([event.reporter for event in events], [reporter, None, reporter])
+        self.assertEqual(events[0].tournament.name, "Tournament")
+        self.assertIsNot(events[0].tournament, events[2].tournament)
+
     async def test_no_ambiguous_fk_relations_set(self):
         """Basic select_related test cases provided by @https://github.com/Terrance.
 
@@ -0,0 +1,242 @@
+import asyncio
+import random
+from unittest.mock import patch
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise import connections
+from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError, OperationalError
+from tortoise.router import _DYNAMIC, ReplicaSetRouter, router
+
+
+class Router(ReplicaSetRouter):
+    primary = "models"
+    replicas = {"replica1": 1, "replica2": 1}
+
+
+class TestReplicaSetRouter(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        db = connections.get("models")
+        connections.set("replica1", db)
+        connections.set("replica2", db)
+
+    async def asyncTearDown(self) -> None:
+        connections.discard("replica1")
+        connections.discard("replica2")
+        await super().asyncTearDown()
+
+    async def wait_for_checks(self, replica_router: ReplicaSetRouter) -> None:
+        await asyncio.gather(*replica_router._tasks)
+
+    async def test_weighted(self):
+        replica_router = Router()
+        with patch("tortoise.router.random.choices", wraps=random.choices) as choices:
+            self.assertIn(replica_router.db_for_read(Tournament), {"replica1", "replica2"})
+        self.assertEqual(choices.call_args[0][1], [1, 1])
+        self.assertEqual(replica_router.db_for_write(Tournament), "models")
+        await self.wait_for_checks(replica_router)
+
+    async def test_least_outstanding(self):
+        class LeastOutstandingRouter(Router):
+            replicas = {"replica1": 4, "replica2": 1}
+            strategy = "least_outstanding"
+
+        replica_router = LeastOutstandingRouter()
+        in_use = {"replica1": 3, "replica2": 1}
+        with patch.object(replica_router, "_in_use", side_effect=in_use.__getitem__):
+            self.assertEqual(replica_router.db_for_read(Tournament), "replica1")
+            in_use["replica1"] = 5
+            self.assertEqual(replica_router.db_for_read(Tournament), "replica2")
+        await self.wait_for_checks(replica_router)
+
+    async def test_unhealthy_replica(self):
+        replica_router = Router()
+        check_replica = replica_router.check_replica
+
+        async def fail_replica1(name):
+            if name == "replica1":
+                raise OperationalError("Connection refused")
+            return await check_replica(name)
+
+        with patch.object(replica_router, "check_replica", side_effect=fail_replica1):
+            replica_router.db_for_read(Tournament)
+            await self.wait_for_checks(replica_router)
+        self.assertEqual(replica_router.healthy_replicas(), ["replica2"])
+        self.assertEqual({replica_router.db_for_read(Tournament) for _ in range(10)}, {"replica2"})
+
+        # Healthy again after the next check
+        with patch.object(replica_router, "health_check_interval", 0):
+            replica_router.db_for_read(Tournament)
+            await self.wait_for_checks(replica_router)
+        self.assertEqual(replica_router.healthy_replicas(), ["replica1", "replica2"])
+
+    async def test_no_healthy_replica(self):
+        replica_router = Router()
+        with patch.object(replica_router, "check_replica", side_effect=asyncio.TimeoutError):
+            replica_router.db_for_read(Tournament)
+            await self.wait_for_checks(replica_router)
+        self.assertEqual(replica_router.db_for_read(Tournament), "models")
+
+    async def test_lag(self):
+        class LagRouter(Router):
+            lag_query = "SELECT 20"
+            max_lag = 10
+
+        replica_router = LagRouter()
+        self.assertEqual(await replica_router.replication_lag("replica1"), 20.0)
+        self.assertFalse(await replica_router.check_replica("replica1"))
+        replica_router.max_lag = 30
+        self.assertTrue(await replica_router.check_replica("replica1"))
+        self.assertIsNone(await Router().replication_lag("replica1"))
+
+    async def test_query_routing(self):
+        routers, routes = router._routers, router._routes
+        router.init_routers([Router])
+        try:
+            self.assertIs(Tournament.all()._choose_db(), connections.get("replica1"))
+            self.assertIs(Tournament._choose_db(True), connections.get("models"))
+            await Tournament.create(name="Test")
+            self.assertEqual(await Tournament.all().count(), 1)
+        finally:
+            await self.wait_for_checks(router._routers[0])
+            router._routers, router._routes = routers, routes
+
+    def test_configuration_errors(self):
+        class NoReplicas(ReplicaSetRouter):
+            pass
+
+        class UnknownStrategy(Router):
+            strategy = "round_robin"
+
+        class ZeroWeight(Router):
+            replicas = {"replica1": 0}
+
+        for router_class in (NoReplicas, UnknownStrategy, ZeroWeight):
+            with self.assertRaises(ConfigurationError):
+                router_class()
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model):
+        return "replica1"
+
+    def db_for_write(self, model):
+        return "models"
+
+
+class TestReadYourWrites(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        connections.set("replica1", connections.get("models"))
+        self.routers = router._routers, router._routes
+        router.init_routers([PrimaryReplicaRouter])
+        self.enable = patch.object(router, "read_your_writes", True)
+        self.enable.start()
+
+    async def asyncTearDown(self) -> None:
+        self.enable.stop()
+        router._routers, router._routes = self.routers
+        connections.discard("replica1")
+        await super().asyncTearDown()
+
+    def routed_to(self) -> str:
+        """
+        Returns the connection name a read of Tournament is routed to.
+        """
+        with patch.object(router, "_db_route", wraps=router._db_route) as db_route:
+            Tournament.all()._choose_db()
+        action = db_route.call_args[0][1]
+        return router._router_func(Tournament, action)
+
+    async def test_reads_after_write(self):
+        with router.sticky_scope():
+            self.assertEqual(self.routed_to(), "replica1")
+            await Tournament.create(name="Test")
+            self.assertEqual(self.routed_to(), "models")
+            self.assertEqual(len(await Tournament.all()), 1)
+        self.assertEqual(self.routed_to(), "replica1")
+
+    async def test_writes_of_child_tasks(self):
+        with router.sticky_scope():
+            await asyncio.gather(Tournament.create(name="Test"))
+            self.assertEqual(self.routed_to(), "models")
+
+    async def test_without_scope(self):
+        async def write_then_read():
+            self.assertEqual(self.routed_to(), "replica1")
+            await Tournament.filter(name="Test").update(desc="Updated")
+            return self.routed_to()
+
+        self.assertEqual(await asyncio.create_task(write_then_read()), "models")
+        # The writes of a task don't affect the other tasks
+        self.assertEqual(self.routed_to(), "replica1")
+
+    async def test_sticky_time(self):
+        with router.sticky_scope(), patch.object(router, "sticky_time", 0.05):
+            await Tournament.create(name="Test")
+            self.assertEqual(self.routed_to(), "models")
+            await asyncio.sleep(0.06)
+            self.assertEqual(self.routed_to(), "replica1")
+
+    async def test_disabled(self):
+        with router.sticky_scope(), patch.object(router, "read_your_writes", False):
+            await Tournament.create(name="Test")
+            self.assertEqual(self.routed_to(), "replica1")
+
+
+class StaticRouter:
+    static_routing = True
+    calls = 0
+
+    def db_for_read(self, model):
+        StaticRouter.calls += 1
+        return "replica1" if model is Tournament else None
+
+
+class TestRoutingTable(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        connections.set("replica1", connections.get("models"))
+        self.routers = router._routers, router._routes
+        StaticRouter.calls = 0
+
+    async def asyncTearDown(self) -> None:
+        router._routers, router._routes = self.routers
+        connections.discard("replica1")
+        await super().asyncTearDown()
+
+    async def test_static_routes(self):
+        router.init_routers([StaticRouter], [Tournament, Event])
+        self.assertEqual(StaticRouter.calls, 2)
+        self.assertEqual(router._routes[(Tournament, "db_for_read")], "replica1")
+        self.assertIsNone(router._routes[(Event, "db_for_read")])
+        self.assertIsNone(router._routes[(Tournament, "db_for_write")])
+
+        with patch.object(connections, "get", wraps=connections.get) as get:
+            self.assertIs(router.db_for_read(Tournament), connections.get("replica1"))
+            self.assertIsNone(router.db_for_read(Event))
+            self.assertIsNone(router.db_for_write(Tournament))
+        self.assertEqual(StaticRouter.calls, 2)
+        self.assertEqual(get.call_count, 2)
+
+        # Models not routed at init are compiled when first routed
+        self.assertIsNone(router.db_for_read(Team))
+        self.assertEqual(StaticRouter.calls, 3)
+        self.assertIn((Team, "db_for_read"), router._routes)
+
+    async def test_dynamic_router_first(self):
+        router.init_routers([PrimaryReplicaRouter, StaticRouter], [Tournament])
+        self.assertEqual(StaticRouter.calls, 0)
+        with patch.object(PrimaryReplicaRouter, "db_for_read", return_value=None) as db_for_read:
+            self.assertIs(router.db_for_read(Tournament), connections.get("replica1"))
+            self.assertIs(router.db_for_read(Tournament), connections.get("replica1"))
+        self.assertEqual(db_for_read.call_count, 2)
+        self.assertEqual(StaticRouter.calls, 2)
+
+    async def test_dynamic_router_last(self):
+        router.init_routers([StaticRouter, PrimaryReplicaRouter], [Tournament, Event])
+        self.assertEqual(router._routes[(Tournament, "db_for_read")], "replica1")
+        self.assertIs(router._routes[(Event, "db_for_read")], _DYNAMIC)
+        self.assertIs(router._routes[(Tournament, "db_for_write")], _DYNAMIC)
+        self.assertIs(router.db_for_read(Event), connections.get("replica1"))
@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise import Tortoise, connections
+from tortoise.contrib import test
+from tortoise.functions import Count
+from tortoise.session import get_session
+
+
+class TestSession(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="Test")
+        self.event = await Event.create(name="Event", tournament=self.tournament)
+
+    async def test_scope(self):
+        self.assertIsNone(get_session())
+        async with Tortoise.session() as session:
+            self.assertIs(get_session(), session)
+            await Tournament.all()
+            self.assertEqual(len(session), 1)
+        self.assertIsNone(get_session())
+        self.assertEqual(len(session), 0)
+
+    async def test_same_instance(self):
+        async with Tortoise.session():
+            tournament = await Tournament.get(name="Test")
+            self.assertIs(await Tournament.filter(id=self.tournament.id).first(), tournament)
+            self.assertIs((await Tournament.all())[0], tournament)
+            self.assertIs((await Tournament.all().cache())[0], tournament)
+            event = await Event.get(pk=self.event.pk).select_related("tournament")
+            self.assertIs(event.tournament, tournament)
+            event = await Event.get(pk=self.event.pk).prefetch_related("tournament")
+            self.assertIs(event.tournament, tournament)
+        self.assertIsNot(await Tournament.get(name="Test"), tournament)
+
+    async def test_annotations_are_set(self):
+        async with Tortoise.session():
+            tournament = await Tournament.get(name="Test")
+            annotated = await Tournament.annotate(events_count=Count("events")).first()
+            self.assertIs(annotated, tournament)
+            self.assertEqual(tournament.events_count, 1)
+
+    async def test_get_by_pk_without_query(self):
+        db = connections.get("models")
+        async with Tortoise.session():
+            tournament = await Tournament.get(id=self.tournament.id)
+            event = await Event.get(pk=self.event.pk)
+            with patch.object(db, "execute_query", side_effect=AssertionError):
+                self.assertIs(await Tournament.get(pk=self.tournament.id), tournament)
+                self.assertIs(await Tournament.get_or_none(id=str(self.tournament.id)), tournament)
+                self.assertIs(await event.tournament, tournament)
+            self.assertIsNone(await Tournament.get_or_none(pk=self.tournament.id + 1))
+
+    async def test_only_not_added(self):
+        async with Tortoise.session() as session:
+            partial = await Tournament.get(name="Test").only("id", "name")
+            self.assertEqual(len(session), 0)
+            tournament = await Tournament.get(name="Test")
+            self.assertIsNot(tournament, partial)
+            self.assertIs(await Tournament.get(name="Test").only("id", "name"), tournament)
+
+    async def test_m2m_prefetch(self):
+        team = await Team.create(name="Team")
+        await self.event.participants.add(team)
+        async with Tortoise.session():
+            fetched_team = await Team.get(name="Team")
+            event = await Event.get(pk=self.event.pk).prefetch_related("participants")
+            self.assertIs(list(event.participants)[0], fetched_team)
+
+    async def test_writes_discard(self):
+        async with Tortoise.session() as session:
+            tournament = await Tournament.get(id=self.tournament.id)
+            await Tournament.filter(id=tournament.id).update(name="Updated")
+            updated = await Tournament.get(id=tournament.id)
+            self.assertIsNot(updated, tournament)
+            self.assertEqual(updated.name, "Updated")
+
+            await Event.get(pk=self.event.pk)
+            await updated.delete()
+            self.assertEqual(len(session), 0)
+            self.assertIsNone(await Tournament.get_or_none(id=tournament.id))
+
+    async def test_save_other_instance_discards(self):
+        async with Tortoise.session():
+            tournament = await Tournament.get(id=self.tournament.id)
+            tournament.name = "Saved"
+            await tournament.save()
+            self.assertIs(await Tournament.get(id=self.tournament.id), tournament)
+            self.tournament.name = "Other"
+            await self.tournament.save()
+            self.assertEqual((await Tournament.get(id=self.tournament.id)).name, "Other")
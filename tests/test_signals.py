@@ -5,6 +5,9 @@ from tortoise import BaseDBAsyncClient
 from tortoise.contrib import test
 from tortoise.signals import post_delete, post_save, pre_delete, pre_save
 
+# The arguments of the save signals, from the tests clearing it
+save_signals: list = []
+
 
 @pre_save(Signals)
 async def signal_pre_save(
@@ -26,6 +29,16 @@ async def signal_post_save(
     await Signals.filter(name="test6").update(name="test_post-save")
 
 
+@pre_save(Signals)
+async def record_pre_save(sender, instance, using_db, update_fields) -> None:
+    save_signals.append(("pre_save", update_fields))
+
+
+@post_save(Signals)
+async def record_post_save(sender, instance, created, using_db, update_fields) -> None:
+    save_signals.append(("post_save", created, update_fields))
+
+
 @pre_delete(Signals)
 async def signal_pre_delete(
     sender: "Type[Signals]", instance: Signals, using_db: "Optional[BaseDBAsyncClient]"
@@ -80,3 +93,32 @@ class TestSignals(test.TestCase):
 
         self.assertEqual(signal3.name, "test_pre-delete")
         self.assertEqual(signal4.name, "test_post-delete")
+
+    async def test_update_or_create(self):
+        save_signals.clear()
+        await Signals.update_or_create(id=self.signal_save.pk, defaults={"name": "test-update"})
+        await Signals.update_or_create(name="test-create", defaults={"name": "test-create"})
+        self.assertEqual(
+            save_signals,
+            [
+                ("pre_save", None),
+                ("post_save", False, None),
+                ("pre_save", None),
+                ("post_save", True, None),
+            ],
+        )
+
+    @test.requireCapability(support_upsert=True)
+    async def test_upsert(self):
+        save_signals.clear()
+        await Signals.upsert(id=self.signal_save.pk, defaults={"name": "test-update"})
+        await Signals.upsert(id=self.signal6.pk + 1, defaults={"name": "test-create"})
+        self.assertEqual(
+            save_signals,
+            [
+                ("pre_save", ["name"]),
+                ("post_save", False, ["name"]),
+                ("pre_save", ["name"]),
+                ("post_save", True, ["name"]),
+            ],
+        )
@@ -166,6 +166,24 @@ class TestSQL(test.TestCase):
             expected = 'UPDATE "intfields" SET "intnum"=CASE WHEN "id"=? THEN ? WHEN "id"=? THEN ? END WHERE "id" IN (?,?)'
         self.assertEqual(sql, expected)
 
+    async def test_bulk_update_many(self):
+        objs = [IntFields(id=i, intnum=i) for i in range(1, 21)]
+        sql = IntFields.bulk_update(objs, fields=["intnum"]).sql()
+
+        if self.dialect == "mysql":
+            rows = " UNION ALL ".join(["SELECT %s `_value0`,%s `_value1`"] + ["SELECT %s,%s"] * 19)
+            expected = f"UPDATE `intfields` JOIN ({rows}) `_bulk_update` ON `intfields`.`id`=`_bulk_update`.`_value0` SET `intnum`=`_bulk_update`.`_value1`"
+        elif self.dialect == "postgres":
+            if self.is_psycopg:
+                expected = 'UPDATE "intfields" SET "intnum"="_bulk_update"."_value1" FROM UNNEST(%s::INT[],%s::INT[]) "_bulk_update"("_value0","_value1") WHERE "intfields"."id"="_bulk_update"."_value0"'
+            else:
+                expected = 'UPDATE "intfields" SET "intnum"="_bulk_update"."_value1" FROM UNNEST($1::INT[],$2::INT[]) "_bulk_update"("_value0","_value1") WHERE "intfields"."id"="_bulk_update"."_value0"'
+        elif self.dialect == "sqlite":
+            expected = 'UPDATE "intfields" SET "intnum"=? WHERE "id"=?'
+        else:
+            self.skipTest("Uses the CASE statement")
+        self.assertEqual(sql, expected)
+
     async def test_bulk_create_autogenerated_pk(self):
         sql = IntFields.bulk_create(
             [IntFields(intnum=1, intnum_null=2), IntFields(intnum=3, intnum_null=4)]
@@ -44,6 +44,23 @@ class TestUpdate(test.TestCase):
         self.assertEqual((await Tournament.get(pk=objs[0].pk)).name, "0")
         self.assertEqual((await Tournament.get(pk=objs[1].pk)).name, "1")
 
+    async def test_bulk_update_many(self):
+        await Tournament.bulk_create([Tournament(name=str(i)) for i in range(25)])
+        objs = await Tournament.all().order_by("id")
+        for obj in objs:
+            obj.name = f"{obj.name}!"
+            obj.desc = obj.name
+        rows_affected = await Tournament.bulk_update(objs, fields=["name", "desc"])
+        self.assertEqual(rows_affected, 25)
+        rows_affected = await Tournament.filter(name__not="0!").bulk_update(
+            objs, fields=["name"], batch_size=20
+        )
+        self.assertEqual(rows_affected, 24)
+        self.assertEqual(
+            await Tournament.all().order_by("id").values_list("name", "desc"),
+            [(f"{i}!", f"{i}!") for i in range(25)],
+        )
+
     async def test_bulk_update_datetime(self):
         objs = [
             await DatetimeFields.create(datetime=datetime(2021, 1, 1, tzinfo=pytz.utc)),
@@ -1,12 +1,23 @@
+import array
+from datetime import timezone
+from unittest.mock import patch
+
 from pypika import CustomFunction
 
-from tests.testmodels import Event, Team, Tournament
+from tests.testmodels import BooleanFields, Event, FloatFields, Team, Tournament
 from tortoise.contrib import test
 from tortoise.contrib.test.condition import In, NotEQ
 from tortoise.exceptions import FieldError
 from tortoise.expressions import Function
 from tortoise.functions import Length, Trim
 
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: nocoverage
+    HAS_NUMPY = False
+
 
 class TestValues(test.TestCase):
     async def test_values_related_fk(self):
@@ -214,3 +225,63 @@ class TestValues(test.TestCase):
             sql,
             'SELECT DATE_FORMAT("created",?) "date" FROM "tournament"',
         )
+
+
+class TestValuesListAsColumns(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        await FloatFields.create(id=1, floatnum=1.5, floatnum_null=None)
+        await FloatFields.create(id=2, floatnum=2.5, floatnum_null=0.5)
+
+    @test.skipIf(not HAS_NUMPY, "numpy is not installed")
+    async def test_to_arrays(self):
+        columns = await FloatFields.all().order_by("id").values_list().to_arrays()
+        self.assertEqual(list(columns), ["id", "floatnum", "floatnum_null"])
+        self.assertEqual(columns["id"].dtype, numpy.int64)
+        self.assertEqual(columns["id"].tolist(), [1, 2])
+        self.assertEqual(columns["floatnum"].dtype, numpy.float64)
+        self.assertEqual(columns["floatnum"].tolist(), [1.5, 2.5])
+        # Columns with NULLs keep the python values
+        self.assertEqual(columns["floatnum_null"].dtype, object)
+        self.assertEqual(columns["floatnum_null"].tolist(), [None, 0.5])
+
+    @test.skipIf(not HAS_NUMPY, "numpy is not installed")
+    async def test_as_columns(self):
+        await BooleanFields.create(id=1, boolean=True)
+        await BooleanFields.create(id=2, boolean=False)
+        columns = await BooleanFields.all().order_by("id").values_list("boolean", as_columns=True)
+        self.assertEqual(columns["boolean"].dtype, numpy.bool_)
+        self.assertEqual(columns["boolean"].tolist(), [True, False])
+
+    @test.skipIf(not HAS_NUMPY, "numpy is not installed")
+    async def test_to_arrays_datetime(self):
+        tournament = await Tournament.create(name="Tournament")
+        event = await Event.create(name="Event", tournament=tournament)
+        columns = await Event.all().values_list("modified", "name", "tournament__name").to_arrays()
+        self.assertEqual(columns["modified"].dtype, numpy.dtype("datetime64[us]"))
+        modified = event.modified
+        if modified.tzinfo is not None:
+            modified = modified.astimezone(timezone.utc).replace(tzinfo=None)
+        self.assertEqual(columns["modified"][0], numpy.datetime64(modified, "us"))
+        self.assertEqual(columns["name"].tolist(), ["Event"])
+        self.assertEqual(columns["tournament__name"].tolist(), ["Tournament"])
+
+    async def test_to_arrays_without_numpy(self):
+        with patch("tortoise.queryset.numpy", None):
+            columns = await FloatFields.all().order_by("id").values_list().to_arrays()
+        self.assertEqual(columns["id"], array.array("q", [1, 2]))
+        self.assertEqual(columns["floatnum"], array.array("d", [1.5, 2.5]))
+        self.assertEqual(columns["floatnum_null"], [None, 0.5])
+
+    @test.skipIf(not HAS_NUMPY, "numpy is not installed")
+    async def test_to_arrays_empty(self):
+        columns = await FloatFields.filter(id=3).values_list("id").to_arrays()
+        self.assertEqual(columns["id"].tolist(), [])
+
+    async def test_as_columns_invalid(self):
+        with self.assertRaises(TypeError):
+            FloatFields.all().values_list("id", flat=True, as_columns=True)
+        with self.assertRaises(TypeError):
+            FloatFields.first().values_list("id", as_columns=True)
+        with self.assertRaises(TypeError):
+            await FloatFields.all().values_list("id", flat=True).to_arrays()
@@ -9,12 +9,13 @@ import warnings
 from copy import deepcopy
 from inspect import isclass
 from types import ModuleType
-from typing import Any, Callable, Coroutine, Iterable, Type, cast
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, Type, cast
 
 from pypika import Query, Table
 
 from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.backends.base.config_generator import expand_db_url, generate_config
+from tortoise.cache import query_cache
 from tortoise.connection import connections
 from tortoise.exceptions import ConfigurationError
 from tortoise.fields.relational import (
@@ -27,6 +28,9 @@ from tortoise.fields.relational import (
 from tortoise.filters import get_m2m_filters
 from tortoise.log import logger
 from tortoise.models import Model, ModelMeta
+from tortoise.pipeline import QueryPipeline
+from tortoise.queryset import QUERY_SHAPE_CACHE
+from tortoise.session import Session
 from tortoise.utils import generate_schema_for_client
 
 
@@ -48,6 +52,42 @@ class Tortoise:
         """
         return connections.get(connection_name)
 
+    @classmethod
+    def session(cls) -> Session:
+        """
+        Returns a new identity map session, to be used as ``async with Tortoise.session():``.
+
+        Within it, each row fetched resolves to a single model instance, and
+        ``Model.get(pk=...)`` and foreign key fetches of instances already fetched don't
+        query the database. See :class:`tortoise.session.Session`.
+        """
+        return Session()
+
+    @classmethod
+    async def batch(cls, *queries: Awaitable[Any]) -> list[Any]:
+        """
+        Runs independent queries together, and returns their results in order.
+
+        .. code-block:: python3
+
+            events, count, names = await Tortoise.batch(
+                Event.filter(tournament=tournament).prefetch_related("participants"),
+                Team.all().count(),
+                Tournament.all().values("id", "name"),
+            )
+
+        The statements of the queries for the same connection are sent to the database
+        together instead of each on a connection of its own: in a single round trip with
+        the pipeline mode of psycopg, one after the other on other drivers. The results are
+        then processed like the ones of the queries awaited on their own, and the statements
+        of later steps, e.g. prefetching, are batched together again.
+
+        Other awaitables can be passed as well, they are just awaited concurrently.
+
+        :raises: The first exception raised by a query, once all of them are done.
+        """
+        return await QueryPipeline().run(*queries)
+
     @classmethod
     def describe_model(
         cls, model: Type["Model"], serializable: bool = True
@@ -375,6 +415,7 @@ class Tortoise:
 
     @classmethod
     def _build_initial_querysets(cls) -> None:
+        QUERY_SHAPE_CACHE.clear()
         for app in cls.apps.values():
             for model in app.values():
                 model._meta.finalise_model()
@@ -521,6 +562,7 @@ class Tortoise:
         await connections._init(connections_config, _create_db)
         cls._init_apps(apps_config)
         cls._init_routers(routers)
+        await query_cache.clear()
 
         cls._inited = True
 
@@ -541,7 +583,9 @@ class Tortoise:
                 router_cls.append(r)
             else:
                 raise ConfigurationError("Router must be either str or type")
-        router.init_routers(router_cls)
+        router.init_routers(
+            router_cls, [model for app in cls.apps.values() for model in app.values()]
+        )
 
     @classmethod
     async def close_connections(cls) -> None:
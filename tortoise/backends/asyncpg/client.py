@@ -1,5 +1,15 @@
 import asyncio
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import asyncpg
 from asyncpg.transaction import Transaction
@@ -17,6 +27,7 @@ from tortoise.backends.base.client import (
 from tortoise.backends.base_postgres.client import (
     BasePostgresClient,
     translate_exceptions,
+    translate_exceptions_iter,
 )
 from tortoise.exceptions import (
     DBConnectionError,
@@ -69,6 +80,11 @@ class AsyncpgDBClient(BasePostgresClient):
     async def create_pool(self, **kwargs) -> asyncpg.Pool:
         return await asyncpg.create_pool(None, **kwargs)
 
+    def _get_pool_sizes(self) -> Optional[Tuple[int, int]]:
+        if not self._pool:
+            return None
+        return self._pool.get_size(), self._pool.get_idle_size()
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             await self._pool.expire_connections()
@@ -109,9 +125,20 @@ class AsyncpgDBClient(BasePostgresClient):
     async def execute_insert(self, query: str, values: list) -> Optional[asyncpg.Record]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Cache prepared statement
+            # The statement is prepared once per connection and reused from
+            # asyncpg's statement cache (see ``statement_cache_size``)
             return await connection.fetchrow(query, *values)
 
+    @translate_exceptions
+    async def execute_copy(
+        self, table: str, columns: Sequence[str], values: List[list], schema: Optional[str] = None
+    ) -> None:
+        async with self.acquire_connection() as connection:
+            self.log.debug("COPY %s (%s): %s", table, columns, values)
+            await connection.copy_records_to_table(
+                table, records=values, columns=list(columns), schema_name=schema
+            )
+
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
@@ -156,6 +183,18 @@ class AsyncpgDBClient(BasePostgresClient):
                 return list(map(dict, await connection.fetch(query, *values)))
             return list(map(dict, await connection.fetch(query)))
 
+    @translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            # Server-side cursors are only available inside a transaction
+            async with connection.transaction():
+                cursor = await connection.cursor(query, *(values or []))
+                while rows := await cursor.fetch(chunk_size):
+                    yield rows
+
 
 class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
     """A transactional connection wrapper for psycopg.
@@ -167,6 +206,8 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
         self._connection: asyncpg.Connection = connection._connection
         self._lock = asyncio.Lock()
         self.log = connection.log
+        self.instrumentation = connection.instrumentation
+        self.slow_query_threshold = connection.slow_query_threshold
         self.connection_name = connection.connection_name
         self.transaction: Optional[Transaction] = None
         self._finalized = False
@@ -187,6 +228,22 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
             # TODO: Consider using copy_records_to_table instead
             await connection.executemany(query, values)
 
+    @translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            cursor = await connection.cursor(query, *(values or []))
+        while True:
+            # The lock is only held while fetching, so the consumer can run other
+            # queries (e.g. prefetching) in this transaction between chunks.
+            async with self.acquire_connection():
+                rows = await cursor.fetch(chunk_size)
+            if not rows:
+                break
+            yield rows
+
     @translate_exceptions
     async def begin(self) -> None:
         self.transaction = self._connection.transaction()
@@ -2,8 +2,18 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import logging
+import os
+import sys
+import time
+from functools import wraps
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Dict,
     Generic,
     List,
     Optional,
@@ -19,11 +29,193 @@ from pypika import Query
 
 from tortoise.backends.base.executor import BaseExecutor
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
+from tortoise.cache import query_cache
 from tortoise.connection import connections
 from tortoise.exceptions import TransactionManagementError
-from tortoise.log import db_client_logger
+from tortoise.log import db_client_logger, slow_query_logger
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.instrumentation import Instrumentation
 
 T_conn = TypeVar("T_conn")  # Instance of client connection, such as: asyncpg.Connection()
+T = TypeVar("T")
+FuncType = Callable[..., Coroutine[None, None, T]]
+IterFuncType = Callable[..., AsyncGenerator[T, None]]
+
+
+_TORTOISE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _count_rows(result: Any) -> int:
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], Sequence):
+        # execute_query() returns (rows affected, rows)
+        return len(result[1])
+    if isinstance(result, list):
+        return len(result)
+    return 0
+
+
+def _get_query_origin() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Finds the query or model method a query is executed for, and the code outside of
+    Tortoise it is called from, by walking the (coroutine) stack.
+    Only done for slow queries, so the cost doesn't matter.
+    """
+    origin = caller = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if not code.co_filename.startswith(_TORTOISE_DIR):
+            caller = f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+            break
+        obj = frame.f_locals.get("self", frame.f_locals.get("cls"))
+        if obj is not None:
+            if hasattr(obj, "_meta"):
+                # Model instance or class
+                model = obj if isinstance(obj, type) else type(obj)
+                origin = f"{model.__name__}.{code.co_name}"
+            elif (model := getattr(obj, "model", None)) is not None and not isinstance(
+                getattr(obj, "db", None), BaseDBAsyncClient
+            ):
+                # Query, but not executor
+                origin = f"{type(obj).__name__}({getattr(model, '__name__', model)})"
+        frame = frame.f_back
+    return origin, caller
+
+
+def _log_slow_query(
+    client: "BaseDBAsyncClient",
+    query: str,
+    args: tuple,
+    duration: float,
+    rows: int,
+    exc: Optional[BaseException] = None,
+) -> None:
+    if not slow_query_logger.isEnabledFor(logging.WARNING):
+        return
+    values = args[1] if len(args) > 1 else None
+    params = len(values) if isinstance(values, (list, tuple)) else 0
+    origin, caller = _get_query_origin()
+    slow_query_logger.warning(
+        "Slow query on %s (%.3fs, %d rows, %d params%s) from %s at %s: %s",
+        client.connection_name,
+        duration,
+        rows,
+        params,
+        f", failed: {exc!r}" if exc is not None else "",
+        origin,
+        caller,
+        query,
+        extra={
+            "connection_name": client.connection_name,
+            "sql": query,
+            "params": params,
+            "duration": duration,
+            "rows": rows,
+            "origin": origin,
+            "caller": caller,
+            "error": exc,
+        },
+    )
+
+
+def instrumented(func: FuncType) -> FuncType:
+    """
+    Reports the executions of a query method of a client to its
+    :attr:`~BaseDBAsyncClient.instrumentation`, if it has one, and logs them to the
+    ``tortoise.slow_query`` logger if they take longer than its
+    :attr:`~BaseDBAsyncClient.slow_query_threshold`.
+    """
+
+    @wraps(func)
+    async def instrumented_(self: "BaseDBAsyncClient", *args, **kwargs) -> T:
+        instrumentation = self.instrumentation
+        threshold = self.slow_query_threshold
+        if (
+            (instrumentation is None and threshold is None)
+            or not args
+            or not isinstance(args[0], str)
+        ):
+            return await func(self, *args, **kwargs)
+        query = args[0]
+        start = time.perf_counter()
+        try:
+            result = await func(self, *args, **kwargs)
+        except Exception as exc:
+            duration = time.perf_counter() - start
+            if instrumentation is not None:
+                instrumentation.on_query_error(self.connection_name, query, duration, exc)
+            if threshold is not None and duration >= threshold:
+                _log_slow_query(self, query, args, duration, 0, exc)
+            raise
+        duration = time.perf_counter() - start
+        rows = _count_rows(result)
+        if instrumentation is not None:
+            instrumentation.on_query(self.connection_name, query, duration, rows)
+        if threshold is not None and duration >= threshold:
+            _log_slow_query(self, query, args, duration, rows)
+        return result
+
+    return instrumented_
+
+
+def instrumented_iter(func: IterFuncType) -> IterFuncType:
+    """
+    Like :func:`instrumented`, for the query methods of a client yielding the rows in chunks.
+    The query is reported once iterated over or closed, with the time spent fetching
+    the chunks, not counting the time the caller spends between them.
+    """
+
+    @wraps(func)
+    async def instrumented_iter_(
+        self: "BaseDBAsyncClient", *args, **kwargs
+    ) -> AsyncGenerator[T, None]:
+        instrumentation = self.instrumentation
+        threshold = self.slow_query_threshold
+        iterator = func(self, *args, **kwargs)
+        if (
+            (instrumentation is None and threshold is None)
+            or not args
+            or not isinstance(args[0], str)
+        ):
+            try:
+                async for item in iterator:
+                    yield item
+            finally:
+                await iterator.aclose()
+            return
+        query = args[0]
+        duration = 0.0
+        rows = 0
+        error: Optional[Exception] = None
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    duration += time.perf_counter() - start
+                rows += len(item)
+                yield item
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            await iterator.aclose()
+            if error is not None:
+                if instrumentation is not None:
+                    instrumentation.on_query_error(self.connection_name, query, duration, error)
+                if threshold is not None and duration >= threshold:
+                    _log_slow_query(self, query, args, duration, rows, error)
+            else:
+                if instrumentation is not None:
+                    instrumentation.on_query(self.connection_name, query, duration, rows)
+                if threshold is not None and duration >= threshold:
+                    _log_slow_query(self, query, args, duration, rows)
+
+    return instrumented_iter_
 
 
 class Capabilities:
@@ -46,6 +238,9 @@ class Capabilities:
     :param support_for_update: Indicates that this DB supports SELECT ... FOR UPDATE SQL statement.
     :param support_index_hint: Support force index or use index.
     :param support_update_limit_order_by: support update/delete with limit and order by.
+    :param support_copy: Indicates that this DB supports bulk loading rows with ``COPY``.
+    :param support_row_values: Indicates that this DB supports comparing row values,
+        like ``(a, b) > (1, 2)``.
     """
 
     def __init__(
@@ -63,6 +258,14 @@ class Capabilities:
         support_index_hint: bool = False,
         # support update/delete with limit and order by
         support_update_limit_order_by: bool = True,
+        # Support COPY ... FROM STDIN for bulk inserts?
+        support_copy: bool = False,
+        # Support (a, b) > (1, 2)?
+        support_row_values: bool = False,
+        # Support inserting or updating a row in a single statement?
+        support_upsert: bool = False,
+        # Support window functions, e.g. ROW_NUMBER() OVER (...)?
+        support_window_functions: bool = True,
     ) -> None:
         super().__setattr__("_mutable", True)
 
@@ -74,6 +277,10 @@ class Capabilities:
         self.support_for_update = support_for_update
         self.support_index_hint = support_index_hint
         self.support_update_limit_order_by = support_update_limit_order_by
+        self.support_copy = support_copy
+        self.support_row_values = support_row_values
+        self.support_upsert = support_upsert
+        self.support_window_functions = support_window_functions
         super().__setattr__("_mutable", False)
 
     def __setattr__(self, attr: str, value: Any) -> None:
@@ -110,17 +317,38 @@ class BaseDBAsyncClient:
         :annotation: Capabilities
 
         Contains the connection capabilities
+
+    .. attribute:: instrumentation
+        :annotation: Optional[tortoise.instrumentation.Instrumentation]
+
+        The hooks that connection acquisitions and queries are reported to, if any.
+
+    .. attribute:: slow_query_threshold
+        :annotation: Optional[float]
+
+        Queries taking at least this many seconds are logged to the ``tortoise.slow_query``
+        logger. Set with the ``slow_query_threshold`` connection parameter.
     """
 
     query_class: Type[Query] = Query
     executor_class: Type[BaseExecutor] = BaseExecutor
     schema_generator: Type[BaseSchemaGenerator] = BaseSchemaGenerator
     capabilities: Capabilities = Capabilities("")
+    instrumentation: Optional["Instrumentation"] = None
+    slow_query_threshold: Optional[float] = None
 
-    def __init__(self, connection_name: str, fetch_inserted: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        connection_name: str,
+        fetch_inserted: bool = True,
+        slow_query_threshold: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
         self.log = db_client_logger
         self.connection_name = connection_name
         self.fetch_inserted = fetch_inserted
+        if slow_query_threshold is not None:
+            self.slow_query_threshold = float(slow_query_threshold)
 
     async def create_connection(self, with_db: bool) -> None:
         """
@@ -167,6 +395,28 @@ class BaseDBAsyncClient:
     def _in_transaction(self) -> "TransactionContext":
         raise NotImplementedError()  # pragma: nocoverage
 
+    def get_pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the current ``size``, ``idle`` and ``in_use`` connection counts of the pool.
+        Transaction wrappers return the counts of the pool of their client.
+
+        :return: The counts, or ``None`` if the client has no pool (yet).
+        """
+        client = self
+        while (parent := getattr(client, "_parent", None)) is not None:
+            client = parent
+        sizes = client._get_pool_sizes()
+        if sizes is None:
+            return None
+        size, idle = sizes
+        return {"size": size, "idle": idle, "in_use": size - idle}
+
+    def _get_pool_sizes(self) -> Optional[Tuple[int, int]]:
+        """
+        Returns the number of connections in the pool, and of the idle ones.
+        """
+        return None
+
     async def execute_insert(self, query: str, values: list) -> Any:
         """
         Executes a RAW SQL insert statement, with provided parameters.
@@ -190,6 +440,21 @@ class BaseDBAsyncClient:
         """
         raise NotImplementedError()  # pragma: nocoverage
 
+    async def execute_pipeline(
+        self, queries: Sequence[Tuple[str, Optional[list]]]
+    ) -> List[Tuple[int, Sequence[dict]]]:
+        """
+        Executes RAW SQL query statements in order, and returns the result of each like
+        :meth:`execute_query` does. Drivers that support it send all the statements to the
+        server in a single round trip, e.g. with the pipeline mode of psycopg.
+        This default implementation executes them one after the other.
+
+        If a statement fails, its exception is raised and the results of the others are lost.
+
+        :param queries: A sequence of (SQL string, positional DB parameters) tuples.
+        """
+        return [await self.execute_query(query, values) for query, values in queries]
+
     async def execute_script(self, query: str) -> None:
         """
         Executes a RAW SQL script with multiple statements, and returns nothing.
@@ -199,15 +464,30 @@ class BaseDBAsyncClient:
         """
         raise NotImplementedError()  # pragma: nocoverage
 
-    async def execute_many(self, query: str, values: List[list]) -> None:
+    async def execute_many(self, query: str, values: List[list]) -> Optional[int]:
         """
-        Executes a RAW bulk insert statement, like execute_insert, but returns no data.
+        Executes a RAW statement once per row of values, e.g. a bulk insert, and returns
+        the number of rows affected, if the driver reports it.
 
         :param query: The SQL string, pre-parametrized for the target DB dialect.
         :param values: A sequence of positional DB parameters.
         """
         raise NotImplementedError()  # pragma: nocoverage
 
+    async def execute_copy(
+        self, table: str, columns: Sequence[str], values: List[list], schema: Optional[str] = None
+    ) -> None:
+        """
+        Bulk loads rows into a table with ``COPY``, which is much faster than inserting them.
+        Only available if ``capabilities.support_copy`` is set.
+
+        :param table: The name of the table to load the rows into.
+        :param columns: The names of the columns, in the same order as the values of each row.
+        :param values: A sequence of rows, with values already converted to DB types.
+        :param schema: The schema of the table, if any.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
     async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
         """
         Executes a RAW SQL query statement, and returns the resultset as a list of dicts.
@@ -217,17 +497,36 @@ class BaseDBAsyncClient:
         """
         raise NotImplementedError()  # pragma: nocoverage
 
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        """
+        Executes a RAW SQL query statement, and yields the resultset in chunks of rows.
+
+        Drivers that support it stream the rows from the server (server-side cursors,
+        unbuffered cursors or incremental fetch), so memory usage is bounded by ``chunk_size``.
+        This default implementation fetches the whole resultset and then splits it.
+
+        :param query: The SQL string, pre-parametrized for the target DB dialect.
+        :param values: A sequence of positional DB parameters.
+        :param chunk_size: The maximum number of rows in each yielded chunk.
+        """
+        _, rows = await self.execute_query(query, values)
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i : i + chunk_size]
+
 
 class ConnectionWrapper(Generic[T_conn]):
     """Wraps the connections with a lock to facilitate safe concurrent access when using
     asyncio.gather, TaskGroup, or similar."""
 
-    __slots__ = ("connection", "lock", "client")
+    __slots__ = ("connection", "lock", "client", "_instrumentation")
 
     def __init__(self, lock: asyncio.Lock, client: Any) -> None:
         self.lock: asyncio.Lock = lock
         self.client = client
         self.connection: T_conn = client._connection
+        self._instrumentation: Optional[Instrumentation] = None
 
     async def ensure_connection(self) -> None:
         if not self.connection:
@@ -235,12 +534,25 @@ class ConnectionWrapper(Generic[T_conn]):
             self.connection = self.client._connection
 
     async def __aenter__(self) -> T_conn:
-        await self.lock.acquire()
+        instrumentation = self._instrumentation = (
+            # The connection of a transaction is reported as acquired when it begins
+            None
+            if isinstance(self.client, BaseTransactionWrapper)
+            else self.client.instrumentation
+        )
+        if instrumentation is None:
+            await self.lock.acquire()
+        else:
+            start = time.perf_counter()
+            await self.lock.acquire()
+            instrumentation.on_acquire(self.client.connection_name, time.perf_counter() - start)
         await self.ensure_connection()
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.lock.release()
+        if self._instrumentation is not None:
+            self._instrumentation.on_release(self.client.connection_name)
 
 
 class TransactionContext(Generic[T_conn]):
@@ -259,7 +571,7 @@ class TransactionContext(Generic[T_conn]):
 class TransactionContextPooled(TransactionContext):
     "A version of TransactionContext that uses a pool to acquire connections."
 
-    __slots__ = ("conn_wrapper", "connection", "connection_name", "token")
+    __slots__ = ("conn_wrapper", "connection", "connection_name", "token", "instrumentation")
 
     def __init__(self, connection: Any) -> None:
         self.connection = connection
@@ -274,22 +586,34 @@ class TransactionContextPooled(TransactionContext):
         # Set the context variable so the current task is always seeing a
         # TransactionWrapper conneciton.
         self.token = connections.set(self.connection_name, self.connection)
-        self.connection._connection = await self.connection._parent._pool.acquire()
+        self.instrumentation = self.connection.instrumentation
+        if self.instrumentation is None:
+            self.connection._connection = await self.connection._parent._pool.acquire()
+        else:
+            start = time.perf_counter()
+            self.connection._connection = await self.connection._parent._pool.acquire()
+            self.instrumentation.on_acquire(self.connection_name, time.perf_counter() - start)
         await self.connection.begin()
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         try:
-            if not self.connection._finalized:
-                if exc_type:
-                    # Can't rollback a transaction that already failed.
-                    if exc_type is not TransactionManagementError:
-                        await self.connection.rollback()
-                else:
-                    await self.connection.commit()
+            try:
+                if not self.connection._finalized:
+                    if exc_type:
+                        # Can't rollback a transaction that already failed.
+                        if exc_type is not TransactionManagementError:
+                            await self.connection.rollback()
+                    else:
+                        await self.connection.commit()
+            finally:
+                # Before the connection can be reused by another transaction
+                await query_cache.end_transaction(self.connection)
         finally:
             if self.connection._parent._pool:
                 await self.connection._parent._pool.release(self.connection._connection)
+                if self.instrumentation is not None:
+                    self.instrumentation.on_release(self.connection_name)
             connections.reset(self.token)
 
 
@@ -319,6 +643,7 @@ class PoolConnectionWrapper(Generic[T_conn]):
         self.pool = client._pool
         self.client = client
         self.connection: Optional[T_conn] = None
+        self.instrumentation: Optional[Instrumentation] = None
 
     async def ensure_connection(self) -> None:
         if not self.pool:
@@ -327,13 +652,23 @@ class PoolConnectionWrapper(Generic[T_conn]):
 
     async def __aenter__(self) -> T_conn:
         await self.ensure_connection()
-        # get first available connection. If none available, wait until one is released
-        self.connection = await self.pool.acquire()
+        self.instrumentation = self.client.instrumentation
+        if self.instrumentation is None:
+            # get first available connection. If none available, wait until one is released
+            self.connection = await self.pool.acquire()
+        else:
+            start = time.perf_counter()
+            self.connection = await self.pool.acquire()
+            self.instrumentation.on_acquire(
+                self.client.connection_name, time.perf_counter() - start
+            )
         return cast(T_conn, self.connection)
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         # release the connection back to the pool
         await self.pool.release(self.connection)
+        if self.instrumentation is not None:
+            self.instrumentation.on_release(self.client.connection_name)
 
 
 class BaseTransactionWrapper:
@@ -6,6 +6,8 @@ from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    Awaitable,
     Callable,
     Dict,
     Iterable,
@@ -20,9 +22,13 @@ from typing import (
 )
 
 from pypika import JoinType, Parameter, Table
+from pypika.analytics import RowNumber
 from pypika.queries import QueryBuilder
+from pypika.terms import Field as TermField
+from pypika.terms import Term
 
-from tortoise.exceptions import OperationalError
+from tortoise.cache import query_cache
+from tortoise.exceptions import OperationalError, UnSupportedError
 from tortoise.expressions import Expression, ResolveContext
 from tortoise.fields.base import Field
 from tortoise.fields.relational import (
@@ -31,7 +37,9 @@ from tortoise.fields.relational import (
     ManyToManyFieldInstance,
     RelationalField,
 )
+from tortoise.filters import is_in
 from tortoise.query_utils import QueryModifier
+from tortoise.session import Session, get_session
 from tortoise.utils import chunk
 
 if TYPE_CHECKING:  # pragma: nocoverage
@@ -42,8 +50,19 @@ if TYPE_CHECKING:  # pragma: nocoverage
 
 EXECUTOR_CACHE: Dict[
     Tuple[str, Optional[str], str],
-    Tuple[list, str, list, str, Dict[str, Callable], str, Dict[str, str]],
+    Tuple[
+        list,
+        str,
+        list,
+        str,
+        Dict[str, Callable],
+        str,
+        Dict[str, str],
+        Dict[Tuple[Any, ...], Tuple[str, str]],
+    ],
 ] = {}
+# How many multi-row INSERT statements are kept per model
+BULK_INSERT_CACHE_SIZE = 64
 
 
 class BaseExecutor:
@@ -51,6 +70,25 @@ class BaseExecutor:
     FILTER_FUNC_OVERRIDE: Dict[Callable, Callable] = {}
     EXPLAIN_PREFIX: str = "EXPLAIN"
     DB_NATIVE = {bytes, str, int, float, decimal.Decimal, datetime.datetime, datetime.date}
+    # Limits for multi-row INSERT ... VALUES statements used by bulk inserts.
+    # If BULK_INSERT_MAX_PARAMS is not set, the single-row INSERT is executed once per row.
+    BULK_INSERT_MAX_PARAMS: Optional[int] = None
+    BULK_INSERT_MAX_ROWS: Optional[int] = None
+    # Maximum number of keys a prefetch query filters on. Prefetches for more keys are split
+    # into chunks run concurrently. If not set, a single query is used.
+    PREFETCH_CHUNK_SIZE: Optional[int] = None
+    # From this number of objects in a batch, bulk_update() uses the set-based statements of
+    # get_bulk_update_queries() instead of a CASE expression per field.
+    # If not set, CASE expressions are always used.
+    BULK_UPDATE_MIN_ROWS: Optional[int] = None
+    # Whether a multi-row INSERT can return the generated fields of its rows, see
+    # _insert_returning(). If not, bulk inserts returning them insert one row per statement.
+    BULK_INSERT_RETURNING: bool = False
+    # Limits for the multi-row INSERT statements of bulk inserts returning the generated
+    # fields, if different from BULK_INSERT_MAX_PARAMS and BULK_INSERT_MAX_ROWS, e.g. where
+    # the other bulk inserts rely on execute_many() of the driver instead
+    BULK_INSERT_RETURNING_MAX_PARAMS: Optional[int] = None
+    BULK_INSERT_RETURNING_MAX_ROWS: Optional[int] = None
 
     def __init__(
         self,
@@ -67,6 +105,7 @@ class BaseExecutor:
         self.prefetch_map = prefetch_map or {}
         self._prefetch_queries = prefetch_queries or {}
         self.select_related_idx = select_related_idx
+        self._prefetch_queries_made = False
         key = (self.db.connection_name, self.model._meta.schema, self.model._meta.db_table)
         if key not in EXECUTOR_CACHE:
             self.regular_columns, columns = self._prepare_insert_columns()
@@ -97,6 +136,7 @@ class BaseExecutor:
                 basequery.where(table[self.model._meta.db_pk_column] == self.parameter(0)).delete()
             )
             self.update_cache: Dict[str, str] = {}
+            self.bulk_insert_cache: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
 
             EXECUTOR_CACHE[key] = (
                 self.regular_columns,
@@ -106,6 +146,7 @@ class BaseExecutor:
                 self.column_map,
                 self.delete_query,
                 self.update_cache,
+                self.bulk_insert_cache,
             )
 
         else:
@@ -117,6 +158,7 @@ class BaseExecutor:
                 self.column_map,
                 self.delete_query,
                 self.update_cache,
+                self.bulk_insert_cache,
             ) = EXECUTOR_CACHE[key]
 
     async def execute_explain(self, sql: str) -> Any:
@@ -130,35 +172,132 @@ class BaseExecutor:
         custom_fields: Optional[list] = None,
     ) -> list:
         _, raw_results = await self.db.execute_query(sql, values)
+        return await self.execute_select_rows(raw_results, custom_fields)
+
+    async def execute_select_rows(
+        self, raw_results: Sequence[Any], custom_fields: Optional[list] = None
+    ) -> list:
+        """
+        Like :meth:`execute_select`, but for rows already fetched, e.g. from the
+        query result cache.
+        """
+        instance_list = self._init_instances_from_db(raw_results, custom_fields)
+        await self._execute_prefetch_queries(instance_list)
+        return instance_list
+
+    async def execute_select_iter(
+        self,
+        sql: str,
+        values: Optional[list] = None,
+        custom_fields: Optional[list] = None,
+        chunk_size: int = 2000,
+    ) -> AsyncGenerator[list, None]:
+        """
+        Like :meth:`execute_select`, but streams the resultset from the database
+        and yields the instances in chunks of at most ``chunk_size``.
+
+        Prefetching is done for each chunk separately.
+        """
+        raw_results_iter = self.db.execute_query_iter(sql, values, chunk_size)
+        try:
+            async for raw_results in raw_results_iter:
+                instance_list = self._init_instances_from_db(raw_results, custom_fields)
+                await self._execute_prefetch_queries(instance_list)
+                yield instance_list
+        finally:
+            await raw_results_iter.aclose()
+
+    def _init_instances_from_db(
+        self, raw_results: Iterable[Any], custom_fields: Optional[list] = None
+    ) -> list:
         instance_list = []
-        for row in raw_results:
-            if self.select_related_idx:
-                _, current_idx, _, _, path = self.select_related_idx[0]
-                row_items = list(dict(row).items())
-                instance: "Model" = self.model._init_from_db(**dict(row_items[:current_idx]))
-                instances: Dict[Any, Any] = {path: instance}
-                for model, index, *__, full_path in self.select_related_idx[1:]:
-                    (*path, attr) = full_path
-                    related_items = row_items[current_idx : current_idx + index]
-                    if not any((v for _, v in related_items)):
-                        obj = None
-                    else:
-                        obj = model._init_from_db(**{k.split(".")[1]: v for k, v in related_items})
-                    target = instances.get(tuple(path))
+        init_from_db_row: Callable[[Any], "Model"] = self.model._init_from_db_row
+        select_related_idx = self.select_related_idx
+        session = get_session()
+        if select_related_idx and len(select_related_idx) > 1:
+            related_plan = None
+            root_path = select_related_idx[0][4]
+            for row in raw_results:
+                if related_plan is None:
+                    base_init, related_plan = self._make_select_related_plan(row, session)
+                instance: "Model" = base_init(row)
+                instances: Dict[Any, Any] = {root_path: instance}
+                for init, related_keys, path, attr, full_path in related_plan:
+                    obj = init(row) if any(row[key] for key in related_keys) else None
+                    target = instances.get(path)
                     if target is not None:
                         setattr(target, f"_{attr}", obj)
                     if obj is not None:
-                        instances[(*path, attr)] = obj
-                    current_idx += index
-            else:
-                instance = self.model._init_from_db(**row)
+                        instances[full_path] = obj
+                if custom_fields:
+                    for field in custom_fields:
+                        setattr(instance, field, row[field])
+                instance_list.append(instance)
+            return instance_list
+        if session is not None:
+            init_from_db_row = session.wrap_init(
+                self.model, init_from_db_row, self.model._meta.db_pk_column
+            )
+        for row in raw_results:
+            instance = init_from_db_row(row)
             if custom_fields:
                 for field in custom_fields:
                     setattr(instance, field, row[field])
             instance_list.append(instance)
-        await self._execute_prefetch_queries(instance_list)
         return instance_list
 
+    def _make_select_related_plan(
+        self, row: Any, session: Optional[Session] = None
+    ) -> Tuple[Callable[[Any], "Model"], list]:
+        """
+        Works out, from the first row of a ``select_related()`` resultset, which columns
+        belong to which model, so that the rows can be split without copying them.
+
+        :param row: A row of the resultset.
+        :param session: The active session, whose identity map the instances are taken from.
+        :return: The function creating the base instance from a row, and a list of
+            ``(init, related_keys, path, attr, full_path)`` entries for the related models.
+        """
+        select_related_idx = cast(list, self.select_related_idx)
+        # Columns of a repeated select_related path are selected again, first one wins
+        keys = list(dict.fromkeys(row.keys()))
+        current_idx = select_related_idx[0][1]
+        base_keys = keys[:current_idx]
+        base_init = self._make_row_init(self.model, "", [(key, key) for key in base_keys])
+        if session is not None:
+            base_init = session.wrap_init(self.model, base_init, self.model._meta.db_pk_column)
+        related_plan = []
+        for model, index, *__, full_path in select_related_idx[1:]:
+            (*path, attr) = full_path
+            related_keys = keys[current_idx : current_idx + index]
+            prefix = related_keys[0][: related_keys[0].index(".") + 1] if related_keys else ""
+            init = self._make_row_init(
+                model, prefix, [(key, key.split(".")[1]) for key in related_keys]
+            )
+            if session is not None:
+                init = session.wrap_init(model, init, prefix + model._meta.db_pk_column)
+            related_plan.append((init, related_keys, tuple(path), attr, tuple(full_path)))
+            current_idx += index
+        return base_init, related_plan
+
+    @staticmethod
+    def _make_row_init(
+        model: "Type[Model]", prefix: str, keys: List[Tuple[str, str]]
+    ) -> Callable[[Any], "Model"]:
+        hydrator = model._meta.get_hydrator(prefix)
+
+        def init(row: Any) -> "Model":
+            nonlocal hydrator
+            if hydrator is not None:
+                try:
+                    return hydrator(row)
+                except (KeyError, IndexError):
+                    # Partial row, e.g. from .only(), all rows of the resultset have the same keys
+                    hydrator = None
+            return model._init_from_db(**{name: row[key] for key, name in keys})
+
+        return init
+
     def _prepare_insert_columns(
         self, include_generated: bool = False
     ) -> Tuple[List[str], List[str]]:
@@ -171,7 +310,11 @@ class BaseExecutor:
         return regular_columns, result_columns
 
     def _prepare_insert_statement(
-        self, columns: Sequence[str], has_generated: bool = True, ignore_conflicts: bool = False
+        self,
+        columns: Sequence[str],
+        has_generated: bool = True,
+        ignore_conflicts: bool = False,
+        rows: int = 1,
     ) -> QueryBuilder:
         # Insert should implement returning new id to saved object
         # Each db has its own methods for it, so each implementation should
@@ -179,7 +322,7 @@ class BaseExecutor:
         query = (
             self.db.query_class.into(self.model._meta.basetable)
             .columns(*columns)
-            .insert(*[self.parameter(i) for i in range(len(columns))])
+            .insert(*self._insert_parameters(len(columns), rows))
         )
         if ignore_conflicts:
             query = query.on_conflict().do_nothing()
@@ -191,6 +334,102 @@ class BaseExecutor:
     def parameter(self, pos: int) -> Parameter:
         return Parameter(idx=pos + 1)
 
+    def _insert_parameters(self, columns_count: int, rows: int) -> List[List[Parameter]]:
+        return [
+            [self.parameter(row * columns_count + i) for i in range(columns_count)]
+            for row in range(rows)
+        ]
+
+    def _bulk_insert_rows(self, columns_count: int, returning: bool = False) -> int:
+        """
+        Returns how many rows a single multi-row INSERT statement may hold.
+
+        :param returning: Whether the statement returns the generated fields of the rows.
+        """
+        max_params, max_rows = self.BULK_INSERT_MAX_PARAMS, self.BULK_INSERT_MAX_ROWS
+        if returning:
+            if not self.BULK_INSERT_RETURNING:
+                return 1
+            max_params = self.BULK_INSERT_RETURNING_MAX_PARAMS or max_params
+            max_rows = self.BULK_INSERT_RETURNING_MAX_ROWS or max_rows
+        if not max_params:
+            return 1
+        rows = max_params // max(columns_count, 1)
+        if max_rows:
+            rows = min(rows, max_rows)
+        return max(rows, 1)
+
+    def get_bulk_update_queries(
+        self, query: QueryBuilder, objects: "Sequence[Model]", fields: Sequence[str]
+    ) -> Optional[List[Tuple[str, list, bool]]]:
+        """
+        Returns set-based statements updating the fields of the objects, as tuples of the SQL,
+        its values and whether it is executed once per row of values with ``execute_many()``,
+        or ``None`` if they can't be updated that way.
+
+        :param query: The UPDATE query of the model, with the filters of the queryset.
+        :param objects: The objects to update.
+        :param fields: The names of the fields to update.
+        """
+        return None
+
+    def _bulk_update_rows(self, objects: "Sequence[Model]", fields: Sequence[str]) -> List[list]:
+        """
+        Returns the primary key and the values of the fields of each object, for the database.
+        """
+        pk_to_db_value = self.column_map[self.model._meta.pk_attr]
+        fields_map = self.model._meta.fields_map
+        return [
+            [
+                pk_to_db_value(obj.pk, None),
+                *(fields_map[field].to_db_value(getattr(obj, field), obj) for field in fields),
+            ]
+            for obj in objects
+        ]
+
+    def get_bulk_insert_sql(
+        self,
+        rows: int = 1,
+        ignore_conflicts: bool = False,
+        update_fields: Optional[Iterable[str]] = None,
+        on_conflict: Optional[Iterable[str]] = None,
+    ) -> Tuple[str, str]:
+        """
+        Generates the SQL for inserting ``rows`` rows in a single statement.
+
+        :return: The insert statement without and with the generated fields, as for
+            ``insert_query`` and ``insert_query_all``.
+        """
+        if rows == 1 and not (ignore_conflicts or update_fields):
+            return self.insert_query, self.insert_query_all
+
+        key = (rows, ignore_conflicts, tuple(update_fields or ()), tuple(on_conflict or ()))
+        if key in self.bulk_insert_cache:
+            return self.bulk_insert_cache[key]
+
+        _, columns = self._prepare_insert_columns()
+        insert_query = self._prepare_insert_statement(
+            columns, ignore_conflicts=ignore_conflicts, rows=rows
+        )
+        insert_query_all = insert_query
+        if self.model._meta.generated_db_fields:
+            _, columns_all = self._prepare_insert_columns(include_generated=True)
+            insert_query_all = self._prepare_insert_statement(
+                columns_all, has_generated=False, ignore_conflicts=ignore_conflicts, rows=rows
+            )
+        if update_fields:
+            alias = f"new_{self.model._meta.db_table}"
+            insert_query_all = insert_query_all.as_(alias).on_conflict(*(on_conflict or []))
+            insert_query = insert_query.as_(alias).on_conflict(*(on_conflict or []))
+            for update_field in update_fields:
+                insert_query_all = insert_query_all.do_update(update_field)
+                insert_query = insert_query.do_update(update_field)
+
+        if len(self.bulk_insert_cache) >= BULK_INSERT_CACHE_SIZE:
+            self.bulk_insert_cache.pop(next(iter(self.bulk_insert_cache)))
+        sqls = self.bulk_insert_cache[key] = insert_query.get_sql(), insert_query_all.get_sql()
+        return sqls
+
     async def execute_insert(self, instance: "Model") -> None:
         if not instance._custom_generated_pk:
             values = [
@@ -206,35 +445,235 @@ class BaseExecutor:
                 for field_name in self.regular_columns_all
             ]
             await self.db.execute_insert(self.insert_query_all, values)
+        if query_cache.used:
+            await query_cache.invalidate((self.model._meta.db_table,), self.db)
+
+    async def execute_upsert(
+        self, instance: "Model", update_fields: Sequence[str], on_conflict: Sequence[str]
+    ) -> bool:
+        """
+        Inserts the instance, or updates the given fields of the row it conflicts with on
+        the ``on_conflict`` fields, and sets the values of the resulting row on the instance.
+
+        :param instance: The instance to insert.
+        :param update_fields: The fields to update if the row exists.
+        :param on_conflict: The fields of the unique constraint the row conflicts on.
+        :return: Whether the row was created.
+        :raises UnSupportedError: If the database doesn't support upserts.
+        """
+        created, row = await self._execute_upsert(instance, update_fields, on_conflict)
+        fetched = self.model._init_from_db_row(row)
+        for field in self.model._meta.fields_db_projection:
+            setattr(instance, field, getattr(fetched, field))
+        instance._custom_generated_pk = fetched._custom_generated_pk
+        if query_cache.used:
+            await query_cache.invalidate((self.model._meta.db_table,), self.db)
+        if (session := get_session()) is not None:
+            # Another instance of the row in the identity map is stale now
+            if session.get(self.model, instance.pk) is not instance:
+                session.discard(instance)
+        return created
+
+    async def _execute_upsert(
+        self, instance: "Model", update_fields: Sequence[str], on_conflict: Sequence[str]
+    ) -> Tuple[bool, dict]:
+        """
+        Runs the upsert of :meth:`execute_upsert`.
+
+        :return: Whether the row was created and the row, with the values of all columns.
+        """
+        raise UnSupportedError(f"{self.db.capabilities.dialect} does not support upserts")
+
+    def _upsert_values(self, instance: "Model") -> Tuple[List[str], list]:
+        """
+        Returns the fields inserted for the instance and their values for the database.
+        """
+        columns = (
+            self.regular_columns_all if instance._custom_generated_pk else self.regular_columns
+        )
+        return columns, [
+            self.column_map[field](getattr(instance, field), instance) for field in columns
+        ]
+
+    def _conflicting_row_query(
+        self,
+        columns: Sequence[str],
+        values: list,
+        update_fields: Sequence[str],
+        on_conflict: Sequence[str],
+    ) -> Tuple[QueryBuilder, list]:
+        """
+        Returns the UPDATE of the fields of the row conflicting with the inserted values, or
+        the SELECT of the row if there are no fields to update, and its values.
+        """
+        meta = self.model._meta
+        table = meta.basetable
+        query_values: list = []
+        if update_fields:
+            query = self.db.query_class.update(table)
+            for field in update_fields:
+                query = query.set(
+                    meta.fields_db_projection[field], self.parameter(len(query_values))
+                )
+                query_values.append(values[columns.index(field)])
+        else:
+            query = self.db.query_class.from_(table).select(*meta.db_fields)
+        for field in on_conflict:
+            query = query.where(
+                table[meta.fields_db_projection[field]] == self.parameter(len(query_values))
+            )
+            query_values.append(values[columns.index(field)])
+        return query, query_values
+
+    def _prepare_bulk_values(self, instances: "Iterable[Model]") -> Tuple[List[list], List[list]]:
+        """
+        Converts instances to lists of DB values, split by whether the pk was provided or not.
+
+        :return: The values lists for ``regular_columns_all`` and for ``regular_columns``.
+        """
+        values_lists_all = []
+        values_lists = []
+        for instance in instances:
+            if instance._custom_generated_pk:
+                values_lists_all.append(
+                    [
+                        self.column_map[field_name](getattr(instance, field_name), instance)
+                        for field_name in self.regular_columns_all
+                    ]
+                )
+            else:
+                values_lists.append(
+                    [
+                        self.column_map[field_name](getattr(instance, field_name), instance)
+                        for field_name in self.regular_columns
+                    ]
+                )
+        return values_lists_all, values_lists
 
     async def execute_bulk_insert(
         self,
         instances: "Iterable[Model]",
         batch_size: Optional[int] = None,
+        ignore_conflicts: bool = False,
+        update_fields: Optional[Iterable[str]] = None,
+        on_conflict: Optional[Iterable[str]] = None,
+        return_pks: bool = False,
     ) -> None:
+        returning = return_pks and bool(self.model._meta.generated_db_fields)
         for instance_chunk in chunk(instances, batch_size):
-            values_lists_all = []
-            values_lists = []
-            for instance in instance_chunk:
-                if instance._custom_generated_pk:
-                    values_lists_all.append(
-                        [
-                            self.column_map[field_name](getattr(instance, field_name), instance)
-                            for field_name in self.regular_columns_all
-                        ]
-                    )
-                else:
-                    values_lists.append(
-                        [
-                            self.column_map[field_name](getattr(instance, field_name), instance)
-                            for field_name in self.regular_columns
-                        ]
-                    )
+            if return_pks:
+                instance_chunk = list(instance_chunk)
+            values_lists_all, values_lists = self._prepare_bulk_values(instance_chunk)
+            if values_lists_all:
+                await self._execute_bulk_insert_values(
+                    values_lists_all, True, ignore_conflicts, update_fields, on_conflict
+                )
+            if values_lists and returning:
+                await self._execute_bulk_insert_returning(
+                    [instance for instance in instance_chunk if not instance._custom_generated_pk],
+                    values_lists,
+                )
+            elif values_lists:
+                await self._execute_bulk_insert_values(
+                    values_lists, False, ignore_conflicts, update_fields, on_conflict
+                )
+            if return_pks:
+                for instance in instance_chunk:
+                    instance._saved_in_db = True
+        if query_cache.used:
+            await query_cache.invalidate((self.model._meta.db_table,), self.db)
+
+    async def _execute_bulk_insert_returning(
+        self, instances: "List[Model]", values_lists: List[list]
+    ) -> None:
+        """
+        Inserts the rows of the instances and sets the generated fields of the rows on them.
+
+        More than one statement is wrapped in a transaction.
+        """
+        max_rows = self._bulk_insert_rows(len(values_lists[0]), returning=True)
+        if len(values_lists) <= max_rows:
+            await self._insert_returning(instances, values_lists)
+            return
+        async with self.db._in_transaction() as connection:
+            executor = self.db.executor_class(model=self.model, db=connection)
+            for i in range(0, len(values_lists), max_rows):
+                await executor._insert_returning(
+                    instances[i : i + max_rows], values_lists[i : i + max_rows]
+                )
+
+    async def _insert_returning(self, instances: "List[Model]", values_lists: List[list]) -> None:
+        """
+        Inserts the rows in a single statement and sets their generated fields on the instances.
+        Only gets a single row unless ``BULK_INSERT_RETURNING`` is set.
+        """
+        (instance,) = instances
+        insert_result = await self.db.execute_insert(self.insert_query, values_lists[0])
+        await self._process_insert_result(instance, insert_result)
+
+    async def _execute_bulk_insert_values(
+        self,
+        values_lists: List[list],
+        include_generated: bool,
+        ignore_conflicts: bool = False,
+        update_fields: Optional[Iterable[str]] = None,
+        on_conflict: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Inserts the rows with as few multi-row INSERT statements as the DB allows.
+
+        All statements of the same size are sent with a single ``execute_many``,
+        and more than one ``execute_many`` is wrapped in a transaction.
+        """
+        idx = 1 if include_generated else 0
+        max_rows = self._bulk_insert_rows(len(values_lists[0]))
+        if max_rows == 1 or len(values_lists) == 1:
+            sql = self.get_bulk_insert_sql(1, ignore_conflicts, update_fields, on_conflict)[idx]
+            await self.db.execute_many(sql, values_lists)
+            return
 
+        full_count, tail = divmod(len(values_lists), max_rows)
+        batches = []
+        if full_count:
+            sql = self.get_bulk_insert_sql(max_rows, ignore_conflicts, update_fields, on_conflict)
+            params = [
+                [value for row in values_lists[i : i + max_rows] for value in row]
+                for i in range(0, full_count * max_rows, max_rows)
+            ]
+            batches.append((sql[idx], params))
+        if tail:
+            sql = self.get_bulk_insert_sql(tail, ignore_conflicts, update_fields, on_conflict)
+            params = [[value for row in values_lists[-tail:] for value in row]]
+            batches.append((sql[idx], params))
+
+        if len(batches) == 1:
+            await self.db.execute_many(*batches[0])
+        else:
+            async with self.db._in_transaction() as connection:
+                for sql, params in batches:
+                    await connection.execute_many(sql, params)
+
+    async def execute_bulk_copy(
+        self,
+        instances: "Iterable[Model]",
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Bulk loads the instances with ``COPY``. Requires ``capabilities.support_copy``.
+        """
+        meta = self.model._meta
+        columns = [meta.fields_db_projection[c] for c in self.regular_columns]
+        columns_all = [meta.fields_db_projection[c] for c in self.regular_columns_all]
+        for instance_chunk in chunk(instances, batch_size):
+            values_lists_all, values_lists = self._prepare_bulk_values(instance_chunk)
             if values_lists_all:
-                await self.db.execute_many(self.insert_query_all, values_lists_all)
+                await self.db.execute_copy(
+                    meta.db_table, columns_all, values_lists_all, meta.schema
+                )
             if values_lists:
-                await self.db.execute_many(self.insert_query, values_lists)
+                await self.db.execute_copy(meta.db_table, columns, values_lists, meta.schema)
+        if query_cache.used:
+            await query_cache.invalidate((meta.db_table,), self.db)
 
     def get_update_sql(
         self,
@@ -295,16 +734,29 @@ class BaseExecutor:
                     value = self.column_map[field](instance_field, instance)
                     values.append(value)
         values.append(self.model._meta.pk.to_db_value(instance.pk, instance))
-        return (
+        count = (
             await self.db.execute_query(self.get_update_sql(update_fields, expressions), values)
         )[0]
+        if query_cache.used:
+            await query_cache.invalidate((self.model._meta.db_table,), self.db)
+        if (session := get_session()) is not None:
+            # Another instance of the row in the identity map is stale now
+            if session.get(self.model, instance.pk) is not instance:
+                session.discard(instance)  # type: ignore
+        return count
 
     async def execute_delete(self, instance: "Union[Type[Model], Model]") -> int:
-        return (
+        count = (
             await self.db.execute_query(
                 self.delete_query, [self.model._meta.pk.to_db_value(instance.pk, instance)]
             )
         )[0]
+        if query_cache.used:
+            await query_cache.invalidate_model(self.model, self.db)
+        if (session := get_session()) is not None:
+            session.discard(instance)  # type: ignore
+            session.discard_referencing(self.model)
+        return count
 
     async def _prefetch_reverse_relation(
         self,
@@ -327,12 +779,18 @@ class BaseExecutor:
                 )
             )
 
-        related_query.resolve_ordering(
-            related_query.model, related_query.model._meta.basetable, [], {}
-        )
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
-        )
+        if related_query._limit is not None or related_query._offset:
+            related_object_list = await self._fetch_in_chunks(
+                related_objects_for_fetch[relation_field],
+                partial(self._prefetch_reverse_per_parent, related_query, relation_field),
+            )
+        else:
+            related_query.resolve_ordering(
+                related_query.model, related_query.model._meta.basetable, [], {}
+            )
+            related_object_list = await self._prefetch_in_chunks(
+                related_query, related_objects_for_fetch
+            )
 
         related_object_map: Dict[str, list] = {}
         for entry in related_object_list:
@@ -349,6 +807,84 @@ class BaseExecutor:
             )
         return instance_list
 
+    async def _prefetch_reverse_per_parent(
+        self, related_query: "QuerySet", relation_field: str, keys: list
+    ) -> "List[Model]":
+        """
+        Runs the related query of a reverse relation with its limit and offset applied
+        to the related objects of each of the keys.
+        """
+        queryset = related_query._clone()
+        limit, offset = queryset._limit, queryset._offset
+        queryset._limit = queryset._offset = None
+        queryset._db = self.db
+        queryset._make_query()
+        model = queryset.model
+        key_field = model._meta.fields_map[relation_field]
+        query = self._limit_per_parent(
+            queryset.query,
+            model._meta.basetable[model._meta.fields_db_projection[relation_field]],
+            keys,
+            key_field,
+            limit,
+            offset or 0,
+        )
+        executor = self.__class__(
+            model=model,
+            db=self.db,
+            prefetch_map=queryset._prefetch_map,
+            prefetch_queries=queryset._prefetch_queries,
+            select_related_idx=queryset._select_related_idx,  # type: ignore
+        )
+        return await executor.execute_select(
+            *query.get_parameterized_sql(), custom_fields=list(queryset._annotations)
+        )
+
+    def _limit_per_parent(
+        self,
+        query: QueryBuilder,
+        partition: Term,
+        keys: list,
+        key_field: Field,
+        limit: Optional[int],
+        offset: int,
+    ) -> QueryBuilder:
+        """
+        Returns the query filtered on the partition term being one of the keys, with only
+        the rows ``offset`` to ``offset + limit`` of each key in the order of the query.
+
+        The rows are numbered per key with ``ROW_NUMBER()``.
+
+        :param query: The query, without limit and offset.
+        :param partition: The term of the key the rows belong to.
+        :param keys: The keys to fetch the rows of.
+        :param key_field: The field of the keys.
+        :param limit: The number of rows of each key, or ``None`` for all of them.
+        :param offset: The number of rows of each key to skip.
+        :raises UnSupportedError: If the database doesn't support window functions.
+        """
+        if not self.db.capabilities.support_window_functions:
+            raise UnSupportedError(
+                f"Prefetch limit and offset require window functions,"
+                f" which this {self.db.capabilities.dialect} server does not support"
+            )
+        window = RowNumber().over(partition)
+        for term, order in query._orderbys or [(partition, None)]:
+            window = window.orderby(term, order=order)
+        inner = query.where(self._filter_in(partition, keys))
+        inner._orderbys = []
+        inner = inner.select(window.as_("_prefetch_row"))
+        row_number = TermField("_prefetch_row", table=inner)
+        outer = (
+            self.db.query_class.from_(inner)
+            .select(*(TermField(column, table=inner) for column in _select_columns(query)))
+            .where(row_number > offset)
+            .orderby(row_number)
+        )
+        if limit is not None:
+            outer = outer.where(row_number <= offset + limit)
+        return outer
+
     async def _prefetch_reverse_o2o_relation(
         self,
         instance_list: "Iterable[Model]",
@@ -370,8 +906,8 @@ class BaseExecutor:
                 )
             )
 
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+        related_object_list = await self._prefetch_in_chunks(
+            related_query, related_objects_for_fetch
         )
 
         related_object_map = {}
@@ -404,41 +940,62 @@ class BaseExecutor:
         field_object: ManyToManyFieldInstance = self.model._meta.fields_map[field]  # type: ignore
 
         through_table = Table(field_object.through)
-
-        subquery = (
-            self.db.query_class.from_(through_table)
-            .select(
-                through_table[field_object.backward_key].as_("_backward_relation_key"),
-                through_table[field_object.forward_key].as_("_forward_relation_key"),
-            )
-            .where(through_table[field_object.backward_key].isin(instance_id_set))
-        )
-
         related_query_table = related_query.model._meta.basetable
         related_pk_field = related_query.model._meta.db_pk_column
-        related_query.resolve_ordering(related_query.model, related_query_table, [], {})
-        query = (
-            related_query.query.join(subquery)
-            .on(subquery._forward_relation_key == related_query_table[related_pk_field])
-            .select(
-                subquery._backward_relation_key.as_("_backward_relation_key"),
-                *[related_query_table[field].as_(field) for field in related_query.fields],
-            )
+        related_query.resolve_ordering(
+            related_query.model,
+            related_query_table,
+            related_query._orderings,
+            related_query._annotations,
         )
 
-        if related_query._q_objects:
-            joined_tables: List[Table] = []
-            modifier = QueryModifier()
-            for node in related_query._q_objects:
-                modifier &= node.resolve(
-                    ResolveContext(
-                        model=related_query.model,
-                        table=related_query_table,
-                        annotations=related_query._annotations,
-                        custom_filters=related_query._custom_filters,
+        modifier = QueryModifier()
+        for node in related_query._q_objects:
+            modifier &= node.resolve(
+                ResolveContext(
+                    model=related_query.model,
+                    table=related_query_table,
+                    annotations=related_query._annotations,
+                    custom_filters=related_query._custom_filters,
+                )
+            )
+
+        limit, offset = related_query._limit, related_query._offset
+        backward_key = through_table[field_object.backward_key]
+
+        async def fetch(instance_ids: list) -> Sequence[dict]:
+            if limit is not None or offset:
+                # Filtered on the keys with the limit per key, once the filters are applied
+                query = (
+                    related_query.query.join(through_table)
+                    .on(
+                        through_table[field_object.forward_key]
+                        == related_query_table[related_pk_field]
+                    )
+                    .select(
+                        backward_key.as_("_backward_relation_key"),
+                        *[related_query_table[field].as_(field) for field in related_query.fields],
+                    )
+                )
+            else:
+                subquery = (
+                    self.db.query_class.from_(through_table)
+                    .select(
+                        backward_key.as_("_backward_relation_key"),
+                        through_table[field_object.forward_key].as_("_forward_relation_key"),
+                    )
+                    .where(self._filter_in(backward_key, instance_ids))
+                )
+                query = (
+                    related_query.query.join(subquery)
+                    .on(subquery._forward_relation_key == related_query_table[related_pk_field])
+                    .select(
+                        subquery._backward_relation_key.as_("_backward_relation_key"),
+                        *[related_query_table[field].as_(field) for field in related_query.fields],
                     )
                 )
 
+            joined_tables: List[Table] = []
             for join in modifier.joins:
                 if join[0] not in joined_tables:
                     query = query.join(join[0], how=JoinType.left_outer).on(join[1])
@@ -450,17 +1007,27 @@ class BaseExecutor:
             if modifier.having_criterion:
                 query = query.having(modifier.having_criterion)
 
-        _, raw_results = await self.db.execute_query(*query.get_parameterized_sql())
+            if limit is not None or offset:
+                query = self._limit_per_parent(
+                    query, backward_key, instance_ids, self.model._meta.pk, limit, offset or 0
+                )
+            _, rows = await self.db.execute_query(*query.get_parameterized_sql())
+            return rows
+
+        raw_results = await self._fetch_in_chunks(list(instance_id_set), fetch)
         relations: List[Tuple[Any, Any]] = []
         related_object_list: List["Model"] = []
         model_pk, related_pk = self.model._meta.pk, field_object.related_model._meta.pk
+        init: Callable[[Any], "Model"] = related_query.model._init_from_db_row
+        if (session := get_session()) is not None:
+            init = session.wrap_init(related_query.model, init, related_pk_field)
         for e in raw_results:
             pk_values: Tuple[Any, Any] = (
                 model_pk.to_python_value(e["_backward_relation_key"]),
                 related_pk.to_python_value(e[related_pk_field]),
             )
             relations.append(pk_values)
-            related_object_list.append(related_query.model._init_from_db(**e))
+            related_object_list.append(init(e))
         await self.__class__(
             model=related_query.model, db=self.db, prefetch_map=related_query._prefetch_map
         )._execute_prefetch_queries(related_object_list)
@@ -502,14 +1069,9 @@ class BaseExecutor:
                 setattr(instance, field, None)
 
         if related_objects_for_fetch:
-            conditions: Dict[str, Any] = {}
-            for k, v in related_objects_for_fetch.items():
-                if len(v) == 1:
-                    v = v[0]
-                else:
-                    k += "__in"
-                conditions[k] = v
-            related_object_list = await related_queryset.filter(**conditions)
+            related_object_list = await self._prefetch_in_chunks(
+                related_queryset, related_objects_for_fetch
+            )
             if len(model_to_field) > 1:
                 related_object_map = {
                     getattr(obj, model_to_field[obj.__class__]): obj for obj in related_object_list
@@ -523,7 +1085,55 @@ class BaseExecutor:
                     setattr(instance, to_attr, obj)
         return instance_list
 
+    def _filter_in(self, term: Any, values: list) -> Any:
+        """
+        Returns the criterion of the term being one of the values, for the dialect.
+        """
+        return (self.get_overridden_filter_func(is_in) or is_in)(term, values)
+
+    async def _fetch_in_chunks(
+        self, keys: list, fetch: Callable[[list], Awaitable[Sequence[Any]]]
+    ) -> List[Any]:
+        """
+        Fetches the results for the keys, in chunks of at most ``PREFETCH_CHUNK_SIZE`` keys
+        fetched concurrently.
+
+        :param keys: The keys to fetch the results for.
+        :param fetch: The function fetching the results for a chunk of keys.
+        """
+        chunk_size = self.PREFETCH_CHUNK_SIZE
+        if not chunk_size or len(keys) <= chunk_size:
+            return list(await fetch(keys))
+        results = await asyncio.gather(
+            *(fetch(list(keys_chunk)) for keys_chunk in chunk(keys, chunk_size))
+        )
+        return [result for chunk_results in results for result in chunk_results]
+
+    async def _prefetch_in_chunks(
+        self, related_query: "QuerySet", related_objects_for_fetch: Dict[str, list]
+    ) -> "List[Model]":
+        """
+        Runs the related query filtered on the values of the related fields to fetch.
+        """
+        if len(related_objects_for_fetch) > 1:
+            # The conditions are combined, so the values can't be split in chunks
+            return await related_query.filter(
+                **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+            )
+        ((key, values),) = related_objects_for_fetch.items()
+
+        def fetch(keys: list) -> "QuerySet":
+            if len(keys) == 1:
+                return related_query.filter(**{key: keys[0]})
+            return related_query.filter(**{f"{key}__in": keys})
+
+        return await self._fetch_in_chunks(values, fetch)
+
     def _make_prefetch_queries(self) -> None:
+        if self._prefetch_queries_made:
+            # Already built for a previous chunk of the same resultset
+            return
+        self._prefetch_queries_made = True
         for field_name, forwarded_prefetches in self.prefetch_map.items():
             to_attr = None
             if field_name in self._prefetch_queries:
@@ -591,3 +1201,10 @@ class BaseExecutor:
     @classmethod
     def get_overridden_filter_func(cls, filter_func: Callable) -> Optional[Callable]:
         return cls.FILTER_FUNC_OVERRIDE.get(filter_func)
+
+
+def _select_columns(query: QueryBuilder) -> List[str]:
+    """
+    Returns the names of the columns selected by the query.
+    """
+    return [term.alias or term.name for term in query._selects]
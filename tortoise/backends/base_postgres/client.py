@@ -4,10 +4,13 @@ from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
     Callable,
     Coroutine,
     List,
     Optional,
+    Sequence,
     SupportsInt,
     Tuple,
     Type,
@@ -23,6 +26,8 @@ from tortoise.backends.base.client import (
     ConnectionWrapper,
     PoolConnectionWrapper,
     TransactionContext,
+    instrumented,
+    instrumented_iter,
 )
 from tortoise.backends.base_postgres.executor import BasePostgresExecutor
 from tortoise.backends.base_postgres.schema_generator import BasePostgresSchemaGenerator
@@ -33,6 +38,7 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 FuncType = Callable[..., Coroutine[None, None, T]]
+IterFuncType = Callable[..., AsyncGenerator[T, None]]
 
 
 def translate_exceptions(func: FuncType) -> FuncType:
@@ -40,7 +46,28 @@ def translate_exceptions(func: FuncType) -> FuncType:
     async def _translate_exceptions(self, *args, **kwargs) -> T:
         return await self._translate_exceptions(func, *args, **kwargs)
 
-    return _translate_exceptions
+    return instrumented(_translate_exceptions)
+
+
+async def _anext(self: Any, iterator: AsyncIterator[T]) -> T:
+    return await iterator.__anext__()
+
+
+def translate_exceptions_iter(func: IterFuncType) -> IterFuncType:
+    @wraps(func)
+    async def _translate_exceptions_iter(self, *args, **kwargs) -> AsyncGenerator[T, None]:
+        iterator = func(self, *args, **kwargs)
+        try:
+            while True:
+                try:
+                    item = await self._translate_exceptions(_anext, iterator)
+                except StopAsyncIteration:
+                    break
+                yield item
+        finally:
+            await iterator.aclose()
+
+    return instrumented_iter(_translate_exceptions_iter)
 
 
 class BasePostgresPool:
@@ -52,7 +79,13 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
     query_class: Type[PostgreSQLQuery] = PostgreSQLQuery
     executor_class: Type[BasePostgresExecutor] = BasePostgresExecutor
     schema_generator: Type[BasePostgresSchemaGenerator] = BasePostgresSchemaGenerator
-    capabilities = Capabilities("postgres", support_update_limit_order_by=False)
+    capabilities = Capabilities(
+        "postgres",
+        support_update_limit_order_by=False,
+        support_copy=True,
+        support_row_values=True,
+        support_upsert=True,
+    )
     connection_class: "Optional[Union[AsyncConnection, Connection]]" = None
     loop: Optional[AbstractEventLoop] = None
     _pool: Optional[Any] = None
@@ -82,6 +115,7 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
         self.application_name = self.extra.pop("application_name", None)
         self.extra.pop("connection_name", None)
         self.extra.pop("fetch_inserted", None)
+        self.extra.pop("slow_query_threshold", None)
         self.loop = self.extra.pop("loop", None)
         self.connection_class = self.extra.pop("connection_class", self.connection_class)
         self.pool_minsize = int(self.extra.pop("minsize", 1))
@@ -152,6 +186,12 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
     async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
         raise NotImplementedError("execute_query_dict is not implemented")
 
+    @abc.abstractmethod
+    def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        raise NotImplementedError("execute_query_iter is not implemented")
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
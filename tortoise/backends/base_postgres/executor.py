@@ -1,11 +1,15 @@
 import uuid
-from typing import Optional, Sequence, cast
+from typing import Any, List, Optional, Sequence, Tuple, cast
 
+from pypika import Table
+from pypika.analytics import RowNumber
 from pypika.dialects import PostgreSQLQueryBuilder
-from pypika.terms import Term
+from pypika.enums import Equality
+from pypika.queries import QueryBuilder, Selectable
+from pypika.terms import BasicCriterion, Criterion, Field, Function, Term, ValueWrapper
 
 from tortoise import Model
-from tortoise.backends.base.executor import BaseExecutor
+from tortoise.backends.base.executor import BaseExecutor, _select_columns
 from tortoise.contrib.postgres.json_functions import (
     postgres_json_contained_by,
     postgres_json_contains,
@@ -14,14 +18,90 @@ from tortoise.contrib.postgres.json_functions import (
 from tortoise.contrib.postgres.regex import postgres_posix_regex
 from tortoise.contrib.postgres.search import SearchCriterion
 from tortoise.filters import (
+    is_in,
     json_contained_by,
     json_contains,
     json_filter,
+    not_in,
     posix_regex,
     search,
 )
 
 
+class ArrayWrapper(ValueWrapper):
+    """
+    A list of values bound as a single array parameter, or rendered as an ARRAY literal
+    if the query isn't parameterized.
+    """
+
+    def get_value_sql(self, **kwargs: Any) -> str:
+        values = ",".join(ValueWrapper(value).get_value_sql(**kwargs) for value in self.value)
+        return f"ARRAY[{values}]"
+
+
+def postgres_array_in(field: Term, value: Any) -> Criterion:
+    # Binds the values as a single array parameter, so the statement doesn't depend
+    # on the number of values and is prepared once
+    if isinstance(value, Term) or not value:
+        return is_in(field, value)
+    return BasicCriterion(Equality.eq, field, Function("ANY", ArrayWrapper(list(value))))
+
+
+def postgres_array_not_in(field: Term, value: Any) -> Criterion:
+    if isinstance(value, Term) or not value:
+        return not_in(field, value)
+    return (
+        BasicCriterion(Equality.ne, field, Function("ALL", ArrayWrapper(list(value))))
+        | field.isnull()
+    )
+
+
+class LateralRows(Selectable):
+    """
+    The rows of a query for each key of an array, with the query referencing the key
+    as ``"_prefetch_parent"."_prefetch_key"``.
+    """
+
+    def __init__(self, keys: list, key_type: str, query: QueryBuilder) -> None:
+        super().__init__(alias="_prefetch")
+        self.keys = ArrayWrapper(keys)
+        self.key_type = key_type
+        self.query = query
+
+    def get_sql(self, quote_char: str = '"', **kwargs: Any) -> str:
+        keys = self.keys.get_sql(quote_char=quote_char, **kwargs)
+        query = self.query.get_sql(
+            **{**kwargs, "quote_char": quote_char, "subquery": True, "with_alias": False}
+        )
+        return (
+            f"UNNEST({keys}::{self.key_type}[]) {quote_char}_prefetch_parent{quote_char}"
+            f"({quote_char}_prefetch_key{quote_char}) "
+            f"CROSS JOIN LATERAL {query} {quote_char}{self.alias}{quote_char}"
+        )
+
+
+class UnnestRows(Selectable):
+    """
+    The rows of columns of values, each bound as a single array parameter cast to the
+    type of its column, with the columns named ``_value0``, ``_value1``...
+    """
+
+    def __init__(self, columns: List[list], types: List[str], alias: str) -> None:
+        super().__init__(alias=alias)
+        self.columns = [ArrayWrapper(values) for values in columns]
+        self.types = types
+
+    def get_sql(self, quote_char: str = '"', **kwargs: Any) -> str:
+        arrays = ",".join(
+            f"{values.get_sql(quote_char=quote_char, **kwargs)}::{sql_type}[]"
+            for values, sql_type in zip(self.columns, self.types)
+        )
+        names = ",".join(
+            f"{quote_char}_value{index}{quote_char}" for index in range(len(self.columns))
+        )
+        return f"UNNEST({arrays}) {quote_char}{self.alias}{quote_char}({names})"
+
+
 def postgres_search(field: Term, value: Term) -> SearchCriterion:
     return SearchCriterion(field, expr=value)
 
@@ -35,19 +115,108 @@ class BasePostgresExecutor(BaseExecutor):
         json_contained_by: postgres_json_contained_by,
         json_filter: postgres_json_filter,
         posix_regex: postgres_posix_regex,
+        is_in: postgres_array_in,
+        not_in: postgres_array_not_in,
     }
+    PREFETCH_CHUNK_SIZE = 10000
+    # The objects are passed as one array per column, whatever their number
+    BULK_UPDATE_MIN_ROWS = 20
+    BULK_INSERT_RETURNING = True
+    # The other bulk inserts pipeline a single-row INSERT with execute_many(), but its rows
+    # can't return the generated fields. The protocol allows 32767 parameters per statement.
+    BULK_INSERT_RETURNING_MAX_PARAMS = 32767
+
+    def _filter_in(self, term: Any, values: list) -> Any:
+        # The keys of prefetch queries are bound as one array whatever the filter functions
+        return postgres_array_in(term, values)
+
+    def _limit_per_parent(
+        self,
+        query: QueryBuilder,
+        partition: Term,
+        keys: list,
+        key_field: Any,
+        limit: Optional[int],
+        offset: int,
+    ) -> QueryBuilder:
+        # A LATERAL join runs the query with its limit for each key,
+        # which can use an index on the key instead of numbering all rows
+        inner = query.where(partition == Field("_prefetch_key", table=Table("_prefetch_parent")))
+        if limit is not None:
+            inner._limit = inner._wrapper_cls(limit)
+        if offset:
+            inner._offset = inner._wrapper_cls(offset)
+        window = RowNumber().over()
+        for term, order in query._orderbys:
+            window = window.orderby(term, order=order)
+        inner = inner.select(window.as_("_prefetch_row"))
+        rows = LateralRows(keys, key_field.get_for_dialect("postgres", "SQL_TYPE"), inner)
+        return (
+            self.db.query_class.from_(rows)
+            .select(*(rows.field(column) for column in _select_columns(query)))
+            .orderby(rows.field("_prefetch_row"))
+        )
+
+    def get_bulk_update_queries(
+        self, query: QueryBuilder, objects: Sequence[Model], fields: Sequence[str]
+    ) -> Optional[List[Tuple[str, list, bool]]]:
+        # UPDATE ... FROM the rows of one array parameter per column, so that the statement
+        # is the same whatever the number of objects
+        meta = self.model._meta
+        types = [
+            meta.fields_map[field_name].get_for_dialect("postgres", "SQL_TYPE")
+            for field_name in (meta.pk_attr, *fields)
+        ]
+        if not all(types) or any(sql_type.endswith("]") for sql_type in types):
+            # UNNEST() would flatten the values of array columns
+            return None
+        rows = self._bulk_update_rows(objects, fields)
+        values = UnnestRows([list(column) for column in zip(*rows)], types, "_bulk_update")
+        query = query.from_(values).where(
+            meta.basetable[meta.db_pk_column] == values.field("_value0")
+        )
+        for index, field in enumerate(fields, 1):
+            query = query.set(meta.fields_db_projection[field], values.field(f"_value{index}"))
+        return [(*query.get_parameterized_sql(), False)]
 
     def _prepare_insert_statement(
-        self, columns: Sequence[str], has_generated: bool = True, ignore_conflicts: bool = False
+        self,
+        columns: Sequence[str],
+        has_generated: bool = True,
+        ignore_conflicts: bool = False,
+        rows: int = 1,
     ) -> PostgreSQLQueryBuilder:
         builder = cast(PostgreSQLQueryBuilder, self.db.query_class.into(self.model._meta.basetable))
-        query = builder.columns(*columns).insert(*[self.parameter(i) for i in range(len(columns))])
+        query = builder.columns(*columns).insert(*self._insert_parameters(len(columns), rows))
         if has_generated and (generated_fields := self.model._meta.generated_db_fields):
             query = query.returning(*generated_fields)
         if ignore_conflicts:
             query = query.on_conflict().do_nothing()
         return query
 
+    async def _execute_upsert(
+        self, instance: Model, update_fields: Sequence[str], on_conflict: Sequence[str]
+    ) -> Tuple[bool, dict]:
+        meta = self.model._meta
+        columns, values = self._upsert_values(instance)
+        query = self._prepare_insert_statement(
+            [meta.fields_db_projection[field] for field in columns], has_generated=False
+        ).on_conflict(*(meta.fields_db_projection[field] for field in on_conflict))
+        # Updating a conflict field with its own value returns the existing row
+        for field in update_fields or on_conflict[:1]:
+            query = query.do_update(meta.fields_db_projection[field])
+        # The row updated on conflict is locked by the statement, so xmax is only 0 if inserted
+        query = query.returning(*meta.db_fields, (Field("xmax") == 0).as_("_created"))
+        (row,) = await self.db.execute_query_dict(query.get_sql(), values)
+        return row.pop("_created"), row
+
+    async def _insert_returning(self, instances: List[Model], values_lists: List[list]) -> None:
+        sql = self.get_bulk_insert_sql(len(values_lists))[0]
+        _, rows = await self.db.execute_query(sql, [value for row in values_lists for value in row])
+        # The rows of a multi-row INSERT are returned in the order of the VALUES
+        for instance, row in zip(instances, rows):
+            await self._process_insert_result(instance, row)
+
     async def _process_insert_result(self, instance: Model, results: Optional[dict]) -> None:
         if results:
             generated_fields = self.model._meta.generated_db_fields
@@ -24,7 +24,7 @@ class MSSQLClient(ODBCClient):
     schema_generator = MSSQLSchemaGenerator
     executor_class = MSSQLExecutor
     capabilities = Capabilities(
-        "mssql", support_update_limit_order_by=False, support_for_update=False
+        "mssql", support_update_limit_order_by=False, support_for_update=False, support_upsert=True
     )
 
     def __init__(
@@ -1,9 +1,12 @@
-from typing import Any, Optional, Type, Union
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+
+from pypika.terms import Criterion, Term
 
 from tortoise import Model, fields
 from tortoise.backends.odbc.executor import ODBCExecutor
 from tortoise.exceptions import UnSupportedError
 from tortoise.fields import BooleanField
+from tortoise.filters import is_in, json_array_values, not_in
 
 
 def to_db_bool(
@@ -15,10 +18,88 @@ def to_db_bool(
     return int(bool(value))
 
 
+def mssql_json_in(field: Term, value: Any) -> Criterion:
+    if (values := json_array_values(value, "OPENJSON", MSSQLExecutor.IN_JSON_THRESHOLD)) is None:
+        return is_in(field, value)
+    return field.isin(values)
+
+
+def mssql_json_not_in(field: Term, value: Any) -> Criterion:
+    if (values := json_array_values(value, "OPENJSON", MSSQLExecutor.IN_JSON_THRESHOLD)) is None:
+        return not_in(field, value)
+    return field.notin(values) | field.isnull()
+
+
 class MSSQLExecutor(ODBCExecutor):
     TO_DB_OVERRIDE = {
         fields.BooleanField: to_db_bool,
     }
+    FILTER_FUNC_OVERRIDE = {
+        is_in: mssql_json_in,
+        not_in: mssql_json_not_in,
+    }
+    # SQL Server accepts less than 2100 parameters per request and 1000 rows per VALUES
+    BULK_INSERT_MAX_PARAMS = 2099
+    BULK_INSERT_MAX_ROWS = 1000
+    PREFETCH_CHUNK_SIZE = 2000
+    # From this number of values, __in filters bind the values as a single JSON array
+    # parameter read with OPENJSON (SQL Server 2016+), so that the statement doesn't
+    # depend on the number of values and stays below the parameter limit
+    IN_JSON_THRESHOLD: Optional[int] = 1000
+    BULK_INSERT_RETURNING = True
 
     async def execute_explain(self, sql: str) -> Any:
         raise UnSupportedError("MSSQL does not support explain")
+
+    async def _insert_returning(self, instances: List[Model], values_lists: List[list]) -> None:
+        pk_column = self.model._meta.db_pk_column
+        sql = self.get_bulk_insert_sql(len(values_lists))[0].replace(
+            ") VALUES (", f') OUTPUT INSERTED."{pk_column}" VALUES (', 1
+        )
+        rows = await self.db.execute_query_dict(
+            sql, [value for row in values_lists for value in row]
+        )
+        # The order of the rows of OUTPUT is arbitrary, but the identity values of the rows
+        # inserted by a statement increase in the order of the VALUES
+        for instance, pk in zip(instances, sorted(row[pk_column] for row in rows)):
+            await self._process_insert_result(instance, pk)
+
+    async def _execute_upsert(
+        self, instance: Model, update_fields: Sequence[str], on_conflict: Sequence[str]
+    ) -> Tuple[bool, dict]:
+        meta = self.model._meta
+        columns, values = self._upsert_values(instance)
+        db_columns = [f'"{meta.fields_db_projection[field]}"' for field in columns]
+        table = meta.basetable.get_sql(quote_char='"')
+        match = " AND ".join(
+            f'{table}."{column}"="_upsert"."{column}"'
+            for column in (meta.fields_db_projection[field] for field in on_conflict)
+        )
+        sql = (
+            f"MERGE INTO {table} WITH (HOLDLOCK)"
+            f' USING (VALUES ({",".join("?" * len(columns))})) "_upsert" ({",".join(db_columns)})'
+            f" ON {match}"
+        )
+        if update_fields:
+            updates = ",".join(
+                f'"{column}"="_upsert"."{column}"'
+                for column in (meta.fields_db_projection[field] for field in update_fields)
+            )
+            sql += f" WHEN MATCHED THEN UPDATE SET {updates}"
+        source_columns = ",".join(f'"_upsert".{column}' for column in db_columns)
+        output_columns = ",".join(f'INSERTED."{column}"' for column in meta.db_fields)
+        sql += (
+            f' WHEN NOT MATCHED THEN INSERT ({",".join(db_columns)}) VALUES ({source_columns})'
+            f' OUTPUT $action "_action",{output_columns};'
+        )
+        while True:
+            rows = await self.db.execute_query_dict(sql, values)
+            if rows:
+                row = rows[0]
+                return row.pop("_action") == "INSERT", row
+            # Without fields to update, the existing row is left untouched and not output.
+            # It can be deleted in between.
+            query, query_values = self._conflicting_row_query(columns, values, (), on_conflict)
+            rows = await self.db.execute_query_dict(query.get_sql(), query_values)
+            if rows:
+                return False, rows[0]
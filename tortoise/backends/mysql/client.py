@@ -1,12 +1,15 @@
 import asyncio
+import re
 from functools import wraps
 from itertools import count
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     Coroutine,
     List,
     Optional,
+    Sequence,
     SupportsInt,
     Tuple,
     TypeVar,
@@ -36,6 +39,8 @@ from tortoise.backends.base.client import (
     PoolConnectionWrapper,
     TransactionContext,
     TransactionContextPooled,
+    instrumented,
+    instrumented_iter,
 )
 from tortoise.backends.mysql.executor import MySQLExecutor
 from tortoise.backends.mysql.schema_generator import MySQLSchemaGenerator
@@ -48,6 +53,7 @@ from tortoise.exceptions import (
 
 T = TypeVar("T")
 FuncType = Callable[..., Coroutine[None, None, T]]
+IterFuncType = Callable[..., AsyncGenerator[T, None]]
 
 
 def translate_exceptions(func: FuncType) -> FuncType:
@@ -66,7 +72,39 @@ def translate_exceptions(func: FuncType) -> FuncType:
         except errors.IntegrityError as exc:
             raise IntegrityError(exc)
 
-    return translate_exceptions_
+    return instrumented(translate_exceptions_)
+
+
+def translate_exceptions_iter(func: IterFuncType) -> IterFuncType:
+    @wraps(func)
+    async def translate_exceptions_iter_(self, *args) -> AsyncGenerator[T, None]:
+        iterator = func(self, *args)
+        try:
+            async for item in iterator:
+                yield item
+        except (
+            errors.OperationalError,
+            errors.ProgrammingError,
+            errors.DataError,
+            errors.InternalError,
+            errors.NotSupportedError,
+        ) as exc:
+            raise OperationalError(exc)
+        except errors.IntegrityError as exc:
+            raise IntegrityError(exc)
+        finally:
+            await iterator.aclose()
+
+    return instrumented_iter(translate_exceptions_iter_)
+
+
+def _supports_window_functions(server_version: str) -> bool:
+    # MariaDB reports e.g. 5.5.5-10.6.12-MariaDB, to pass for MySQL 5.5 with older clients
+    if "mariadb" in server_version.lower():
+        version, minimum = server_version.replace("5.5.5-", "", 1), (10, 2)
+    else:
+        version, minimum = server_version, (8, 0)
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:2]) >= minimum
 
 
 class MySQLClient(BaseDBAsyncClient):
@@ -74,7 +112,11 @@ class MySQLClient(BaseDBAsyncClient):
     executor_class = MySQLExecutor
     schema_generator = MySQLSchemaGenerator
     capabilities = Capabilities(
-        "mysql", requires_limit=True, inline_comment=True, support_index_hint=True
+        "mysql",
+        requires_limit=True,
+        inline_comment=True,
+        support_index_hint=True,
+        support_row_values=True,
     )
 
     def __init__(
@@ -98,6 +140,7 @@ class MySQLClient(BaseDBAsyncClient):
         self.storage_engine = self.extra.pop("storage_engine", "")
         self.extra.pop("connection_name", None)
         self.extra.pop("fetch_inserted", None)
+        self.extra.pop("slow_query_threshold", None)
         self.extra.pop("db", None)
         self.extra.pop("autocommit", None)
         self.extra.setdefault("sql_mode", "STRICT_TRANS_TABLES")
@@ -138,10 +181,18 @@ class MySQLClient(BaseDBAsyncClient):
                         hours = timezone.now().utcoffset().seconds / 3600  # type: ignore
                         tz = "{:+d}:{:02d}".format(int(hours), int((hours % 1) * 60))
                         await cursor.execute(f"SET time_zone='{tz}';")
+                    self.capabilities.__dict__["support_window_functions"] = (
+                        _supports_window_functions(connection.get_server_info())
+                    )
             self.log.debug("Created connection %s pool with params: %s", self._pool, self._template)
         except errors.OperationalError:
             raise DBConnectionError(f"Can't connect to MySQL server: {self._template}")
 
+    def _get_pool_sizes(self) -> Optional[Tuple[int, int]]:
+        if not self._pool:
+            return None
+        return self._pool.size, self._pool.freesize
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             for conn in self._pool._free:
@@ -219,6 +270,17 @@ class MySQLClient(BaseDBAsyncClient):
     async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
         return (await self.execute_query(query, values))[1]
 
+    @translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            async with connection.cursor(mysql.cursors.SSDictCursor) as cursor:
+                await cursor.execute(query, values)
+                while rows := await cursor.fetchmany(chunk_size):
+                    yield rows
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -234,6 +296,8 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
         self._lock = asyncio.Lock()
         self._savepoint: Optional[str] = None
         self.log = connection.log
+        self.instrumentation = connection.instrumentation
+        self.slow_query_threshold = connection.slow_query_threshold
         self._finalized: Optional[bool] = None
         self.fetch_inserted = connection.fetch_inserted
         self._parent = connection
@@ -251,6 +315,14 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
             async with connection.cursor() as cursor:
                 await cursor.executemany(query, values)
 
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        # An unbuffered cursor blocks the connection until all rows are read, which would
+        # break any query issued by the consumer in this transaction between chunks.
+        async for rows in BaseDBAsyncClient.execute_query_iter(self, query, values, chunk_size):
+            yield rows
+
     @translate_exceptions
     async def begin(self) -> None:
         await self._connection.begin()
@@ -1,5 +1,8 @@
+from typing import Any, List, Optional, Sequence, Tuple
+
 from pypika import functions
 from pypika.enums import SqlTypes
+from pypika.queries import QueryBuilder, Selectable
 from pypika.terms import BasicCriterion, Criterion
 from pypika.utils import format_quotes
 
@@ -29,6 +32,7 @@ from tortoise.filters import (
     search,
     starts_with,
 )
+from tortoise.utils import chunk
 
 
 class StrWrapper(ValueWrapper):
@@ -100,6 +104,29 @@ def mysql_posix_regex(field: Term, value: str) -> BasicCriterion:
     return BasicCriterion(" REGEXP ", field, StrWrapper(value))  # type:ignore[arg-type]
 
 
+class DerivedRows(Selectable):
+    """
+    A derived table of rows of values, with the columns named ``_value0``, ``_value1``...
+    """
+
+    def __init__(self, rows: List[list], alias: str) -> None:
+        super().__init__(alias=alias)
+        self.rows = rows
+
+    def get_sql(self, quote_char: str = "`", **kwargs: Any) -> str:
+        kwargs["quote_char"] = quote_char
+        selects: List[str] = []
+        for row in self.rows:
+            values = [ValueWrapper(value).get_sql(**kwargs) for value in row]
+            if not selects:
+                values = [
+                    f"{value} {quote_char}_value{index}{quote_char}"
+                    for index, value in enumerate(values)
+                ]
+            selects.append("SELECT " + ",".join(values))
+        return f"({' UNION ALL '.join(selects)}) {quote_char}{self.alias}{quote_char}"
+
+
 class MySQLExecutor(BaseExecutor):
     FILTER_FUNC_OVERRIDE = {
         contains: mysql_contains,
@@ -116,6 +143,48 @@ class MySQLExecutor(BaseExecutor):
         posix_regex: mysql_posix_regex,
     }
     EXPLAIN_PREFIX = "EXPLAIN FORMAT=JSON"
+    # The objects are joined to the table as a derived table, in statements of at most
+    # BULK_UPDATE_MAX_ROWS objects
+    BULK_UPDATE_MIN_ROWS = 20
+    BULK_UPDATE_MAX_ROWS = 1000
+    # The auto-increment values of a multi-row INSERT are consecutive, and LAST_INSERT_ID()
+    # is the one of its first row (with the default auto_increment_increment of 1)
+    BULK_INSERT_RETURNING = True
+    # The other bulk inserts leave building multi-row INSERTs to execute_many() of the driver.
+    # 65535 is the placeholder limit of prepared statements, and the row limit keeps the
+    # statements well below the default max_allowed_packet.
+    BULK_INSERT_RETURNING_MAX_PARAMS = 65535
+    BULK_INSERT_RETURNING_MAX_ROWS = 1000
+    # Keeps the statements well below the default max_allowed_packet
+    PREFETCH_CHUNK_SIZE = 10000
+
+    def get_bulk_update_queries(
+        self, query: QueryBuilder, objects: Sequence[Model], fields: Sequence[str]
+    ) -> Optional[List[Tuple[str, list, bool]]]:
+        if query._limit is not None or query._orderbys:
+            # MySQL doesn't allow LIMIT and ORDER BY in multiple-table UPDATE statements
+            return None
+        meta = self.model._meta
+        queries = []
+        for rows in chunk(self._bulk_update_rows(objects, fields), self.BULK_UPDATE_MAX_ROWS):
+            values = DerivedRows(list(rows), "_bulk_update")
+            batch_query = query.join(values).on(
+                meta.basetable[meta.db_pk_column] == values.field("_value0")
+            )
+            for index, field in enumerate(fields, 1):
+                batch_query = batch_query.set(
+                    meta.fields_db_projection[field], values.field(f"_value{index}")
+                )
+            queries.append((*batch_query.get_parameterized_sql(), False))
+        return queries
+
+    async def _insert_returning(self, instances: List[Model], values_lists: List[list]) -> None:
+        sql = self.get_bulk_insert_sql(len(values_lists))[0]
+        first_id = await self.db.execute_insert(
+            sql, [value for row in values_lists for value in row]
+        )
+        for index, instance in enumerate(instances):
+            await self._process_insert_result(instance, first_id + index)
 
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         pk_field_object = self.model._meta.pk
@@ -1,7 +1,18 @@
 import asyncio
 from abc import ABC
 from functools import wraps
-from typing import Any, Callable, Coroutine, List, Optional, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import asyncodbc
 import pyodbc
@@ -13,6 +24,8 @@ from tortoise.backends.base.client import (
     NestedTransactionContext,
     PoolConnectionWrapper,
     TransactionContext,
+    instrumented,
+    instrumented_iter,
 )
 from tortoise.backends.odbc.executor import ODBCExecutor
 from tortoise.exceptions import (
@@ -24,6 +37,7 @@ from tortoise.exceptions import (
 
 T = TypeVar("T")
 FuncType = Callable[..., Coroutine[None, None, T]]
+IterFuncType = Callable[..., AsyncGenerator[T, None]]
 ConnWrapperType = Union[
     ConnectionWrapper[asyncodbc.Connection], PoolConnectionWrapper[asyncodbc.Connection]
 ]
@@ -46,7 +60,31 @@ def translate_exceptions(func: FuncType) -> FuncType:
         except (pyodbc.IntegrityError, pyodbc.Error) as exc:
             raise IntegrityError(exc)
 
-    return translate_exceptions_
+    return instrumented(translate_exceptions_)
+
+
+def translate_exceptions_iter(func: IterFuncType) -> IterFuncType:
+    @wraps(func)
+    async def translate_exceptions_iter_(self, *args) -> AsyncGenerator[T, None]:
+        iterator = func(self, *args)
+        try:
+            async for item in iterator:
+                yield item
+        except (
+            pyodbc.OperationalError,
+            pyodbc.ProgrammingError,
+            pyodbc.DataError,
+            pyodbc.InternalError,
+            pyodbc.NotSupportedError,
+            pyodbc.InterfaceError,
+        ) as exc:
+            raise OperationalError(exc)
+        except (pyodbc.IntegrityError, pyodbc.Error) as exc:
+            raise IntegrityError(exc)
+        finally:
+            await iterator.aclose()
+
+    return instrumented_iter(translate_exceptions_iter_)
 
 
 class ODBCClient(BaseDBAsyncClient, ABC):
@@ -60,6 +98,7 @@ class ODBCClient(BaseDBAsyncClient, ABC):
         self._kwargs = kwargs.copy()
         self._kwargs.pop("connection_name", None)
         self._kwargs.pop("fetch_inserted", None)
+        self._kwargs.pop("slow_query_threshold", None)
         self.database = self._kwargs.pop("database", None)
         self.minsize = self._kwargs.pop("minsize", 1)
         self.maxsize = self._kwargs.pop("maxsize", 10)
@@ -91,6 +130,11 @@ class ODBCClient(BaseDBAsyncClient, ABC):
         except pyodbc.InterfaceError:
             raise DBConnectionError(f"Can't establish connection to database {self.database}")
 
+    def _get_pool_sizes(self) -> Optional[Tuple[int, int]]:
+        if not self._pool:
+            return None
+        return self._pool.size, self._pool.freesize
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             for conn in self._pool._free:
@@ -154,6 +198,21 @@ class ODBCClient(BaseDBAsyncClient, ABC):
     async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
         return (await self.execute_query(query, values))[1]
 
+    @translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            async with connection.cursor() as cursor:
+                if values:
+                    await cursor.execute(query, values)
+                else:
+                    await cursor.execute(query)
+                fields = [c[0] for c in cursor.description]
+                while rows := await cursor.fetchmany(chunk_size):
+                    yield [dict(zip(fields, row)) for row in rows]
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -169,6 +228,8 @@ class ODBCTransactionWrapper(BaseTransactionWrapper):
         self._connection: asyncodbc.Connection = connection._connection
         self._lock = asyncio.Lock()
         self.log = connection.log
+        self.instrumentation = connection.instrumentation
+        self.slow_query_threshold = connection.slow_query_threshold
         self._finalized: Optional[bool] = None
         self.fetch_inserted = connection.fetch_inserted
         self._parent = connection
@@ -179,6 +240,16 @@ class ODBCTransactionWrapper(BaseTransactionWrapper):
     def acquire_connection(self) -> ConnWrapperType:
         return ConnectionWrapper(self._lock, self)
 
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        # Without MARS the connection can't run other statements while a cursor is open,
+        # so inside a transaction the resultset is fetched up front.
+        async for rows in BaseDBAsyncClient.execute_query_iter(
+            self, query, values, chunk_size  # type: ignore[arg-type]
+        ):
+            yield rows
+
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
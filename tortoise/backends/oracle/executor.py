@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 
 class OracleExecutor(ODBCExecutor):
+    # Oracle allows at most 1000 expressions in an IN list
+    PREFETCH_CHUNK_SIZE = 1000
+
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         sql = "SELECT SEQUENCE_NAME FROM ALL_TAB_IDENTITY_COLS where TABLE_NAME = ? and OWNER = ?"
         db = cast("OracleClient", self.db)
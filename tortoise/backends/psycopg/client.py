@@ -1,12 +1,14 @@
 import asyncio
 import typing
 from contextlib import _AsyncGeneratorContextManager
+from itertools import count
 from ssl import SSLContext
 
 import psycopg
 import psycopg.conninfo
 import psycopg.pq
 import psycopg.rows
+import psycopg.sql
 import psycopg_pool
 from pypika.dialects.postgresql import PostgreSQLQuery, PostgreSQLQueryBuilder
 from pypika.terms import Parameterizer
@@ -132,6 +134,26 @@ class PsycopgClient(postgres_client.BasePostgresClient):
                 self.log.debug("%s: %s", query, values)
                 await cursor.executemany(query, values)
 
+    @postgres_client.translate_exceptions
+    async def execute_copy(
+        self,
+        table: str,
+        columns: typing.Sequence[str],
+        values: typing.List[list],
+        schema: typing.Optional[str] = None,
+    ) -> None:
+        query = psycopg.sql.SQL("COPY {} ({}) FROM STDIN").format(
+            psycopg.sql.Identifier(schema, table) if schema else psycopg.sql.Identifier(table),
+            psycopg.sql.SQL(", ").join(map(psycopg.sql.Identifier, columns)),
+        )
+        connection: psycopg.AsyncConnection
+        async with self.acquire_connection() as connection:
+            async with connection.cursor() as cursor:
+                self.log.debug("%s: %s", query.as_string(connection), values)
+                async with cursor.copy(query) as copy:
+                    for row in values:
+                        await copy.write_row(row)
+
     @postgres_client.translate_exceptions
     async def execute_query(
         self,
@@ -155,12 +177,67 @@ class PsycopgClient(postgres_client.BasePostgresClient):
 
                 return rowcount, typing.cast(typing.List[dict], rows)
 
+    @postgres_client.translate_exceptions
+    async def execute_pipeline(
+        self, queries: typing.Sequence[typing.Tuple[str, typing.Optional[list]]]
+    ) -> typing.List[typing.Tuple[int, typing.List[dict]]]:
+        connection: psycopg.AsyncConnection
+        async with self.acquire_connection() as connection:
+            cursors: typing.List[psycopg.AsyncCursor[dict]] = []
+            try:
+                async with connection.pipeline() as pipeline:
+                    for query, values in queries:
+                        cursor = connection.cursor(row_factory=psycopg.rows.dict_row)
+                        cursors.append(cursor)
+                        self.log.debug("%s: %s", query, values)
+                        await cursor.execute(query, values)
+                    # Sends all the statements, and waits for all the results
+                    await pipeline.sync()
+
+                    results = []
+                    for cursor in cursors:
+                        rowcount = int(cursor.rowcount or cursor.rownumber or 0)
+                        if (
+                            cursor.pgresult
+                            and cursor.pgresult.status == psycopg.pq.ExecStatus.TUPLES_OK
+                        ):
+                            rows = await cursor.fetchall()
+                        else:
+                            rows = []
+                        results.append((rowcount, typing.cast(typing.List[dict], rows)))
+                    return results
+            finally:
+                for cursor in cursors:
+                    await cursor.close()
+
     async def execute_query_dict(
         self, query: str, values: typing.Optional[list] = None
     ) -> typing.List[dict]:
         rowcount, rows = await self.execute_query(query, values, row_factory=psycopg.rows.dict_row)
         return rows
 
+    @postgres_client.translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: typing.Optional[list] = None, chunk_size: int = 2000
+    ) -> typing.AsyncGenerator[typing.Sequence[dict], None]:
+        connection: psycopg.AsyncConnection
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            # Server-side cursors are only available inside a transaction
+            async with connection.transaction():
+                async with connection.cursor(
+                    name=_gen_cursor_name(), row_factory=psycopg.rows.dict_row
+                ) as cursor:
+                    await cursor.execute(query, values)
+                    while rows := await cursor.fetchmany(chunk_size):
+                        yield rows
+
+    def _get_pool_sizes(self) -> typing.Optional[typing.Tuple[int, int]]:
+        if not self._pool:
+            return None
+        stats = self._pool.get_stats()
+        return stats.get("pool_size", 0), stats.get("pool_available", 0)
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             await self._pool.close()
@@ -211,6 +288,8 @@ class TransactionWrapper(PsycopgClient, base_client.BaseTransactionWrapper):
         self._connection: psycopg.AsyncConnection = connection._connection
         self._lock = asyncio.Lock()
         self.log = connection.log
+        self.instrumentation = connection.instrumentation
+        self.slow_query_threshold = connection.slow_query_threshold
         self.connection_name = connection.connection_name
         self._transaction: typing.Optional[
             _AsyncGeneratorContextManager[psycopg.AsyncTransaction]
@@ -226,6 +305,28 @@ class TransactionWrapper(PsycopgClient, base_client.BaseTransactionWrapper):
     def acquire_connection(self) -> base_client.ConnectionWrapper[psycopg.AsyncConnection]:
         return base_client.ConnectionWrapper(self._lock, self)
 
+    @postgres_client.translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: typing.Optional[list] = None, chunk_size: int = 2000
+    ) -> typing.AsyncGenerator[typing.Sequence[dict], None]:
+        connection: psycopg.AsyncConnection
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            cursor = connection.cursor(name=_gen_cursor_name(), row_factory=psycopg.rows.dict_row)
+            await cursor.execute(query, values)
+        try:
+            while True:
+                # The lock is only held while fetching, so the consumer can run other
+                # queries (e.g. prefetching) in this transaction between chunks.
+                async with self.acquire_connection():
+                    rows = await cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            async with self.acquire_connection():
+                await cursor.close()
+
     @postgres_client.translate_exceptions
     async def begin(self) -> None:
         self._transaction = self._connection.transaction()
@@ -257,3 +358,7 @@ class TransactionWrapper(PsycopgClient, base_client.BaseTransactionWrapper):
 
     async def savepoint_rollback(self) -> None:
         await self.rollback()
+
+
+def _gen_cursor_name(_c=count()) -> str:
+    return f"tortoise_cursor_{next(_c)}"
@@ -1,10 +1,12 @@
 import asyncio
 import os
 import sqlite3
+import time
 from functools import wraps
 from itertools import count
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     Coroutine,
     List,
@@ -26,9 +28,12 @@ from tortoise.backends.base.client import (
     NestedTransactionContext,
     T_conn,
     TransactionContext,
+    instrumented,
+    instrumented_iter,
 )
 from tortoise.backends.sqlite.executor import SqliteExecutor
 from tortoise.backends.sqlite.schema_generator import SqliteSchemaGenerator
+from tortoise.cache import query_cache
 from tortoise.connection import connections
 from tortoise.exceptions import (
     IntegrityError,
@@ -38,6 +43,7 @@ from tortoise.exceptions import (
 
 T = TypeVar("T")
 FuncType = Callable[..., Coroutine[None, None, T]]
+IterFuncType = Callable[..., AsyncGenerator[T, None]]
 
 
 def translate_exceptions(func: FuncType) -> FuncType:
@@ -50,7 +56,24 @@ def translate_exceptions(func: FuncType) -> FuncType:
         except sqlite3.IntegrityError as exc:
             raise IntegrityError(exc)
 
-    return translate_exceptions_
+    return instrumented(translate_exceptions_)
+
+
+def translate_exceptions_iter(func: IterFuncType) -> IterFuncType:
+    @wraps(func)
+    async def translate_exceptions_iter_(self, query, *args) -> AsyncGenerator[T, None]:
+        iterator = func(self, query, *args)
+        try:
+            async for item in iterator:
+                yield item
+        except sqlite3.OperationalError as exc:
+            raise OperationalError(exc)
+        except sqlite3.IntegrityError as exc:
+            raise IntegrityError(exc)
+        finally:
+            await iterator.aclose()
+
+    return instrumented_iter(translate_exceptions_iter_)
 
 
 class SqliteClient(BaseDBAsyncClient):
@@ -58,7 +81,16 @@ class SqliteClient(BaseDBAsyncClient):
     query_class = SQLLiteQuery
     schema_generator = SqliteSchemaGenerator
     capabilities = Capabilities(
-        "sqlite", daemon=False, requires_limit=True, inline_comment=True, support_for_update=False
+        "sqlite",
+        daemon=False,
+        requires_limit=True,
+        inline_comment=True,
+        support_for_update=False,
+        # Row values are supported since SQLite 3.15
+        support_row_values=sqlite3.sqlite_version_info >= (3, 15, 0),
+        # RETURNING is supported since SQLite 3.35
+        support_upsert=sqlite3.sqlite_version_info >= (3, 35, 0),
+        support_window_functions=sqlite3.sqlite_version_info >= (3, 25, 0),
     )
 
     def __init__(self, file_path: str, **kwargs: Any) -> None:
@@ -68,6 +100,7 @@ class SqliteClient(BaseDBAsyncClient):
         self.pragmas = kwargs.copy()
         self.pragmas.pop("connection_name", None)
         self.pragmas.pop("fetch_inserted", None)
+        self.pragmas.pop("slow_query_threshold", None)
         self.pragmas.setdefault("journal_mode", "WAL")
         self.pragmas.setdefault("journal_size_limit", 16384)
         self.pragmas.setdefault("foreign_keys", "ON")
@@ -130,9 +163,10 @@ class SqliteClient(BaseDBAsyncClient):
             return (await connection.execute_insert(query, values))[0]
 
     @translate_exceptions
-    async def execute_many(self, query: str, values: List[list]) -> None:
+    async def execute_many(self, query: str, values: List[list]) -> int:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
+            start = connection.total_changes
             # This code is only ever called in AUTOCOMMIT mode
             await connection.execute("BEGIN")
             try:
@@ -142,6 +176,7 @@ class SqliteClient(BaseDBAsyncClient):
                 raise
             else:
                 await connection.commit()
+            return connection.total_changes - start
 
     @translate_exceptions
     async def execute_query(
@@ -161,6 +196,26 @@ class SqliteClient(BaseDBAsyncClient):
             self.log.debug("%s: %s", query, values)
             return list(map(dict, await connection.execute_fetchall(query, values)))
 
+    @translate_exceptions_iter
+    async def execute_query_iter(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 2000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        query = query.replace("\x00", "'||CHAR(0)||'")
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            cursor = await connection.execute(query, values)
+        try:
+            while True:
+                # The lock is only held while fetching, so the consumer can run other
+                # queries (e.g. prefetching) on this connection between chunks.
+                async with self.acquire_connection():
+                    rows = await cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            await cursor.close()
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -177,7 +232,7 @@ class SqliteTransactionContext(TransactionContext):
     on the connection object itself.
     """
 
-    __slots__ = ("connection", "connection_name", "token", "_trxlock")
+    __slots__ = ("connection", "connection_name", "token", "instrumentation", "_trxlock")
 
     def __init__(self, connection: Any, trxlock: asyncio.Lock) -> None:
         self.connection = connection
@@ -191,23 +246,35 @@ class SqliteTransactionContext(TransactionContext):
 
     async def __aenter__(self) -> T_conn:
         await self.ensure_connection()
-        await self._trxlock.acquire()
+        self.instrumentation = self.connection.instrumentation
+        if self.instrumentation is None:
+            await self._trxlock.acquire()
+        else:
+            start = time.perf_counter()
+            await self._trxlock.acquire()
+            self.instrumentation.on_acquire(self.connection_name, time.perf_counter() - start)
         self.token = connections.set(self.connection_name, self.connection)
         await self.connection.begin()
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         try:
-            if not self.connection._finalized:
-                if exc_type:
-                    # Can't rollback a transaction that already failed.
-                    if exc_type is not TransactionManagementError:
-                        await self.connection.rollback()
-                else:
-                    await self.connection.commit()
+            try:
+                if not self.connection._finalized:
+                    if exc_type:
+                        # Can't rollback a transaction that already failed.
+                        if exc_type is not TransactionManagementError:
+                            await self.connection.rollback()
+                    else:
+                        await self.connection.commit()
+            finally:
+                # Before the connection can be reused by another transaction
+                await query_cache.end_transaction(self.connection)
         finally:
             connections.reset(self.token)
             self._trxlock.release()
+            if self.instrumentation is not None:
+                self.instrumentation.on_release(self.connection_name)
 
 
 class SqliteTransactionWrapper(SqliteClient, BaseTransactionWrapper):
@@ -217,6 +284,8 @@ class SqliteTransactionWrapper(SqliteClient, BaseTransactionWrapper):
         self._lock = asyncio.Lock()
         self._savepoint: Optional[str] = None
         self.log = connection.log
+        self.instrumentation = connection.instrumentation
+        self.slow_query_threshold = connection.slow_query_threshold
         self._finalized = False
         self.fetch_inserted = connection.fetch_inserted
         self._parent = connection
@@ -225,11 +294,13 @@ class SqliteTransactionWrapper(SqliteClient, BaseTransactionWrapper):
         return NestedTransactionContext(SqliteTransactionWrapper(self))
 
     @translate_exceptions
-    async def execute_many(self, query: str, values: List[list]) -> None:
+    async def execute_many(self, query: str, values: List[list]) -> int:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
+            start = connection.total_changes
             # Already within transaction, so ideal for performance
             await connection.executemany(query, values)
+            return connection.total_changes - start
 
     async def begin(self) -> None:
         try:
@@ -1,9 +1,11 @@
 import datetime
 import sqlite3
 from decimal import Decimal
-from typing import Optional, Type, Union
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
 
 import pytz
+from pypika.queries import QueryBuilder
+from pypika.terms import Criterion, Term, ValueWrapper
 
 from tortoise import Model, fields, timezone
 from tortoise.backends.base.executor import BaseExecutor
@@ -16,6 +18,7 @@ from tortoise.fields import (
     SmallIntField,
     TimeField,
 )
+from tortoise.filters import is_in, json_array_values, not_in
 
 
 def to_db_bool(
@@ -82,6 +85,41 @@ def to_db_time(
 sqlite3.register_adapter(Decimal, str)
 
 
+class _RowValue:
+    """
+    Stands for the value at an index of each row of values of a statement executed
+    with ``execute_many()``.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+def _has_json_each() -> bool:
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.execute("SELECT value FROM json_each('[]')")
+    except sqlite3.OperationalError:  # pragma: nocoverage
+        return False
+    finally:
+        connection.close()
+    return True
+
+
+def sqlite_json_in(field: Term, value: Any) -> Criterion:
+    if (values := json_array_values(value, "json_each", SqliteExecutor.IN_JSON_THRESHOLD)) is None:
+        return is_in(field, value)
+    return field.isin(values)
+
+
+def sqlite_json_not_in(field: Term, value: Any) -> Criterion:
+    if (values := json_array_values(value, "json_each", SqliteExecutor.IN_JSON_THRESHOLD)) is None:
+        return not_in(field, value)
+    return field.notin(values) | field.isnull()
+
+
 class SqliteExecutor(BaseExecutor):
     TO_DB_OVERRIDE = {
         fields.BooleanField: to_db_bool,
@@ -89,8 +127,87 @@ class SqliteExecutor(BaseExecutor):
         fields.DatetimeField: to_db_datetime,
         fields.TimeField: to_db_time,
     }
+    FILTER_FUNC_OVERRIDE = {
+        is_in: sqlite_json_in,
+        not_in: sqlite_json_not_in,
+    }
     EXPLAIN_PREFIX = "EXPLAIN QUERY PLAN"
     DB_NATIVE = {bytes, str, int, float}
+    # From this number of values, __in filters bind the values as a single JSON array
+    # parameter, so that the statement doesn't depend on the number of values
+    IN_JSON_THRESHOLD: Optional[int] = 100 if _has_json_each() else None
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32.0
+    BULK_INSERT_MAX_PARAMS = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+    # Leaves room for the parameters of the filters of the prefetch queryset
+    PREFETCH_CHUNK_SIZE = BULK_INSERT_MAX_PARAMS - 99
+
+    # The UPDATE statement is prepared once and executed for each object
+    BULK_UPDATE_MIN_ROWS = 20
+    # RETURNING is supported since SQLite 3.35
+    BULK_INSERT_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+    def get_bulk_update_queries(
+        self, query: QueryBuilder, objects: Sequence[Model], fields: Sequence[str]
+    ) -> Optional[List[Tuple[str, list, bool]]]:
+        meta = self.model._meta
+        for index, field in enumerate(fields, 1):
+            query = query.set(meta.fields_db_projection[field], ValueWrapper(_RowValue(index)))
+        query = query.where(meta.basetable[meta.db_pk_column] == ValueWrapper(_RowValue(0)))
+        sql, values = query.get_parameterized_sql()
+        return [
+            (
+                sql,
+                [
+                    [
+                        row[value.index] if isinstance(value, _RowValue) else value
+                        for value in values
+                    ]
+                    for row in self._bulk_update_rows(objects, fields)
+                ],
+                True,
+            )
+        ]
+
+    async def _execute_upsert(
+        self, instance: Model, update_fields: Sequence[str], on_conflict: Sequence[str]
+    ) -> Tuple[bool, dict]:
+        # SQLite can't tell whether an upsert inserted or updated the row, so the row is
+        # inserted unless it conflicts, then updated if it wasn't inserted
+        meta = self.model._meta
+        columns, values = self._upsert_values(instance)
+        returning = " RETURNING " + ",".join(f'"{column}"' for column in meta.db_fields)
+        insert_sql = (
+            self._prepare_insert_statement([meta.fields_db_projection[field] for field in columns])
+            .on_conflict(*(meta.fields_db_projection[field] for field in on_conflict))
+            .do_nothing()
+            .get_sql()
+        ) + returning
+        query, query_values = self._conflicting_row_query(
+            columns, values, update_fields, on_conflict
+        )
+        row_sql = query.get_sql() + (returning if update_fields else "")
+        while True:
+            rows = await self.db.execute_query_dict(insert_sql, values)
+            if rows:
+                return True, rows[0]
+            # The conflicting row can be deleted in between
+            rows = await self.db.execute_query_dict(row_sql, query_values)
+            if rows:
+                return False, rows[0]
+
+    async def _insert_returning(self, instances: List[Model], values_lists: List[list]) -> None:
+        if not self.BULK_INSERT_RETURNING:
+            await super()._insert_returning(instances, values_lists)
+            return
+        pk_column = self.model._meta.db_pk_column
+        sql = f'{self.get_bulk_insert_sql(len(values_lists))[0]} RETURNING "{pk_column}"'
+        rows = await self.db.execute_query_dict(
+            sql, [value for row in values_lists for value in row]
+        )
+        # The order of the rows of RETURNING is arbitrary, but the rowids of the rows inserted
+        # by a statement increase in the order of the VALUES
+        for instance, pk in zip(instances, sorted(row[pk_column] for row in rows)):
+            await self._process_insert_result(instance, pk)
 
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         pk_field_object = self.model._meta.pk
@@ -0,0 +1,302 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pypika import Table
+from pypika.queries import QueryBuilder
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import Model
+
+
+class CacheBackend:
+    """
+    Store of the query result cache.
+
+    Entries are the rows of a query, as a list of dicts, keyed by a string derived from
+    the connection name, the parametrized SQL and its parameters. Each entry is tagged
+    with the tables the query read from, so writes can invalidate it.
+
+    Subclass it to keep results in an external store, e.g. Redis.
+    The rows contain the values as returned by the DB driver, so such a backend
+    has to serialize them (e.g. with :mod:`pickle`).
+    """
+
+    async def get(self, key: str) -> Optional[List[dict]]:
+        """
+        Returns the rows stored for the key, or ``None`` if there are none or they expired.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def set(
+        self, key: str, rows: List[dict], ttl: Optional[float], tables: FrozenSet[str]
+    ) -> None:
+        """
+        Stores the rows of a query.
+
+        :param key: The key of the query.
+        :param rows: The rows to store.
+        :param ttl: The time to live of the entry in seconds, ``None`` to keep it until
+            invalidated.
+        :param tables: The names of the tables the query read from.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def invalidate(self, tables: Iterable[str]) -> None:
+        """
+        Discards all entries tagged with any of the given tables.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def clear(self) -> None:
+        """
+        Discards all entries.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+
+class InMemoryCache(CacheBackend):
+    """
+    A LRU cache in the memory of the process, the default backend.
+
+    :param max_entries: The maximum number of entries, the least recently used
+        are evicted beyond it.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], List[dict], FrozenSet[str]]]" = (
+            OrderedDict()
+        )
+        self._keys_by_table: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: str) -> None:
+        _, _, tables = self._entries.pop(key)
+        for table in tables:
+            keys = self._keys_by_table[table]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_table[table]
+
+    async def get(self, key: str) -> Optional[List[dict]]:
+        try:
+            expires, rows, _ = self._entries[key]
+        except KeyError:
+            return None
+        if expires is not None and expires <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return rows
+
+    async def set(
+        self, key: str, rows: List[dict], ttl: Optional[float], tables: FrozenSet[str]
+    ) -> None:
+        if key in self._entries:
+            self._discard(key)
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires, rows, tables)
+        for table in tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    async def invalidate(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            for key in list(self._keys_by_table.get(table, ())):
+                self._discard(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_table.clear()
+
+
+class QueryCache:
+    """
+    The query result cache, used by the queries of models with ``cache = True``
+    in their ``Meta`` and by querysets with ``.cache()``.
+
+    Writes through the ORM invalidate the entries of the tables they modify once done,
+    or once their transaction ends, as other connections see the rows from before the
+    writes until then. A version of each table is kept, so that a query reading while
+    a write is running doesn't store its rows after the write invalidated the table.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        self.backend: CacheBackend = backend or InMemoryCache()
+        #: Whether any query used the cache, the writes don't invalidate it until then
+        self.used = False
+        self._versions: Dict[str, int] = {}
+        # The tables written in the open transactions, by their DB connection
+        self._pending: Dict[Any, Set[str]] = {}
+        self._model_tables: "Dict[Type[Model], List[str]]" = {}
+
+    def set_backend(self, backend: CacheBackend) -> None:
+        """
+        Replaces the backend. The entries of the previous one aren't used anymore.
+        """
+        self.backend = backend
+
+    @staticmethod
+    def make_key(connection_name: str, sql: str, values: Optional[list]) -> str:
+        return hashlib.sha256(repr((connection_name, sql, values)).encode()).hexdigest()
+
+    async def fetch(
+        self,
+        connection_name: str,
+        sql: str,
+        values: Optional[list],
+        ttl: Optional[float],
+        tables: FrozenSet[str],
+        execute: Callable[[str, Optional[list]], Awaitable[Tuple[int, Sequence[Any]]]],
+    ) -> List[dict]:
+        """
+        Returns the rows of the query from the cache, executing it on a miss.
+
+        :param connection_name: The name of the connection the query is run on.
+        :param sql: The parametrized SQL of the query.
+        :param values: The parameters of the query.
+        :param ttl: The time to live of the entry in seconds, ``None`` for no expiry.
+        :param tables: The names of the tables the query reads from.
+        :param execute: Runs the query, like ``execute_query()`` of the clients.
+        :return: Copies of the rows, as dicts, which the caller can modify.
+        """
+        self.used = True
+        key = self.make_key(connection_name, sql, values)
+        rows = await self.backend.get(key)
+        if rows is None:
+            versions = [self._versions.get(table, 0) for table in tables]
+            rows = [dict(row) for row in (await execute(sql, values))[1]]
+            if versions == [self._versions.get(table, 0) for table in tables]:
+                await self.backend.set(key, rows, ttl, tables)
+        return [dict(row) for row in rows]
+
+    async def invalidate(
+        self, tables: Iterable[str], connection: "Optional[BaseDBAsyncClient]" = None
+    ) -> None:
+        """
+        Discards the cached results of the queries reading from any of the tables.
+
+        :param connection: The connection the tables were written with. If it is
+            a transaction, the results are discarded once it ends instead.
+        """
+        from tortoise.backends.base.client import BaseTransactionWrapper
+
+        transaction: Any = connection
+        if isinstance(transaction, BaseTransactionWrapper):
+            # Nested transactions share the DB connection of the outermost one
+            self._pending.setdefault(transaction._connection, set()).update(tables)  # type: ignore
+            return
+        tables = list(tables)
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+        await self.backend.invalidate(tables)
+
+    async def invalidate_model(
+        self, model: "Type[Model]", connection: "Optional[BaseDBAsyncClient]" = None
+    ) -> None:
+        """
+        Discards the cached results of the queries reading from the table of the model,
+        or from tables a delete from it can cascade to.
+
+        :param connection: The connection the model was written with, see :meth:`invalidate`.
+        """
+        try:
+            tables = self._model_tables[model]
+        except KeyError:
+            tables = self._model_tables[model] = get_model_tables(model)
+        await self.invalidate(tables, connection)
+
+    async def end_transaction(self, connection: "BaseDBAsyncClient") -> None:
+        """
+        Discards the cached results of the queries reading from the tables written
+        in the transaction, once it is committed or rolled back.
+
+        :param connection: The outermost transaction.
+        """
+        # A reader on another connection may have cached the rows from before the commit
+        tables = self._pending.pop(connection._connection, None)  # type: ignore
+        if tables:
+            await self.invalidate(tables)
+
+    async def clear(self) -> None:
+        """
+        Discards all cached results.
+        """
+        self._model_tables.clear()
+        await self.backend.clear()
+
+
+def get_model_tables(model: "Type[Model]") -> List[str]:
+    """
+    Returns the table of the model, followed by the tables of the models and
+    many-to-many relations that reference it, recursively.
+    """
+    tables: List[str] = []
+    pending = [model]
+    while pending:
+        meta = pending.pop()._meta
+        if meta.db_table in tables:
+            continue
+        tables.append(meta.db_table)
+        for field_name in meta.m2m_fields:
+            tables.append(meta.fields_map[field_name].through)  # type: ignore
+        for field_name in meta.backward_fk_fields | meta.backward_o2o_fields:
+            pending.append(meta.fields_map[field_name].related_model)  # type: ignore
+    return tables
+
+
+def get_query_tables(query: QueryBuilder) -> FrozenSet[str]:
+    """
+    Returns the names of the tables the query reads from, including joined tables
+    and tables of subqueries.
+    """
+    from tortoise.expressions import Subquery
+
+    tables: Set[str] = set()
+    node: Any
+    pending = [query]
+    while pending:
+        query = pending.pop()
+        terms = [
+            *query._from,
+            *(join.item for join in query._joins),
+            *query._selects,
+            query._wheres,
+            query._havings,
+        ]
+        for term in terms:
+            if term is None:
+                continue
+            for node in term.nodes_():
+                if isinstance(node, Table):
+                    tables.add(node._table_name)
+                elif isinstance(node, QueryBuilder) and node is not query:
+                    pending.append(node)
+                elif isinstance(node, Subquery):
+                    # Built when the SQL of the outer query was
+                    pending.append(node.query.query)
+    return frozenset(tables)
+
+
+#: The query result cache
+query_cache = QueryCache()
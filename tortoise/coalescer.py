@@ -0,0 +1,125 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.backends.base.executor import BaseExecutor
+    from tortoise.models import Model
+
+
+class _Batch:
+    __slots__ = ("executor", "items", "handle")
+
+    def __init__(self, executor: "BaseExecutor") -> None:
+        self.executor = executor
+        self.items: List[Tuple["Model", asyncio.Future]] = []
+        self.handle: Optional[asyncio.Handle] = None
+
+
+class InsertCoalescer:
+    """
+    Coalesces the inserts of single objects, e.g. by ``Model.create()`` or ``.save()``,
+    of the models with the ``coalesce_inserts`` ``Meta`` option.
+
+    Inserts for the same model and connection issued within ``max_delay`` seconds of
+    the first one, or in the same iteration of the event loop if it is ``0``, are done
+    together with a multi-row insert setting the generated primary keys on the objects,
+    as soon as ``max_batch_size`` objects are waiting or the delay is over.
+
+    Inserts in transactions aren't coalesced. If the insert of a batch fails, its objects
+    are inserted one by one, so that only the saves of the offending objects fail.
+    A cancelled save doesn't cancel the insert of its object.
+
+    :param max_batch_size: The maximum number of objects inserted together.
+    :param max_delay: How long the first insert of a batch waits for others, in seconds.
+    """
+
+    def __init__(self, max_batch_size: int = 500, max_delay: float = 0.0) -> None:
+        #: Whether inserts are coalesced
+        self.enabled = True
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._batches: Dict[Tuple[Any, ...], _Batch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def accepts(self, instance: "Model", db: "BaseDBAsyncClient") -> bool:
+        """
+        Returns whether the insert of the object on the connection is coalesced.
+        """
+        from tortoise.backends.base.client import BaseTransactionWrapper
+
+        return (
+            self.enabled
+            and instance._meta.coalesce_inserts
+            and not isinstance(db, BaseTransactionWrapper)
+        )
+
+    async def insert(self, executor: "BaseExecutor", instance: "Model") -> None:
+        """
+        Inserts the object with the next batch of its model and connection,
+        and returns once it is inserted.
+
+        :param executor: The executor of the model for the connection.
+        :param instance: The object to insert.
+        """
+        # Objects with and without a primary key are inserted with different statements
+        key = (executor.model, executor.db, instance._custom_generated_pk)
+        loop = asyncio.get_running_loop()
+        try:
+            batch = self._batches[key]
+        except KeyError:
+            batch = self._batches[key] = _Batch(executor)
+            if self.max_delay > 0:
+                batch.handle = loop.call_later(self.max_delay, self._dispatch, key)
+            else:
+                batch.handle = loop.call_soon(self._dispatch, key)
+        future = loop.create_future()
+        batch.items.append((instance, future))
+        if len(batch.items) >= self.max_batch_size:
+            batch.handle.cancel()  # type: ignore
+            self._dispatch(key)
+        await future
+
+    def _dispatch(self, key: Tuple[Any, ...]) -> None:
+        batch = self._batches.pop(key)
+        task = asyncio.ensure_future(self._insert(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _insert(self, batch: _Batch) -> None:
+        executor = batch.executor
+        try:
+            if len(batch.items) == 1:
+                await executor.execute_insert(batch.items[0][0])
+            else:
+                await executor.execute_bulk_insert(
+                    [instance for instance, _ in batch.items], return_pks=True
+                )
+        except Exception as exc:
+            if len(batch.items) == 1:
+                self._resolve(batch.items[0][1], exc)
+                return
+            for instance, future in batch.items:
+                try:
+                    await executor.execute_insert(instance)
+                except Exception as error:
+                    self._resolve(future, error)
+                else:
+                    self._resolve(future)
+        else:
+            for _, future in batch.items:
+                self._resolve(future)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, exc: Optional[BaseException] = None) -> None:
+        if future.done():
+            # The save was cancelled
+            return
+        if exc is None:
+            future.set_result(None)
+        else:
+            future.set_exception(exc)
+
+
+#: The coalescer of the inserts of the models with the ``coalesce_inserts`` ``Meta`` option
+insert_coalescer = InsertCoalescer()
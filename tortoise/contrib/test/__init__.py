@@ -22,6 +22,7 @@ from unittest import SkipTest, expectedFailure, skip, skipIf, skipUnless
 
 from tortoise import Model, Tortoise, connections
 from tortoise.backends.base.config_generator import generate_config as _generate_config
+from tortoise.cache import query_cache
 from tortoise.exceptions import DBConnectionError, OperationalError
 
 if sys.version_info >= (3, 10):
@@ -294,6 +295,7 @@ class TruncationTestCase(SimpleTestCase):
                 await model._meta.db.execute_script(
                     f"DELETE FROM {quote_char}{model._meta.db_table}{quote_char}"  # nosec
                 )
+        await query_cache.clear()
         await super()._tearDownDB()
 
 
@@ -17,6 +17,7 @@ from typing import (
 from pypika import Table
 from typing_extensions import Literal
 
+from tortoise.cache import query_cache
 from tortoise.exceptions import ConfigurationError, NoValuesFetched, OperationalError
 from tortoise.fields.base import CASCADE, SET_NULL, Field, OnDelete
 
@@ -197,6 +198,8 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             for pk_f in pks_f_to_insert:
                 query = query.insert(pk_f, pk_b)
             await db.execute_query(*query.get_parameterized_sql())
+            if query_cache.used:
+                await query_cache.invalidate((self.field.through,), db)
 
     async def clear(self, using_db: "Optional[BaseDBAsyncClient]" = None) -> None:
         """
@@ -240,6 +243,8 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
                 )
         query = db.query_class.from_(through_table).where(condition).delete()
         await db.execute_query(*query.get_parameterized_sql())
+        if query_cache.used:
+            await query_cache.invalidate((self.field.through,), db)
 
 
 class RelationalField(Field[MODEL]):
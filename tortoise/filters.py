@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import operator
 from functools import partial
 from typing import (
@@ -8,6 +9,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     Optional,
     Tuple,
     TypedDict,
@@ -16,7 +18,7 @@ from typing import (
 from pypika import Table
 from pypika.enums import DatePart, Matching, SqlTypes
 from pypika.functions import Cast, Extract, Upper
-from pypika.terms import BasicCriterion, Criterion, Equality, Term, ValueWrapper
+from pypika.terms import BasicCriterion, Criterion, Equality, NodeT, Term, ValueWrapper
 from typing_extensions import NotRequired
 
 from tortoise.fields import Field, JSONField
@@ -48,6 +50,41 @@ def escape_like(val: str) -> str:
     return val.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+class JSONArrayValues(Term):
+    """
+    A subquery selecting the values of a JSON array bound as a single parameter,
+    with the table-valued JSON function of the dialect, e.g. ``json_each`` on SQLite.
+    """
+
+    def __init__(self, array: str, function: str) -> None:
+        super().__init__()
+        self.array = ValueWrapper(array)
+        self.function = function
+
+    def nodes_(self) -> Iterator[NodeT]:
+        yield self  # type: ignore[misc]
+        yield from self.array.nodes_()
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return f"(SELECT value FROM {self.function}({self.array.get_sql(**kwargs)}))"
+
+
+def json_array_values(
+    value: Any, function: str, threshold: Optional[int]
+) -> Optional[JSONArrayValues]:
+    """
+    Returns the values of an ``__in`` filter as a :class:`JSONArrayValues` subquery,
+    if there are at least ``threshold`` of them and they can be encoded as JSON.
+    """
+    if threshold is None or isinstance(value, Term) or len(value) < max(threshold, 1):
+        return None
+    try:
+        array = json.dumps(list(value), allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return JSONArrayValues(array, function)
+
+
 ##############################################################################
 # Encoders
 # Should be type: (Any, instance: "Model", field: Field) -> type:
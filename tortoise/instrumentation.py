@@ -0,0 +1,226 @@
+import bisect
+from typing import Dict, List, Optional, Sequence, Tuple
+
+#: Default upper bounds (in seconds) of the buckets of :class:`Histogram`
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Instrumentation:
+    """
+    Hooks called by the DB clients, to collect metrics about connections and queries.
+
+    Subclass it and override the hooks you need, then set it on a client:
+
+    .. code-block:: python3
+
+        connections.get("default").instrumentation = MyInstrumentation()
+
+    All hooks do nothing by default. They are called inline, so they should be cheap
+    and must not raise.
+    """
+
+    def on_acquire(self, connection_name: str, wait: float) -> None:
+        """
+        Called when a connection has been acquired from the pool, for a query or for
+        the whole of a transaction, or the single connection of a client without a pool
+        has been locked. The queries run in a transaction don't acquire a connection.
+
+        :param connection_name: The name of the connection.
+        :param wait: The time spent waiting for the connection, in seconds.
+        """
+
+    def on_release(self, connection_name: str) -> None:
+        """
+        Called when a connection acquired before is released.
+
+        :param connection_name: The name of the connection.
+        """
+
+    def on_query(self, connection_name: str, query: str, duration: float, rows: int) -> None:
+        """
+        Called when a query has been executed.
+
+        :param connection_name: The name of the connection.
+        :param query: The parametrized SQL of the query (or the table name for ``COPY``),
+            so queries only differing in parameters are reported together.
+        :param duration: The time spent executing the query, in seconds.
+        :param rows: The number of rows returned.
+        """
+
+    def on_query_error(
+        self, connection_name: str, query: str, duration: float, exc: BaseException
+    ) -> None:
+        """
+        Called when executing a query raised an error.
+
+        :param connection_name: The name of the connection.
+        :param query: The parametrized SQL of the query (or the table name for ``COPY``).
+        :param duration: The time spent until the error, in seconds.
+        :param exc: The raised exception.
+        """
+
+
+class Histogram:
+    """
+    A histogram of observed values, with fixed buckets.
+
+    :param buckets: The sorted upper bounds of the buckets. Values above the last one
+        are counted in an extra, unbounded bucket.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """
+        Returns the ``(upper bound, count of values <= upper bound)`` pairs of the buckets,
+        the last bound being ``inf``, as exported by Prometheus.
+        """
+        result = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class QueryStats:
+    """
+    Statistics of the executions of a query.
+    """
+
+    __slots__ = ("count", "errors", "rows", "total_time", "max_time")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def observe(self, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+
+
+class InMemoryCollector(Instrumentation):
+    """
+    Collects the metrics of the DB clients it is set on in memory,
+    to be read or exported periodically.
+
+    .. attribute:: acquire_wait
+        :annotation: Dict[str, Histogram]
+
+        The histogram of the connection acquire wait times, by connection name.
+
+    .. attribute:: query_time
+        :annotation: Dict[str, Histogram]
+
+        The histogram of the query durations, by connection name.
+
+    .. attribute:: in_use
+        :annotation: Dict[str, int]
+
+        The number of connections currently acquired, by connection name.
+
+    .. attribute:: max_in_use
+        :annotation: Dict[str, int]
+
+        The maximum number of connections acquired at once, by connection name.
+
+    .. attribute:: queries
+        :annotation: Dict[Tuple[str, str], QueryStats]
+
+        The statistics of each query, by connection name and query.
+
+    :param buckets: The upper bounds of the buckets of the histograms, in seconds.
+    :param max_queries: The maximum number of distinct queries to keep statistics for.
+        Queries beyond it are only counted in the histograms.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, max_queries: Optional[int] = 1000
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.max_queries = max_queries
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discards all collected metrics.
+        """
+        self.acquire_wait: Dict[str, Histogram] = {}
+        self.query_time: Dict[str, Histogram] = {}
+        self.in_use: Dict[str, int] = {}
+        self.max_in_use: Dict[str, int] = {}
+        self.queries: Dict[Tuple[str, str], QueryStats] = {}
+
+    def on_acquire(self, connection_name: str, wait: float) -> None:
+        try:
+            histogram = self.acquire_wait[connection_name]
+        except KeyError:
+            histogram = self.acquire_wait[connection_name] = Histogram(self.buckets)
+        histogram.observe(wait)
+        in_use = self.in_use[connection_name] = self.in_use.get(connection_name, 0) + 1
+        if in_use > self.max_in_use.get(connection_name, 0):
+            self.max_in_use[connection_name] = in_use
+
+    def on_release(self, connection_name: str) -> None:
+        self.in_use[connection_name] = self.in_use.get(connection_name, 1) - 1
+
+    def _observe_query(self, connection_name: str, duration: float) -> None:
+        try:
+            histogram = self.query_time[connection_name]
+        except KeyError:
+            histogram = self.query_time[connection_name] = Histogram(self.buckets)
+        histogram.observe(duration)
+
+    def _get_query_stats(self, connection_name: str, query: str) -> Optional[QueryStats]:
+        key = (connection_name, query)
+        try:
+            return self.queries[key]
+        except KeyError:
+            if self.max_queries is not None and len(self.queries) >= self.max_queries:
+                return None
+            stats = self.queries[key] = QueryStats()
+            return stats
+
+    def on_query(self, connection_name: str, query: str, duration: float, rows: int) -> None:
+        self._observe_query(connection_name, duration)
+        if (stats := self._get_query_stats(connection_name, query)) is not None:
+            stats.observe(duration)
+            stats.rows += rows
+
+    def on_query_error(
+        self, connection_name: str, query: str, duration: float, exc: BaseException
+    ) -> None:
+        self._observe_query(connection_name, duration)
+        if (stats := self._get_query_stats(connection_name, query)) is not None:
+            stats.observe(duration)
+            stats.errors += 1
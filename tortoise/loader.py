@@ -0,0 +1,132 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from tortoise.session import get_session
+from tortoise.utils import chunk
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+    from tortoise.queryset import QuerySet
+
+MODEL = TypeVar("MODEL", bound="Model")
+
+
+class PkLoader:
+    """
+    Batches the lookups of single objects by primary key, e.g. ``Model.get(pk=...)``,
+    ``.get_or_none(pk=...)`` or awaiting a foreign key, and ``in_bulk()``, of the models
+    with the ``batch_pk_lookups`` ``Meta`` option.
+
+    Lookups for the same model and connection issued in the same iteration of the event loop,
+    e.g. by coroutines run with ``asyncio.gather()``, are resolved together with a single
+    ``pk__in`` query, or a plain lookup if there is only one primary key.
+
+    :param max_batch_size: The maximum number of primary keys looked up by a query.
+    """
+
+    def __init__(self, max_batch_size: int = 500) -> None:
+        #: Whether lookups are batched
+        self.enabled = True
+        self.max_batch_size = max_batch_size
+        self._batches: Dict[Tuple[Any, ...], Dict[Any, asyncio.Future]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def accepts(self, model: "Type[Model]") -> bool:
+        """
+        Returns whether the lookups of the model by primary key are batched.
+        """
+        return self.enabled and model._meta.batch_pk_lookups
+
+    def _get_future(self, queryset: "QuerySet[MODEL]", pk: Any) -> asyncio.Future:
+        # Lookups are only batched with the ones that would run the same query
+        key = (
+            queryset.model,
+            queryset._db,
+            get_session(),
+            queryset._use_cache,
+            queryset._cache_ttl,
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            batch = self._batches[key]
+        except KeyError:
+            batch = self._batches[key] = {}
+            loop.call_soon(self._dispatch, key)
+        try:
+            return batch[pk]
+        except KeyError:
+            future = batch[pk] = loop.create_future()
+            return future
+
+    async def load(self, queryset: "QuerySet[MODEL]", pk: Any) -> Optional[MODEL]:
+        """
+        Returns the object with the primary key, or ``None`` if it doesn't exist.
+
+        :param queryset: A queryset of the model without filters, to run the lookup with.
+        :param pk: The primary key, as a Python value.
+        """
+        # Shielded, as other lookups of the same primary key wait for the same future
+        return await asyncio.shield(self._get_future(queryset, pk))
+
+    async def load_many(self, queryset: "QuerySet[MODEL]", pks: Iterable[Any]) -> List[MODEL]:
+        """
+        Returns the objects with the primary keys that exist, in the order of the keys.
+
+        :param queryset: A queryset of the model without filters, to run the lookup with.
+        :param pks: The primary keys, as Python values.
+        """
+        futures = [self._get_future(queryset, pk) for pk in dict.fromkeys(pks)]
+        return [obj for obj in await asyncio.gather(*map(asyncio.shield, futures)) if obj]
+
+    def _dispatch(self, key: Tuple[Any, ...]) -> None:
+        batch = self._batches.pop(key)
+        task = asyncio.ensure_future(self._fetch(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, key: Tuple[Any, ...], batch: Dict[Any, asyncio.Future]) -> None:
+        from tortoise.queryset import QuerySet
+
+        model, db, _, use_cache, cache_ttl = key
+        pk_attr = model._meta.pk_attr
+        try:
+            objs = {}
+            for pks in chunk(list(batch), self.max_batch_size):
+                pks = list(pks)
+                queryset = QuerySet(model).using_db(db)
+                if use_cache is not None:
+                    queryset = queryset.cache(cache_ttl, use_cache)
+                if len(pks) == 1:
+                    queryset = queryset.filter(**{pk_attr: pks[0]})
+                else:
+                    queryset = queryset.filter(**{f"{pk_attr}__in": pks})
+                for obj in await queryset:
+                    objs[obj.pk] = obj
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for pk, future in batch.items():
+                if not future.done():
+                    future.set_result(objs.get(pk))
+        finally:
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+
+
+#: The loader batching the lookups by primary key of the models with the ``batch_pk_lookups``
+#: ``Meta`` option
+pk_loader = PkLoader()
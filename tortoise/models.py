@@ -11,6 +11,7 @@ from typing import (
     Generator,
     Iterable,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -27,6 +28,8 @@ from typing_extensions import Self
 
 from tortoise import connections
 from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base.executor import BaseExecutor
+from tortoise.coalescer import insert_coalescer
 from tortoise.exceptions import (
     ConfigurationError,
     DoesNotExist,
@@ -218,8 +221,14 @@ class MetaInfo:
         "db_native_fields",
         "db_default_fields",
         "db_complex_fields",
+        "hydrator",
+        "_prefixed_hydrators",
         "_default_ordering",
         "_ordering_validated",
+        "cache",
+        "cache_ttl",
+        "coalesce_inserts",
+        "batch_pk_lookups",
     )
 
     def __init__(self, meta: "Model.Meta") -> None:
@@ -232,6 +241,10 @@ class MetaInfo:
         self.indexes: Tuple[Tuple[str, ...], ...] = get_together(meta, "indexes")
         self._default_ordering: Tuple[Tuple[str, Order], ...] = prepare_default_ordering(meta)
         self._ordering_validated: bool = False
+        self.cache: bool = getattr(meta, "cache", False)
+        self.cache_ttl: Optional[float] = getattr(meta, "cache_ttl", None)
+        self.coalesce_inserts: bool = getattr(meta, "coalesce_inserts", False)
+        self.batch_pk_lookups: bool = getattr(meta, "batch_pk_lookups", False)
         self.fields: Set[str] = set()
         self.db_fields: Set[str] = set()
         self.m2m_fields: Set[str] = set()
@@ -259,6 +272,8 @@ class MetaInfo:
         self.db_native_fields: List[Tuple[str, str, Field]] = []
         self.db_default_fields: List[Tuple[str, str, Field]] = []
         self.db_complex_fields: List[Tuple[str, str, Field]] = []
+        self.hydrator: Optional[Callable[[Mapping[str, Any]], "Model"]] = None
+        self._prefixed_hydrators: Dict[str, Optional[Callable[[Mapping[str, Any]], "Model"]]] = {}
 
     @property
     def full_name(self) -> str:
@@ -476,6 +491,75 @@ class MetaInfo:
             else:
                 self.db_complex_fields.append((key, model_field, field))
 
+        self.hydrator = self._generate_hydrator()
+        self._prefixed_hydrators = {}
+
+    def get_hydrator(self, prefix: str = "") -> Optional[Callable[[Mapping[str, Any]], "Model"]]:
+        """
+        Returns the hydrator for rows where the db fields of this model are named
+        ``{prefix}{db_field}``, e.g. the columns of a ``select_related()`` model.
+        """
+        if not prefix:
+            return self.hydrator
+        try:
+            return self._prefixed_hydrators[prefix]
+        except KeyError:
+            hydrator = self._prefixed_hydrators[prefix] = self._generate_hydrator(prefix)
+            return hydrator
+
+    def _generate_hydrator(
+        self, prefix: str = ""
+    ) -> Optional[Callable[[Mapping[str, Any]], "Model"]]:
+        """
+        Generates the function that creates a model instance from a DB row with all db fields.
+
+        The function is straight-line code over the fields, and writes the instance ``__dict__``
+        at once, since ``Model.__setattr__`` has nothing to do for the db fields of a fetched
+        instance. Models that override ``__setattr__`` or put descriptors on db fields
+        don't get a hydrator.
+        """
+        model = self._model
+        if model.__setattr__ is not Model.__setattr__ or any(
+            hasattr(type(inspect.getattr_static(model, model_field, None)), "__set__")
+            for *_, model_field, __ in (
+                *self.db_native_fields,
+                *self.db_default_fields,
+                *self.db_complex_fields,
+            )
+        ):
+            return None
+
+        namespace: Dict[str, Any] = {"model": model, "new": model.__new__}
+        items = [
+            "'_partial': False",
+            "'_saved_in_db': True",
+            f"'_custom_generated_pk': {self.db_pk_column not in self.generated_db_fields}",
+            "'_await_when_save': {}",
+        ]
+        for key, model_field, _ in self.db_native_fields:
+            items.append(f"{model_field!r}: row[{prefix + key!r}]")
+        for idx, (key, model_field, field) in enumerate(self.db_default_fields):
+            namespace[f"field_type_{idx}"] = field.field_type
+            items.append(
+                f"{model_field!r}: None if (value := row[{prefix + key!r}]) is None"
+                f" else field_type_{idx}(value)"
+            )
+        for idx, (key, model_field, field) in enumerate(self.db_complex_fields):
+            namespace[f"to_python_{idx}"] = field.to_python_value
+            items.append(f"{model_field!r}: to_python_{idx}(row[{prefix + key!r}])")
+        source = "\n".join(
+            (
+                "def hydrate(row):",
+                "    instance = new(model)",
+                "    instance.__dict__ = {",
+                *(f"        {item}," for item in items),
+                "    }",
+                "    return instance",
+            )
+        )
+        exec(source, namespace)  # nosec
+        return namespace["hydrate"]
+
     def _generate_filters(self) -> None:
         get_overridden_filter_func = self.db.executor_class.get_overridden_filter_func
         for key, filter_info in self._filters.items():
@@ -730,6 +814,18 @@ class Model(metaclass=ModelMeta):
 
     @classmethod
     def _init_from_db(cls: Type[MODEL], **kwargs: Any) -> MODEL:
+        return cls._init_from_db_row(kwargs)
+
+    @classmethod
+    def _init_from_db_row(cls: Type[MODEL], row: Mapping[str, Any]) -> MODEL:
+        if (hydrator := cls._meta.hydrator) is not None:
+            try:
+                return cast(MODEL, hydrator(row))
+            except (KeyError, IndexError):
+                # Partial row, e.g. from .only(). sqlite3.Row raises IndexError
+                pass
+        kwargs = row if isinstance(row, dict) else dict(row)
+
         self = cls.__new__(cls)
         self._partial = False
         self._saved_in_db = True
@@ -970,7 +1066,7 @@ class Model(metaclass=ModelMeta):
         await self._pre_save(db, update_fields)
 
         if force_create:
-            await executor.execute_insert(self)
+            await self._insert(executor)
             created = True
         elif force_update:
             rows = await executor.execute_update(self, update_fields)
@@ -980,19 +1076,26 @@ class Model(metaclass=ModelMeta):
         else:
             if self._saved_in_db or update_fields:
                 if self.pk is None:
-                    await executor.execute_insert(self)
+                    await self._insert(executor)
                     created = True
                 else:
                     await executor.execute_update(self, update_fields)
                     created = False
             else:
-                # TODO: Do a merge/upsert operation here instead. Let the executor determine an optimal strategy for each DB engine.
-                await executor.execute_insert(self)
+                # Not an upsert: saving a new object must fail if it already exists,
+                # Model.upsert() inserts or updates in a single statement
+                await self._insert(executor)
                 created = True
 
         self._saved_in_db = True
         await self._post_save(db, created, update_fields)
 
+    async def _insert(self, executor: BaseExecutor) -> None:
+        if insert_coalescer.accepts(self, executor.db):
+            await insert_coalescer.insert(executor, self)
+        else:
+            await executor.execute_insert(self)
+
     async def delete(self, using_db: Optional[BaseDBAsyncClient] = None) -> None:
         """
         Deletes the current model object.
@@ -1155,6 +1258,115 @@ class Model(metaclass=ModelMeta):
                 return instance, False
         return await cls._create_or_get(db, defaults, **kwargs)
 
+    @classmethod
+    async def upsert(
+        cls: Type[MODEL],
+        defaults: Optional[dict] = None,
+        using_db: Optional[BaseDBAsyncClient] = None,
+        **kwargs: Any,
+    ) -> Tuple[MODEL, bool]:
+        """
+        Inserts an object with the given kwargs and defaults, or updates the defaults of the
+        object that already exists with the given kwargs, in a single statement.
+
+        The kwargs must be the fields of a unique constraint: the primary key, a unique field
+        or the fields of a ``unique_together``. As the object is inserted if it doesn't exist,
+        the kwargs and defaults must provide the required fields.
+
+        .. code-block:: python3
+
+            user, created = await User.upsert(email="...", defaults={"name": "..."})
+
+        Uses ``INSERT ... ON CONFLICT`` on PostgreSQL and SQLite, and ``MERGE`` on MSSQL.
+        On other databases it behaves like :meth:`update_or_create`. MySQL is one of them,
+        as ``ON DUPLICATE KEY UPDATE`` would also update a row conflicting on another unique key.
+
+        Unlike :meth:`update_or_create`, the save signals get the fields of the defaults and
+        the ``auto_now`` fields as ``update_fields``, whether the object is created or updated.
+
+        :param defaults: The values to set on the object, whether it is created or updated.
+        :param using_db: Specific DB connection to use instead of default bound
+        :param kwargs: The fields of a unique constraint identifying the object.
+        :raises ParamsError: If the kwargs aren't the fields of a unique constraint,
+            or if defaults conflict with kwargs
+        :return: The object and whether it was created.
+        """
+        if not defaults:
+            defaults = {}
+        on_conflict = cls._get_conflict_fields(kwargs)
+        if not on_conflict:
+            raise ParamsError(
+                f"{cls.__name__}.upsert() must be given the fields of a unique constraint,"
+                f" got {', '.join(kwargs)}"
+            )
+        db = using_db or cls._choose_db(True)
+        if not db.capabilities.support_upsert:
+            return await cls.update_or_create(defaults, db, **kwargs)
+        instance = cls._init_for_upsert(defaults, kwargs)
+        await instance._set_async_default_field()
+        return instance, await instance._upsert(db, defaults, on_conflict)
+
+    @classmethod
+    def _get_db_field(cls, name: str) -> str:
+        """
+        Returns the name of the field of the column filtered or set by the given argument name.
+        """
+        meta = cls._meta
+        if name == "pk":
+            return meta.pk_attr
+        if name in meta.fk_fields or name in meta.o2o_fields:
+            return cast(str, meta.fields_map[name].source_field)
+        return name
+
+    @classmethod
+    def _get_conflict_fields(cls, kwargs: dict) -> Optional[Tuple[str, ...]]:
+        """
+        Returns the fields of the unique constraint the kwargs are the fields of, if any.
+        """
+        meta = cls._meta
+        fields = dict.fromkeys(cls._get_db_field(name) for name in kwargs)
+        constraints = [
+            {meta.pk_attr},
+            *({cls._get_db_field(name)} for name, field in meta.fields_map.items() if field.unique),
+            *(
+                {cls._get_db_field(name) for name in unique_fields}
+                for unique_fields in meta.unique_together
+            ),
+        ]
+        if fields.keys() in constraints:
+            return tuple(fields)
+        return None
+
+    @classmethod
+    def _init_for_upsert(cls: Type[MODEL], defaults: dict, kwargs: dict) -> MODEL:
+        for key in defaults.keys() & kwargs.keys():
+            if (default_value := defaults[key]) != (query_value := kwargs[key]):
+                raise ParamsError(f"Conflict value with {key=}: {default_value=} vs {query_value=}")
+        # pk= wouldn't mark a generated primary key as provided
+        values = {**kwargs, **defaults}
+        if "pk" in values:
+            values[cls._meta.pk_attr] = values.pop("pk")
+        return cls(**values)
+
+    async def _upsert(
+        self, db: BaseDBAsyncClient, defaults: dict, on_conflict: Tuple[str, ...]
+    ) -> bool:
+        meta = self._meta
+        update_fields = [
+            *(self._get_db_field(name) for name in defaults),
+            *(
+                field
+                for field, field_object in meta.fields_map.items()
+                if getattr(field_object, "auto_now", False) and field not in defaults
+            ),
+        ]
+        await self._pre_save(db, update_fields)
+        executor = db.executor_class(model=self.__class__, db=db)
+        created = await executor.execute_upsert(self, update_fields, on_conflict)
+        self._saved_in_db = True
+        await self._post_save(db, created, update_fields)
+        return created
+
     @classmethod
     async def create(
         cls: Type[MODEL], using_db: Optional[BaseDBAsyncClient] = None, **kwargs: Any
@@ -1194,6 +1406,10 @@ class Model(metaclass=ModelMeta):
         Update the given fields in each of the given objects in the database.
         This method efficiently updates the given fields on the provided model instances, generally with one query.
 
+        Batches of at least 20 objects are updated with a statement joining the table to the
+        values of the objects on PostgreSQL and MySQL, and with a single prepared statement
+        executed for each object on SQLite. Smaller batches use a ``CASE`` expression per field.
+
         .. code-block:: python3
 
             users = [
@@ -1238,6 +1454,8 @@ class Model(metaclass=ModelMeta):
         update_fields: Optional[Iterable[str]] = None,
         on_conflict: Optional[Iterable[str]] = None,
         using_db: Optional[BaseDBAsyncClient] = None,
+        method: str = "insert",
+        return_pks: bool = False,
     ) -> "BulkCreateQuery[MODEL]":
         """
         Bulk insert operation:
@@ -1247,7 +1465,7 @@ class Model(metaclass=ModelMeta):
             created in the DB has all the defaults and generated fields set,
             but may be incomplete reference in Python.
 
-            e.g. ``IntField`` primary keys will not be populated.
+            e.g. ``IntField`` primary keys will not be populated, unless ``return_pks`` is set.
 
         This is recommended only for throw away inserts where you want to ensure optimal
         insert performance.
@@ -1265,9 +1483,13 @@ class Model(metaclass=ModelMeta):
         :param objects: List of objects to bulk create
         :param batch_size: How many objects are created in a single query
         :param using_db: Specific DB connection to use instead of default bound
+        :param method: ``"insert"`` (default) or ``"copy"`` to load the objects with ``COPY``
+            on databases that support it, falling back to ``"insert"`` elsewhere.
+        :param return_pks: Set the generated primary keys on the objects, and mark them as
+            saved, with ``INSERT ... RETURNING`` or its equivalent.
         """
         return cls._db_queryset(using_db, for_write=True).bulk_create(
-            objects, batch_size, ignore_conflicts, update_fields, on_conflict
+            objects, batch_size, ignore_conflicts, update_fields, on_conflict, method, return_pks
         )
 
     @classmethod
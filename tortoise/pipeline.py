@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Set, Tuple
+
+from tortoise.backends.base.client import BaseDBAsyncClient, BaseTransactionWrapper
+from tortoise.queryset import AwaitableQuery, BulkCreateQuery, DeleteQuery, UpdateQuery
+
+# Queries that are routed to the database for writes
+_WRITE_QUERIES = (UpdateQuery, DeleteQuery, BulkCreateQuery)
+
+# The statements queued for a connection, with the futures of their results
+_Pending = List[Tuple[str, Optional[list], asyncio.Future]]
+
+
+class PipelineClient:
+    """
+    Stands in for a client while the queries of a :class:`QueryPipeline` run: the statements
+    the queries execute with ``execute_query()`` or ``execute_query_dict()`` are queued on
+    the pipeline instead, everything else is done by the client itself.
+    """
+
+    def __init__(self, pipeline: "QueryPipeline", db: BaseDBAsyncClient) -> None:
+        self._pipeline = pipeline
+        self._db = db
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._db, attr)
+
+    async def execute_query(
+        self, query: str, values: Optional[list] = None
+    ) -> Tuple[int, Sequence[dict]]:
+        return await self._pipeline.execute(self._db, query, values)
+
+    async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
+        _, rows = await self._pipeline.execute(self._db, query, values)
+        return [dict(row) for row in rows]
+
+
+class TransactionPipelineClient(PipelineClient, BaseTransactionWrapper):
+    """
+    A :class:`PipelineClient` for a transaction, so that queries still see it as one,
+    e.g. to bypass the result cache.
+    """
+
+
+class QueryPipeline:
+    """
+    Sends the statements of queries run together to the database in as few round trips
+    as possible, see :meth:`tortoise.Tortoise.batch`.
+
+    The statements queued for the same connection in the same iteration of the event loop
+    are executed together with ``execute_pipeline()`` of the client, so the statements of
+    later steps of the queries, e.g. prefetching, are batched together again.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[BaseDBAsyncClient, PipelineClient] = {}
+        self._pending: Dict[BaseDBAsyncClient, _Pending] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def client(self, db: BaseDBAsyncClient) -> PipelineClient:
+        """
+        Returns the client queueing the statements for the connection on the pipeline.
+        """
+        try:
+            return self._clients[db]
+        except KeyError:
+            client_class = (
+                TransactionPipelineClient
+                if isinstance(db, BaseTransactionWrapper)
+                else PipelineClient
+            )
+            client = self._clients[db] = client_class(self, db)
+            return client
+
+    async def execute(
+        self, db: BaseDBAsyncClient, query: str, values: Optional[list] = None
+    ) -> Tuple[int, Sequence[dict]]:
+        """
+        Queues the statement for the connection, and returns its result once executed.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            pending = self._pending[db]
+        except KeyError:
+            pending = self._pending[db] = []
+            loop.call_soon(self._dispatch, db)
+        future = loop.create_future()
+        pending.append((query, values, future))
+        return await future
+
+    async def run(self, *queries: Awaitable[Any]) -> List[Any]:
+        """
+        Runs the queries concurrently with their statements pipelined,
+        and returns their results in order.
+
+        :raises: The first exception raised by a query, once all of them are done.
+        """
+        for query in queries:
+            self._use_pipeline(query)
+        results = await asyncio.gather(*queries, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _use_pipeline(self, query: Any) -> None:
+        if isinstance(query, AwaitableQuery) and not isinstance(query._db, PipelineClient):
+            query._choose_db_if_not_chosen(
+                isinstance(query, _WRITE_QUERIES) or getattr(query, "_select_for_update", False)
+            )
+            query._db = self.client(query._db)  # type: ignore
+
+    def _dispatch(self, db: BaseDBAsyncClient) -> None:
+        pending = self._pending.pop(db)
+        task = asyncio.ensure_future(self._execute(db, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, db: BaseDBAsyncClient, pending: _Pending) -> None:
+        try:
+            results = await db.execute_pipeline([(query, values) for query, values, _ in pending])
+        except Exception as exc:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, _, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
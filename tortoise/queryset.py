@@ -1,16 +1,27 @@
+import array
+import base64
+import binascii
+import datetime
+import enum
+import json
 import types
 from copy import copy
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
+    Coroutine,
     Dict,
+    FrozenSet,
     Generator,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -25,9 +36,15 @@ from pypika.analytics import Count
 from pypika.functions import Cast
 from pypika.queries import QueryBuilder
 from pypika.terms import Case, Field, Star, Term, ValueWrapper
+from pypika.terms import Tuple as RowValue
 from typing_extensions import Literal, Protocol
 
-from tortoise.backends.base.client import BaseDBAsyncClient, Capabilities
+from tortoise.backends.base.client import (
+    BaseDBAsyncClient,
+    BaseTransactionWrapper,
+    Capabilities,
+)
+from tortoise.cache import get_query_tables, query_cache
 from tortoise.exceptions import (
     DoesNotExist,
     FieldError,
@@ -42,6 +59,7 @@ from tortoise.fields.relational import (
     RelationalField,
 )
 from tortoise.filters import FilterInfoDict
+from tortoise.loader import pk_loader
 from tortoise.query_utils import (
     Prefetch,
     QueryModifier,
@@ -49,12 +67,24 @@ from tortoise.query_utils import (
     get_joins_for_related_field,
 )
 from tortoise.router import router
+from tortoise.session import get_session
 from tortoise.utils import chunk
 
+numpy: Any
+try:
+    import numpy
+except ImportError:  # pragma: nocoverage
+    numpy = None
+
 # Empty placeholder - Should never be edited.
 
 QUERY: QueryBuilder = QueryBuilder()
 
+# Parameterized SQL, select_related indexes and read tables of model querysets, by query shape.
+# A shape maps to None if its SQL can't be reused.
+QUERY_SHAPE_CACHE: Dict[Tuple[Any, ...], Optional[Tuple[str, list, FrozenSet[str]]]] = {}
+QUERY_SHAPE_CACHE_SIZE = 1024
+
 if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.models import Model
 
@@ -63,6 +93,76 @@ T_co = TypeVar("T_co", covariant=True)
 SINGLE = TypeVar("SINGLE", bound=bool)
 
 
+class Page(Generic[MODEL]):
+    """
+    A page of objects returned by :meth:`QuerySet.page_after`.
+
+    .. attribute:: items
+        :annotation: List[Model]
+
+        The objects of the page.
+
+    .. attribute:: next_cursor
+        :annotation: Optional[str]
+
+        The cursor to pass to :meth:`QuerySet.page_after` to get the next page,
+        or ``None`` if this is the last page.
+    """
+
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items: List[MODEL], next_cursor: Optional[str]) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self) -> Iterator[MODEL]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def _encode_cursor(orderings: List[Tuple[str, Order]], values: List[Any]) -> str:
+    """
+    Encodes the values of the ordering fields of the last object of a page into a cursor.
+    """
+    encoded = []
+    for value in values:
+        if isinstance(value, enum.Enum):
+            value = value.value
+        if isinstance(value, (datetime.date, datetime.time)):
+            value = value.isoformat()
+        elif not isinstance(value, (str, int, float)):
+            value = str(value)
+        encoded.append(value)
+    data = json.dumps(
+        [[name, order.value] for name, order in orderings] + [encoded], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(data.encode()).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str, orderings: List[Tuple[str, Order]]) -> List[Any]:
+    """
+    Decodes the values of a cursor created by :func:`_encode_cursor` for the same orderings.
+
+    :raises ParamsError: If the cursor is invalid or was created for other orderings.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        *cursor_orderings, values = data
+    except (ValueError, TypeError, binascii.Error):
+        raise ParamsError("Invalid cursor")
+    if cursor_orderings != [[name, order.value] for name, order in orderings] or not (
+        isinstance(values, list) and len(values) == len(orderings)
+    ):
+        raise ParamsError("Cursor doesn't match the ordering of the QuerySet")
+    return values
+
+
 class QuerySetSingle(Protocol[T_co]):
     """
     Awaiting on this will resolve a single instance of the Model object, and not a sequence.
@@ -83,6 +183,10 @@ class QuerySetSingle(Protocol[T_co]):
 
     def only(self, *fields_for_select: str) -> "QuerySetSingle[T_co]": ...  # pragma: nocoverage
 
+    def cache(
+        self, ttl: Optional[float] = None, enabled: bool = True
+    ) -> "QuerySetSingle[T_co]": ...  # pragma: nocoverage
+
     def values_list(
         self, *fields_: str, flat: bool = False
     ) -> "ValuesListQuery[Literal[True]]": ...  # pragma: nocoverage
@@ -92,6 +196,51 @@ class QuerySetSingle(Protocol[T_co]):
     ) -> "ValuesQuery[Literal[True]]": ...  # pragma: nocoverage
 
 
+def _get_q_shape(model: "Type[Model]", q: Q, values: list) -> Optional[Tuple[Any, ...]]:
+    """
+    Returns the shape of a Q object, and appends the values of its filters to ``values``
+    in the same way as resolving it would. Returns ``None`` if it can't be predicted.
+    """
+    meta = model._meta
+    filters = []
+    value: Any
+    for key, value in q.filters.items():
+        if isinstance(value, (Term, Expression, AwaitableQuery)):
+            return None
+        filters.append((key, type(value)))
+        if key in meta.fk_fields or key in meta.o2o_fields:
+            key = cast(str, meta.fields_map[key].source_field)
+            value = getattr(value, "pk", value)
+        elif key in meta.m2m_fields:
+            value = getattr(value, "pk", value)
+        elif key not in meta.filters:
+            return None
+
+        if value is None and f"{key}__isnull" in meta.filters:
+            param = meta.get_filter(f"{key}__isnull")
+            value = True
+        else:
+            param = meta.get_filter(key)
+        if param.get("table"):
+            if param.get("value_encoder"):
+                value = param["value_encoder"](value, model)
+        else:
+            field_object = meta.fields_map[param["field"]]
+            if param.get("value_encoder"):
+                value = param["value_encoder"](value, model, field_object)
+            else:
+                value = field_object.to_db_value(value, model)
+        values.append(value)
+
+    children = []
+    for child in q.children:
+        child_shape = _get_q_shape(model, child, values)
+        if child_shape is None:
+            return None
+        children.append(child_shape)
+    return q.join_type, q._is_negated, tuple(filters), tuple(children)
+
+
 class AwaitableQuery(Generic[MODEL]):
     __slots__ = (
         "query",
@@ -102,6 +251,8 @@ class AwaitableQuery(Generic[MODEL]):
         "_annotations",
         "_custom_filters",
         "_q_objects",
+        "_use_cache",
+        "_cache_ttl",
     )
 
     def __init__(self, model: Type[MODEL]) -> None:
@@ -113,6 +264,8 @@ class AwaitableQuery(Generic[MODEL]):
         self._annotations: Dict[str, Union[Expression, Term]] = {}
         self._custom_filters: Dict[str, FilterInfoDict] = {}
         self._q_objects: List[Q] = []
+        self._use_cache: Optional[bool] = None
+        self._cache_ttl: Optional[float] = None
 
     def _choose_db(self, for_write: bool = False) -> BaseDBAsyncClient:
         """
@@ -306,6 +459,28 @@ class AwaitableQuery(Generic[MODEL]):
     async def _execute(self) -> Any:
         raise NotImplementedError()  # pragma: nocoverage
 
+    def _uses_result_cache(self) -> bool:
+        use_cache = self.model._meta.cache if self._use_cache is None else self._use_cache
+        # Uncommitted writes of a transaction mustn't be seen outside of it
+        return use_cache and not isinstance(self._db, BaseTransactionWrapper)
+
+    async def _fetch_cached(
+        self, sql: str, values: list, tables: Optional[FrozenSet[str]] = None
+    ) -> List[dict]:
+        """
+        Returns the rows of the query from the result cache, executing it on a miss.
+
+        :param tables: The tables the query reads from, taken from ``self.query`` if not given.
+        """
+        return await query_cache.fetch(
+            self._db.connection_name,
+            sql,
+            values,
+            self.model._meta.cache_ttl if self._cache_ttl is None else self._cache_ttl,
+            get_query_tables(self.query) if tables is None else tables,
+            self._db.execute_query,
+        )
+
 
 class QuerySet(AwaitableQuery[MODEL]):
     __slots__ = (
@@ -331,6 +506,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         "_select_related_idx",
         "_use_indexes",
         "_force_indexes",
+        "_keyset",
     )
 
     def __init__(self, model: Type[MODEL]) -> None:
@@ -358,6 +534,8 @@ class QuerySet(AwaitableQuery[MODEL]):
         ] = []  # format with: model,idx,model_name,parent_model
         self._force_indexes: Set[str] = set()
         self._use_indexes: Set[str] = set()
+        # Orderings and DB values of the object that rows have to come after
+        self._keyset: Optional[Tuple[List[Tuple[str, Order]], List[Any]]] = None
 
     def _clone(self) -> "QuerySet[MODEL]":
         queryset = self.__class__.__new__(self.__class__)
@@ -390,6 +568,9 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._select_related_idx = self._select_related_idx
         queryset._force_indexes = self._force_indexes
         queryset._use_indexes = self._use_indexes
+        queryset._keyset = self._keyset
+        queryset._use_cache = self._use_cache
+        queryset._cache_ttl = self._cache_ttl
         return queryset
 
     def _filter_or_exclude(self, *args: Q, negate: bool, **kwargs: Any) -> "QuerySet[MODEL]":
@@ -572,6 +753,26 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._distinct = True
         return queryset
 
+    def cache(self, ttl: Optional[float] = None, enabled: bool = True) -> "QuerySet[MODEL]":
+        """
+        Make QuerySet use the query result cache, or not if ``enabled=False``,
+        overriding the ``cache`` option of the ``Meta`` of the model.
+
+        The results are cached by the SQL and parameters of the query, and discarded
+        on writes through the ORM to the tables the query reads from.
+        ``.values()``, ``.values_list()`` and ``.count()`` of the QuerySet are cached too.
+        Queries inside a transaction and ``SELECT ... FOR UPDATE`` are never cached.
+
+        :param ttl: The time to live of the results in seconds, the ``cache_ttl`` option
+            of the ``Meta`` of the model if not given. If both are ``None``, the results
+            are kept until invalidated.
+        :param enabled: Whether to use the cache.
+        """
+        queryset = self._clone()
+        queryset._use_cache = enabled
+        queryset._cache_ttl = ttl
+        return queryset
+
     def select_for_update(
         self, nowait: bool = False, skip_locked: bool = False, of: Tuple[str, ...] = ()
     ) -> "QuerySet[MODEL]":
@@ -616,7 +817,19 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._group_bys = fields
         return queryset
 
-    def values_list(self, *fields_: str, flat: bool = False) -> "ValuesListQuery[Literal[False]]":
+    @overload
+    def values_list(
+        self, *fields_: str, flat: bool = False, as_columns: Literal[False] = False
+    ) -> "ValuesListQuery[Literal[False]]": ...
+
+    @overload
+    def values_list(
+        self, *fields_: str, flat: bool = False, as_columns: Literal[True]
+    ) -> Coroutine[Any, Any, Dict[str, Any]]: ...
+
+    def values_list(
+        self, *fields_: str, flat: bool = False, as_columns: bool = False
+    ) -> Union["ValuesListQuery[Literal[False]]", Coroutine[Any, Any, Dict[str, Any]]]:
         """
         Make QuerySet returns list of tuples for given args instead of objects.
 
@@ -624,13 +837,21 @@ class QuerySet(AwaitableQuery[MODEL]):
 
         If ```flat=True`` and only one arg is passed can return flat list or just scalar.
 
+        If ``as_columns=True`` the result is a dict of field name to column instead,
+        as returned by :meth:`ValuesListQuery.to_arrays`.
+
         If no arguments are passed it will default to a tuple containing all fields
         in order of declaration.
+
+        :raises TypeError: If ``as_columns=True`` is used with ``flat=True``
+            or on a single object query.
         """
+        if as_columns and (flat or self._single):
+            raise TypeError("as_columns can't be used with flat or single object queries")
         fields_for_select_list = fields_ or [
             field for field in self.model._meta.fields_map if field in self.model._meta.db_fields
         ] + list(self._annotations.keys())
-        return ValuesListQuery(
+        query: "ValuesListQuery[Literal[False]]" = ValuesListQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -648,6 +869,11 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        query._use_cache = self._use_cache
+        query._cache_ttl = self._cache_ttl
+        if as_columns:
+            return query.to_arrays()
+        return query
 
     def values(self, *args: str, **kwargs: str) -> "ValuesQuery[Literal[False]]":
         """
@@ -681,7 +907,7 @@ class QuerySet(AwaitableQuery[MODEL]):
 
             fields_for_select = {field: field for field in _fields}
 
-        return ValuesQuery(
+        query: "ValuesQuery[Literal[False]]" = ValuesQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -698,6 +924,9 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        query._use_cache = self._use_cache
+        query._cache_ttl = self._cache_ttl
+        return query
 
     def delete(self) -> "DeleteQuery":
         """
@@ -740,7 +969,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
         Return count of objects in queryset instead of objects.
         """
-        return CountQuery(
+        query = CountQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -751,6 +980,9 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        query._use_cache = self._use_cache
+        query._cache_ttl = self._cache_ttl
+        return query
 
     def exists(self) -> "ExistsQuery":
         """
@@ -816,6 +1048,109 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._raise_does_not_exist = True
         return queryset  # type: ignore
 
+    def _get_keyset_orderings(self) -> List[Tuple[str, Order]]:
+        """
+        Returns the orderings of the QuerySet, with the primary key appended
+        if it isn't ordered by already, so that the ordering is total.
+
+        :raises FieldError: If ordered by a related field, an annotation or a nullable field.
+        """
+        meta = self.model._meta
+        orderings = [
+            (meta.pk_attr if field_name == "pk" else field_name, order)
+            for field_name, order in (
+                self._orderings or (meta.ordering if not self._annotations else ())
+            )
+        ]
+        for field_name, _ in orderings:
+            if field_name not in meta.fields_db_projection:
+                raise FieldError(
+                    f"Keyset pagination can only order by fields of {self.model.__name__},"
+                    f" not by {field_name}"
+                )
+            if meta.fields_map[field_name].null:
+                raise FieldError(f"Keyset pagination can't order by nullable field {field_name}")
+        if not any(field_name == meta.pk_attr for field_name, _ in orderings):
+            orderings.append((meta.pk_attr, orderings[-1][1] if orderings else Order.asc))
+        return orderings
+
+    def _resolve_keyset(self, orderings: List[Tuple[str, Order]], values: List[Any]) -> Term:
+        """
+        Returns the criterion for rows coming after the given values in the given ordering.
+
+        That is a row value comparison like ``(a, b) > (1, 2)`` if the orderings all go in
+        the same direction and the DB supports it, which uses an index on ``(a, b)`` best,
+        else the equivalent ``a > 1 OR (a = 1 AND b > 2)``.
+        """
+        meta = self.model._meta
+        table = meta.basetable
+        columns = [table[meta.fields_db_projection[name]] for name, _ in orderings]
+        params = [ValueWrapper(value) for value in values]
+        if self.capabilities.support_row_values and len({order for _, order in orderings}) == 1:
+            if orderings[0][1] == Order.desc:
+                return RowValue(*columns) < RowValue(*params)
+            return RowValue(*columns) > RowValue(*params)
+        criterion: Optional[Term] = None
+        for (_, order), column, param in reversed(list(zip(orderings, columns, params))):
+            after = column < param if order == Order.desc else column > param
+            criterion = after if criterion is None else after | (column == param) & criterion
+        return cast(Term, criterion)
+
+    async def page_after(self, cursor: Optional[str] = None, size: int = 100) -> Page[MODEL]:
+        """
+        Fetches a page of objects with keyset pagination: the page after ``cursor`` is
+        selected by comparing the ordering fields with the values of the last object of
+        the previous page, so that any page is as fast to get as the first one, unlike
+        with ``offset()``.
+
+        .. code-block:: python3
+
+            queryset = Event.filter(tournament=tournament).order_by("-modified")
+            page = await queryset.page_after(size=50)
+            while page.has_next:
+                page = await queryset.page_after(page.next_cursor, size=50)
+
+        The QuerySet must be ordered by fields of the model that are not nullable
+        (or have a default ordering). The primary key is appended to the ordering if it
+        isn't part of it, to make it unique.
+
+        :param cursor: The ``next_cursor`` of the previous page, or ``None`` for the first page.
+        :param size: The maximum number of objects of the page.
+
+        :raises ParamsError: If ``size`` is not a positive number, if the QuerySet has a limit
+            or offset, or if the cursor is invalid or was made with another ordering.
+        :raises FieldError: If the QuerySet is ordered by related fields, annotations or
+            nullable fields.
+        """
+        if size <= 0:
+            raise ParamsError("Page size should be a positive number")
+        if self._limit is not None or self._offset is not None or self._single:
+            raise ParamsError("page_after() can't be used with limit or offset")
+        orderings = self._get_keyset_orderings()
+        queryset = self._clone()
+        queryset._orderings = orderings
+        queryset._limit = size + 1
+        if cursor is not None:
+            fields_map = self.model._meta.fields_map
+            try:
+                values = [
+                    fields_map[name].to_db_value(
+                        fields_map[name].to_python_value(value), self.model
+                    )
+                    for (name, _), value in zip(orderings, _decode_cursor(cursor, orderings))
+                ]
+            except (ValueError, TypeError, ArithmeticError):
+                raise ParamsError("Invalid cursor")
+            queryset._keyset = (orderings, values)
+        items = await queryset
+        if len(items) <= size:
+            return Page(items, None)
+        items = items[:size]
+        last = items[-1]
+        return Page(
+            items, _encode_cursor(orderings, [getattr(last, name) for name, _ in orderings])
+        )
+
     async def in_bulk(
         self, id_list: Iterable[Union[str, int]], field_name: str
     ) -> Dict[str, MODEL]:
@@ -826,7 +1161,18 @@ class QuerySet(AwaitableQuery[MODEL]):
         :param id_list: A list of field values
         :param field_name: Must be a unique field
         """
-        objs = await self.filter(**{f"{field_name}__in": id_list})
+        if (
+            pk_loader.accepts(self.model)
+            and (field_name == "pk" or field_name == self.model._meta.pk_attr)
+            and not self._q_objects
+            and self._is_plain()
+        ):
+            to_python_value = self.model._meta.pk.to_python_value
+            queryset = self._clone()
+            queryset._db = queryset._choose_db()
+            objs = await pk_loader.load_many(queryset, map(to_python_value, id_list))
+        else:
+            objs = await self.filter(**{f"{field_name}__in": id_list})
         return {getattr(obj, field_name): obj for obj in objs}
 
     def bulk_create(
@@ -836,6 +1182,8 @@ class QuerySet(AwaitableQuery[MODEL]):
         ignore_conflicts: bool = False,
         update_fields: Optional[Iterable[str]] = None,
         on_conflict: Optional[Iterable[str]] = None,
+        method: str = "insert",
+        return_pks: bool = False,
     ) -> "BulkCreateQuery[MODEL]":
         """
         This method inserts the provided list of objects into the database in an efficient manner
@@ -846,6 +1194,14 @@ class QuerySet(AwaitableQuery[MODEL]):
         :param ignore_conflicts: Ignore conflicts when inserting
         :param objects: List of objects to bulk create
         :param batch_size: How many objects are created in a single query
+        :param method: ``"insert"`` (default) or ``"copy"``.
+            ``"copy"`` loads the objects with ``COPY ... FROM STDIN``, which is much faster
+            for large amounts of rows. It falls back to ``"insert"`` on databases that do not
+            support ``COPY`` (see ``capabilities.support_copy``).
+        :param return_pks: Set the generated primary keys on the objects, and mark them as
+            saved. Uses ``INSERT ... RETURNING`` on PostgreSQL and SQLite 3.35+,
+            ``OUTPUT INSERTED`` on MSSQL and ``LAST_INSERT_ID()`` on MySQL, and inserts
+            one object per statement on other databases.
 
         :raises ValueError: If params do not meet specifications
         """
@@ -856,6 +1212,14 @@ class QuerySet(AwaitableQuery[MODEL]):
         if not ignore_conflicts:
             if (update_fields and not on_conflict) or (on_conflict and not update_fields):
                 raise ValueError("update_fields and on_conflict need set in same time.")
+        if method not in ("insert", "copy"):
+            raise ValueError(f'method must be "insert" or "copy", got {method!r}')
+        if method == "copy" and (ignore_conflicts or update_fields):
+            raise ValueError('method="copy" does not support ignore_conflicts or update_fields.')
+        if return_pks and (ignore_conflicts or update_fields or method == "copy"):
+            raise ValueError(
+                'return_pks does not support ignore_conflicts, update_fields or method="copy".'
+            )
         return BulkCreateQuery(
             db=self._db,
             model=self.model,
@@ -864,6 +1228,8 @@ class QuerySet(AwaitableQuery[MODEL]):
             ignore_conflicts=ignore_conflicts,
             update_fields=update_fields,
             on_conflict=on_conflict,
+            method=method,
+            return_pks=return_pks,
         )
 
     def bulk_update(
@@ -1098,6 +1464,8 @@ class QuerySet(AwaitableQuery[MODEL]):
             self.model, self.model._meta.basetable, self._orderings, self._annotations
         )
         self.resolve_filters()
+        if self._keyset is not None:
+            self.query = self.query.where(self._resolve_keyset(*self._keyset))
         if self._limit is not None:
             self.query._limit = self.query._wrapper_cls(self._limit)
         if self._offset is not None:
@@ -1127,27 +1495,205 @@ class QuerySet(AwaitableQuery[MODEL]):
             self.query._use_indexes = []
             self.query = self.query.use_index(*self._use_indexes)
 
+    def _get_query_shape(self, values: list) -> Optional[Tuple[Any, ...]]:
+        """
+        Returns a key for everything the SQL of this queryset depends on, except for the
+        filter values, limit and offset, which are appended to ``values`` instead.
+        Returns ``None`` if the queryset uses features that aren't cached.
+        """
+        if self._annotations or self._custom_filters or self._having or self._group_bys:
+            return None
+        q_shapes = []
+        for node in self._q_objects:
+            q_shape = _get_q_shape(self.model, node, values)
+            if q_shape is None:
+                return None
+            q_shapes.append(q_shape)
+        if self._keyset is not None:
+            if not self.capabilities.support_row_values:
+                return None
+            values.extend(self._keyset[1])
+        if self._limit is not None:
+            values.append(self._limit)
+        if self._offset is not None:
+            values.append(self._offset)
+        return (
+            self.model,
+            type(self._db),
+            self._db.connection_name,
+            tuple(q_shapes),
+            self._fields_for_select,
+            tuple(self._orderings),
+            self._limit is not None,
+            self._offset is not None,
+            self._distinct,
+            self._select_for_update,
+            self._select_for_update_nowait,
+            self._select_for_update_skip_locked,
+            frozenset(self._select_for_update_of),
+            frozenset(self._select_related),
+            frozenset(self._force_indexes),
+            frozenset(self._use_indexes),
+            self._keyset is not None,
+        )
+
+    def _make_cached_query(self) -> Tuple[str, list, Optional[FrozenSet[str]]]:
+        """
+        Returns the parameterized SQL of the query, with the tables it reads from
+        if its shape was cached.
+
+        Querysets that only differ by their filter values, limit and offset generate the
+        same SQL, so it is built once per shape and only the values are bound afterwards.
+        The SQL of a shape is cached only if its values are the ones the query builder
+        extracted, otherwise the shape is always built with ``_make_query()``.
+        """
+        values: list = []
+        shape = self._get_query_shape(values)
+        if shape is not None:
+            try:
+                cached = QUERY_SHAPE_CACHE[shape]
+            except KeyError:
+                pass
+            else:
+                if cached is not None:
+                    sql, self._select_related_idx, tables = cached
+                    return sql, values, tables
+
+        self._make_query()
+        sql, query_values = self.query.get_parameterized_sql()
+        if shape is not None and shape not in QUERY_SHAPE_CACHE:
+            # Equal values could be in any order, so they can't tell if the shape is safe
+            if all(a != b for i, a in enumerate(values) for b in values[i + 1 :]):
+                if len(QUERY_SHAPE_CACHE) >= QUERY_SHAPE_CACHE_SIZE:
+                    QUERY_SHAPE_CACHE.pop(next(iter(QUERY_SHAPE_CACHE)))
+                same_values = len(values) == len(query_values) and all(
+                    type(a) is type(b) and a == b for a, b in zip(values, query_values)
+                )
+                QUERY_SHAPE_CACHE[shape] = (
+                    (sql, self._select_related_idx, get_query_tables(self.query))
+                    if same_values
+                    else None
+                )
+        return sql, query_values, None
+
     def __await__(self) -> Generator[Any, None, List[MODEL]]:
         if self._db is None:
             self._db = self._choose_db(self._select_for_update)  # type: ignore
-        self._make_query()
         return self._execute().__await__()
 
     async def __aiter__(self) -> AsyncIterator[MODEL]:
         for val in await self:
             yield val
 
-    async def _execute(self) -> List[MODEL]:
-        instance_list = await self._db.executor_class(
+    async def iterator(self, chunk_size: int = 2000) -> AsyncIterator[MODEL]:
+        """
+        Iterates over the objects of the QuerySet, streaming them from the database
+        instead of loading the whole resultset into memory.
+
+        .. code-block:: python3
+
+            async for event in Event.filter(rating__gt=5).iterator(chunk_size=1000):
+                print(event.name)
+
+        Rows are fetched ``chunk_size`` at a time using a server-side cursor where the
+        driver supports it, and ``prefetch_related()`` is done for each chunk.
+
+        :param chunk_size: How many rows are fetched from the database at a time.
+
+        :raises ParamsError: If ``chunk_size`` is not a positive number.
+        """
+        if chunk_size <= 0:
+            raise ParamsError("Chunk size should be a positive number")
+        if self._db is None:
+            self._db = self._choose_db(self._select_for_update)  # type: ignore
+        sql, values, _ = self._make_cached_query()
+        chunks = self._db.executor_class(
             model=self.model,
             db=self._db,
             prefetch_map=self._prefetch_map,
             prefetch_queries=self._prefetch_queries,
             select_related_idx=self._select_related_idx,  # type: ignore
-        ).execute_select(
-            *self.query.get_parameterized_sql(),
+        ).execute_select_iter(
+            sql,
+            values,
             custom_fields=list(self._annotations.keys()),
+            chunk_size=chunk_size,
+        )
+        try:
+            async for instance_list in chunks:
+                for instance in instance_list:
+                    yield instance
+        finally:
+            await chunks.aclose()
+
+    def _is_plain(self) -> bool:
+        """
+        Returns whether the queryset fetches whole objects of the model as they are,
+        so they can be looked up by primary key separately from its filters.
+        """
+        return not (
+            self._annotations
+            or self._prefetch_map
+            or self._prefetch_queries
+            or self._select_related
+            or self._fields_for_select
+            or self._select_for_update
+            or self._offset
+            or self._group_bys
+            or self._distinct
+            or self._keyset is not None
         )
+
+    def _get_lookup_pk(self) -> Tuple[bool, Any]:
+        """
+        Returns whether the queryset only looks up an object by primary key,
+        and the primary key as a Python value if so.
+        """
+        if len(self._q_objects) != 1 or not self._is_plain():
+            return False, None
+        q = self._q_objects[0]
+        if q.children or q._is_negated or len(q.filters) != 1:
+            return False, None
+        ((key, value),) = q.filters.items()
+        if (key != "pk" and key != self.model._meta.pk_attr) or isinstance(
+            value, (Expression, Term)
+        ):
+            return False, None
+        try:
+            return True, self.model._meta.pk.to_python_value(value)
+        except (TypeError, ValueError):
+            return False, None
+
+    async def _execute(self) -> List[MODEL]:
+        if self._single:
+            is_pk_lookup, pk = self._get_lookup_pk()
+            if is_pk_lookup:
+                if (session := get_session()) is not None:
+                    if (instance := session.get(self.model, pk)) is not None:
+                        return instance  # type: ignore
+                if pk_loader.accepts(self.model):
+                    instance = await pk_loader.load(self, pk)
+                    if instance is None and self._raise_does_not_exist:
+                        raise DoesNotExist(self.model)
+                    return instance  # type: ignore
+        return await self._execute_query()
+
+    async def _execute_query(self) -> List[MODEL]:
+        sql, values, tables = self._make_cached_query()
+        executor = self._db.executor_class(
+            model=self.model,
+            db=self._db,
+            prefetch_map=self._prefetch_map,
+            prefetch_queries=self._prefetch_queries,
+            select_related_idx=self._select_related_idx,  # type: ignore
+        )
+        custom_fields = list(self._annotations.keys())
+        if self._uses_result_cache() and not self._select_for_update:
+            instance_list = await executor.execute_select_rows(
+                await self._fetch_cached(sql, values, tables), custom_fields
+            )
+        else:
+            instance_list = await executor.execute_select(sql, values, custom_fields=custom_fields)
         if self._single:
             if len(instance_list) == 1:
                 return instance_list[0]
@@ -1237,7 +1783,12 @@ class UpdateQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        count = (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        if query_cache.used:
+            await query_cache.invalidate((self.model._meta.db_table,), self._db)
+        if (session := get_session()) is not None:
+            session.discard_model(self.model)
+        return count
 
 
 class DeleteQuery(AwaitableQuery):
@@ -1286,7 +1837,13 @@ class DeleteQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        count = (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        if query_cache.used:
+            await query_cache.invalidate_model(self.model, self._db)
+        if (session := get_session()) is not None:
+            session.discard_model(self.model)
+            session.discard_referencing(self.model)
+        return count
 
 
 class ExistsQuery(AwaitableQuery):
@@ -1392,7 +1949,10 @@ class CountQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        _, result = await self._db.execute_query(*self.query.get_parameterized_sql())
+        if self._uses_result_cache():
+            result: Any = await self._fetch_cached(*self.query.get_parameterized_sql())
+        else:
+            _, result = await self._db.execute_query(*self.query.get_parameterized_sql())
         if not result:
             return 0
         count = list(dict(result[0]).values())[0] - self._offset
@@ -1513,6 +2073,45 @@ class FieldSelectQuery(AwaitableQuery):
         return group_bys
 
 
+def _to_column(values: list, field_type: Optional[type], to_python: Callable) -> Any:
+    """
+    Converts the values of a column as returned by the driver into an array.
+
+    :param values: The column values.
+    :param field_type: The ``field_type`` of the field of the column, if known.
+    :param to_python: The function converting a single value into its python value.
+    """
+    typecode = _COLUMN_TYPECODES.get(field_type) if None not in values else None
+    if typecode is not None:
+        try:
+            if numpy is not None:
+                return numpy.array(values, dtype=_COLUMN_DTYPES[typecode])
+            return array.array(typecode, values)
+        except (TypeError, ValueError, OverflowError):
+            # e.g. an unsigned BIGINT out of the int64 range
+            pass
+    values = list(map(to_python, values))
+    if numpy is None:
+        return values
+    if field_type is datetime.datetime and None not in values:
+        return numpy.array(
+            [
+                value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+                if value.tzinfo is not None
+                else value
+                for value in values
+            ],
+            dtype="datetime64[us]",
+        )
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+_COLUMN_TYPECODES: Dict[Optional[type], str] = {int: "q", float: "d", bool: "b"}
+_COLUMN_DTYPES = {"q": "int64", "d": "float64", "b": "bool"}
+
+
 class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
     __slots__ = (
         "fields",
@@ -1618,8 +2217,54 @@ class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
         for val in await self:
             yield val
 
+    async def to_arrays(self) -> Dict[str, Any]:
+        """
+        Fetches the result column-wise, as a dict of field name to column.
+
+        Columns of int, float and bool fields are converted at once into NumPy arrays
+        of ``int64``, ``float64`` and ``bool``, and datetime fields into ``datetime64[us]``
+        arrays in UTC. Other columns, and columns containing NULLs, are object arrays.
+
+        If NumPy is not installed, int, float and bool columns are :class:`array.array`
+        of ``"q"``, ``"d"`` and ``"b"``, and the other columns lists.
+
+        :raises TypeError: If used with ``flat=True`` or on a single object query.
+        """
+        if self._flat or self._single:
+            raise TypeError("to_arrays() can't be used with flat or single object queries")
+        self._choose_db_if_not_chosen()
+        self._make_query()
+        result = await self._fetch_rows()
+        return {
+            name: _to_column(
+                list(map(itemgetter(key), result)),
+                self._resolve_field_type(self.model, name),
+                self.resolve_to_python_value(self.model, name),
+            )
+            for key, name in self.fields.items()
+        }
+
+    def _resolve_field_type(self, model: "Type[Model]", field: str) -> Optional[type]:
+        if field in self._annotations:
+            field_object = getattr(self._annotations[field], "field_object", None)
+            return field_object.field_type if field_object else None
+        if field in model._meta.fields_map:
+            if field in model._meta.fetch_fields:
+                return None
+            return model._meta.fields_map[field].field_type
+        field_, __, forwarded_fields = field.partition("__")
+        if field_ in model._meta.fetch_fields:
+            new_model = model._meta.fields_map[field_].related_model  # type: ignore
+            return self._resolve_field_type(new_model, forwarded_fields)
+        return None
+
+    async def _fetch_rows(self) -> Sequence[Any]:
+        if self._uses_result_cache():
+            return await self._fetch_cached(*self.query.get_parameterized_sql())
+        return (await self._db.execute_query(*self.query.get_parameterized_sql()))[1]
+
     async def _execute(self) -> Union[List[Any], Tuple]:
-        _, result = await self._db.execute_query(*self.query.get_parameterized_sql())
+        result = await self._fetch_rows()
         columns = [
             (key, self.resolve_to_python_value(self.model, name))
             for key, name in self.fields.items()
@@ -1748,7 +2393,10 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
             yield val
 
     async def _execute(self) -> Union[List[dict], Dict]:
-        result = await self._db.execute_query_dict(*self.query.get_parameterized_sql())
+        if self._uses_result_cache():
+            result = await self._fetch_cached(*self.query.get_parameterized_sql())
+        else:
+            result = await self._db.execute_query_dict(*self.query.get_parameterized_sql())
         columns = [
             val
             for val in [
@@ -1823,9 +2471,17 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
         self.fields = fields
         self._objects = objects
         self._batch_size = batch_size
-        self._queries: List[QueryBuilder] = []
+        self._queries: List[Tuple[str, List[Any], bool]] = []
+
+    def _make_queries(self) -> List[Tuple[str, List[Any], bool]]:
+        """
+        Returns the statements of the update, as tuples of the SQL, its values and whether
+        it is executed once per row of values.
 
-    def _make_queries(self) -> List[Tuple[str, List[Any]]]:
+        Batches of at least ``BULK_UPDATE_MIN_ROWS`` objects of the executor are updated with
+        its set-based statements, and the others with a CASE expression per field.
+        """
+        self._queries = []
         table = self.model._meta.basetable
         self.query = self._db.query_class.update(table)
         if self.capabilities.support_update_limit_order_by and self._limit:
@@ -1842,9 +2498,20 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
         pk_attr = self.model._meta.pk_attr
         source_pk_attr = self.model._meta.fields_map[pk_attr].source_field or pk_attr
         pk = Field(source_pk_attr)
+        fields = list(self.fields)
+        min_rows = executor.BULK_UPDATE_MIN_ROWS
         for objects_item in chunk(self._objects, self._batch_size):
+            objects_item = list(objects_item)
+            if (
+                min_rows is not None
+                and len(objects_item) >= min_rows
+                and (queries := executor.get_bulk_update_queries(self.query, objects_item, fields))
+                is not None
+            ):
+                self._queries.extend(queries)
+                continue
             query = copy(self.query)
-            for field in self.fields:
+            for field in fields:
                 case = Case()
                 pk_list = []
                 for obj in objects_item:
@@ -1867,13 +2534,20 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
                     pk_list.append(pk_value)
                 query = query.set(field, case)
                 query = query.where(pk.isin(pk_list))
-            self._queries.append(query)
-        return [query.get_parameterized_sql() for query in self._queries]
+            self._queries.append((*query.get_parameterized_sql(), False))
+        return self._queries
 
-    async def _execute_many(self, queries_with_params: List[Tuple[str, List[Any]]]) -> int:
+    async def _execute_many(self, queries_with_params: List[Tuple[str, List[Any], bool]]) -> int:
         count = 0
-        for sql, values in queries_with_params:
-            count += (await self._db.execute_query(sql, values))[0]
+        for sql, values, many in queries_with_params:
+            if many:
+                count += await self._db.execute_many(sql, values) or 0
+            else:
+                count += (await self._db.execute_query(sql, values))[0]
+        if query_cache.used:
+            await query_cache.invalidate((self.model._meta.db_table,), self._db)
+        if (session := get_session()) is not None:
+            session.discard_model(self.model)
         return count
 
     def __await__(self) -> Generator[Any, Any, int]:
@@ -1884,7 +2558,7 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
     def sql(self, params_inline=False) -> str:
         self._choose_db_if_not_chosen()
         queries = self._make_queries()
-        return ";".join([sql for sql, _ in queries])
+        return ";".join([sql for sql, *_ in queries])
 
 
 class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
@@ -1896,6 +2570,8 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
         "_executor",
         "_update_fields",
         "_on_conflict",
+        "_method",
+        "_return_pks",
     )
 
     def __init__(
@@ -1907,6 +2583,8 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
         ignore_conflicts: bool = False,
         update_fields: Optional[Iterable[str]] = None,
         on_conflict: Optional[Iterable[str]] = None,
+        method: str = "insert",
+        return_pks: bool = False,
     ):
         super().__init__(model)
         self._objects = objects
@@ -1915,67 +2593,33 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
         self._db = db
         self._update_fields = update_fields
         self._on_conflict = on_conflict
+        self._method = method
+        self._return_pks = return_pks
 
     def _make_queries(self) -> Tuple[str, str]:
         self._executor = self._db.executor_class(model=self.model, db=self._db)
-        if self._ignore_conflicts or self._update_fields:
-            _, columns = self._executor._prepare_insert_columns()
-            insert_query = self._executor._prepare_insert_statement(
-                columns, ignore_conflicts=self._ignore_conflicts
-            )
-            insert_query_all = insert_query
-            if self.model._meta.generated_db_fields:
-                _, columns_all = self._executor._prepare_insert_columns(include_generated=True)
-                insert_query_all = self._executor._prepare_insert_statement(
-                    columns_all,
-                    has_generated=False,
-                    ignore_conflicts=self._ignore_conflicts,
-                )
-            if self._update_fields:
-                alias = f"new_{self.model._meta.db_table}"
-                insert_query_all = insert_query_all.as_(alias).on_conflict(
-                    *(self._on_conflict or [])
-                )
-                insert_query = insert_query.as_(alias).on_conflict(*(self._on_conflict or []))
-                for update_field in self._update_fields:
-                    insert_query_all = insert_query_all.do_update(update_field)
-                    insert_query = insert_query.do_update(update_field)
-            return insert_query.get_sql(), insert_query_all.get_sql()
-        else:
-            return self._executor.insert_query, self._executor.insert_query_all
-
-    async def _execute_many(self, insert_sql: str, insert_sql_all: str) -> None:
-        for instance_chunk in chunk(self._objects, self._batch_size):
-            values_lists_all = []
-            values_lists = []
-            for instance in instance_chunk:
-                if instance._custom_generated_pk:
-                    values_lists_all.append(
-                        [
-                            self._executor.column_map[field_name](
-                                getattr(instance, field_name), instance
-                            )
-                            for field_name in self._executor.regular_columns_all
-                        ]
-                    )
-                else:
-                    values_lists.append(
-                        [
-                            self._executor.column_map[field_name](
-                                getattr(instance, field_name), instance
-                            )
-                            for field_name in self._executor.regular_columns
-                        ]
-                    )
-            if values_lists_all:
-                await self._db.execute_many(insert_sql_all, values_lists_all)
-            if values_lists:
-                await self._db.execute_many(insert_sql, values_lists)
+        return self._executor.get_bulk_insert_sql(
+            ignore_conflicts=self._ignore_conflicts,
+            update_fields=self._update_fields,
+            on_conflict=self._on_conflict,
+        )
+
+    def _use_copy(self) -> bool:
+        return self._method == "copy" and self._db.capabilities.support_copy
 
     def __await__(self) -> Generator[Any, None, None]:
         self._choose_db_if_not_chosen(True)
-        insert_sql, insert_sql_all = self._make_queries()
-        return self._execute_many(insert_sql, insert_sql_all).__await__()
+        self._executor = self._db.executor_class(model=self.model, db=self._db)
+        if self._use_copy():
+            return self._executor.execute_bulk_copy(self._objects, self._batch_size).__await__()
+        return self._executor.execute_bulk_insert(
+            self._objects,
+            self._batch_size,
+            ignore_conflicts=self._ignore_conflicts,
+            update_fields=self._update_fields,
+            on_conflict=self._on_conflict,
+            return_pks=self._return_pks,
+        ).__await__()
 
     def sql(self, params_inline=False) -> str:
         self._choose_db_if_not_chosen()
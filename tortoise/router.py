@@ -1,20 +1,87 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Type
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence, Type
 
 from tortoise.connection import connections
 from tortoise.exceptions import ConfigurationError
+from tortoise.log import logger
 
 if TYPE_CHECKING:
     from tortoise import BaseDBAsyncClient, Model
 
 
+class _Writes:
+    __slots__ = ("last_write",)
+
+    def __init__(self) -> None:
+        self.last_write: float | None = None
+
+
+_writes: ContextVar[_Writes | None] = ContextVar("_writes", default=None)
+
+# The route of a model that is decided for each query
+_DYNAMIC = object()
+
+
 class ConnectionRouter:
+    """
+    Routes the queries of the models to the connections returned by the configured routers.
+
+    The routes of routers with the ``static_routing`` class attribute set, which only depend
+    on the model, are compiled into a table when Tortoise is initialised, so that only
+    the routers deciding for each query are called for each query.
+
+    With :attr:`read_your_writes` set, the reads that follow a write in the same context,
+    e.g. the task handling a request, are routed like writes, so that they see the writes
+    even if reads otherwise go to replicas lagging behind.
+    Use :meth:`sticky_scope` to share the writes of the tasks started in a scope.
+    """
+
     def __init__(self) -> None:
         self._routers: list[type] = None  # type: ignore
+        # The compiled routes by (model, action), see _compile_route()
+        self._routes: dict[tuple[Type["Model"], str], Any] = {}
+        #: Whether the reads after a write in the same context are routed like writes
+        self.read_your_writes = False
+        #: For how long after the last write reads are routed like writes, in seconds,
+        #: ``None`` for the rest of the context
+        self.sticky_time: float | None = None
+
+    def init_routers(self, routers: list[Callable], models: Iterable[Type["Model"]] = ()) -> None:
+        """
+        Instantiates the routers, and compiles the routes of the models.
 
-    def init_routers(self, routers: list[Callable]) -> None:
+        :param routers: The router classes, in order of precedence.
+        :param models: The models to compile the routes of, the routes of other models are
+            compiled when they are first routed.
+        """
         self._routers = [r() for r in routers]
+        self._routes = {}
+        for model in models:
+            for action in ("db_for_read", "db_for_write"):
+                self._routes[(model, action)] = self._compile_route(model, action)
+
+    def _compile_route(self, model: Type["Model"], action: str) -> Any:
+        """
+        Returns the connection name the routers with ``static_routing`` set route the model to,
+        ``None`` if no router routes it, or ``_DYNAMIC`` if a router without ``static_routing``
+        has to be asked for each query.
+        """
+        for r in self._routers or ():
+            method = getattr(r, action, None)
+            if method is None:
+                continue
+            if not getattr(r, "static_routing", False):
+                return _DYNAMIC
+            chosen_db = method(model)
+            if chosen_db:
+                return chosen_db
+        return None
 
     def _router_func(self, model: Type["Model"], action: str) -> Any:
         for r in self._routers:
@@ -30,15 +97,204 @@ class ConnectionRouter:
 
     def _db_route(self, model: Type["Model"], action: str) -> "BaseDBAsyncClient" | None:
         try:
-            return connections.get(self._router_func(model, action))
+            route = self._routes[(model, action)]
+        except KeyError:
+            route = self._routes[(model, action)] = self._compile_route(model, action)
+        if route is None:
+            return None
+        if route is _DYNAMIC:
+            route = self._router_func(model, action)
+        try:
+            return connections.get(route)
         except ConfigurationError:
             return None
 
     def db_for_read(self, model: Type["Model"]) -> "BaseDBAsyncClient" | None:
+        if self.read_your_writes and self._is_sticky():
+            return self._db_route(model, "db_for_write")
         return self._db_route(model, "db_for_read")
 
     def db_for_write(self, model: Type["Model"]) -> "BaseDBAsyncClient" | None:
+        if self.read_your_writes:
+            writes = _writes.get()
+            if writes is None:
+                writes = _Writes()
+                _writes.set(writes)
+            writes.last_write = time.monotonic()
         return self._db_route(model, "db_for_write")
 
+    def _is_sticky(self) -> bool:
+        writes = _writes.get()
+        if writes is None or writes.last_write is None:
+            return False
+        return self.sticky_time is None or time.monotonic() - writes.last_write < self.sticky_time
+
+    @contextmanager
+    def sticky_scope(self) -> Iterator[None]:
+        """
+        Scopes the routing of reads after writes, to be used as ``with router.sticky_scope():``,
+        e.g. around the handling of a request: the reads in the scope follow the writes
+        made in it, including by the tasks it starts, and the writes made before it
+        don't affect them.
+        """
+        token = _writes.set(_Writes())
+        try:
+            yield
+        finally:
+            _writes.reset(token)
+
+
+class _Replica:
+    __slots__ = ("name", "weight", "healthy", "checked_at", "checking")
+
+    def __init__(self, name: str, weight: float) -> None:
+        self.name = name
+        self.weight = weight
+        self.healthy = True
+        self.checked_at = float("-inf")
+        self.checking = False
+
+
+class ReplicaSetRouter:
+    """
+    A router spreading the reads over the replicas of a primary database, and sending
+    the writes to the primary. It is configured by subclassing it:
+
+    .. code-block:: python3
+
+        class Router(ReplicaSetRouter):
+            primary = "primary"
+            replicas = {"replica1": 2, "replica2": 1}
+            strategy = "least_outstanding"
+            lag_query = "SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+            max_lag = 10
+
+    Each replica is checked every ``health_check_interval`` seconds, in the background
+    of the reads routed: a replica whose ``health_check_query`` fails or takes longer than
+    ``health_check_timeout``, or lags more than ``max_lag`` seconds behind the primary if
+    a ``lag_query`` is set, doesn't get reads until a later check succeeds. If no replica
+    is healthy, the reads are sent to the primary.
+    """
+
+    #: The connection name of the primary, ``None`` for the default connection of the models
+    primary: str | None = None
+    #: The connection names of the replicas, or a mapping of them to their weights
+    replicas: Sequence[str] | Mapping[str, float] = ()
+    #: How a replica is picked for a read: ``"weighted"`` picks one at random in proportion
+    #: to the weights, ``"least_outstanding"`` the one with the fewest connections in use
+    #: relative to its weight
+    strategy: str = "weighted"
+    #: The time between the health checks of a replica, in seconds
+    health_check_interval: float = 5.0
+    #: The time after which a health check fails, in seconds
+    health_check_timeout: float = 2.0
+    #: The query executed to check that a replica is up
+    health_check_query: str = "SELECT 1"
+    #: A query returning the replication lag of a replica in seconds, as its single value
+    lag_query: str | None = None
+    #: The replication lag above which a replica doesn't get reads, in seconds
+    max_lag: float | None = None
+
+    def __init__(self) -> None:
+        if self.strategy not in ("weighted", "least_outstanding"):
+            raise ConfigurationError(f"Unknown replica selection strategy {self.strategy!r}")
+        weights = (
+            self.replicas
+            if isinstance(self.replicas, Mapping)
+            else dict.fromkeys(self.replicas, 1.0)
+        )
+        if not weights:
+            raise ConfigurationError(f"{type(self).__name__} must define replicas")
+        if any(weight <= 0 for weight in weights.values()):
+            raise ConfigurationError("Replica weights must be positive")
+        self._replicas = [_Replica(name, weight) for name, weight in weights.items()]
+        self._tasks: set[asyncio.Task] = set()
+
+    def db_for_read(self, model: Type["Model"]) -> str | None:
+        self._schedule_checks()
+        replicas = [replica for replica in self._replicas if replica.healthy]
+        if not replicas:
+            return self.primary
+        if self.strategy == "weighted":
+            return random.choices(replicas, [replica.weight for replica in replicas])[0].name
+        # The random number breaks the ties between idle replicas
+        return min(
+            replicas,
+            key=lambda replica: (self._in_use(replica.name) / replica.weight, random.random()),
+        ).name
+
+    def db_for_write(self, model: Type["Model"]) -> str | None:
+        return self.primary
+
+    def healthy_replicas(self) -> list[str]:
+        """
+        Returns the names of the replicas that get reads.
+        """
+        return [replica.name for replica in self._replicas if replica.healthy]
+
+    async def check_replica(self, name: str) -> bool:
+        """
+        Returns whether the replica can get reads. Can be overridden for other checks.
+
+        :param name: The connection name of the replica.
+        """
+        db = connections.get(name)
+        await db.execute_query(self.health_check_query)
+        if self.max_lag is None:
+            return True
+        lag = await self.replication_lag(name)
+        return lag is None or lag <= self.max_lag
+
+    async def replication_lag(self, name: str) -> float | None:
+        """
+        Returns how far the replica is behind the primary in seconds, with the ``lag_query``.
+        ``None`` if it isn't known.
+
+        :param name: The connection name of the replica.
+        """
+        if self.lag_query is None:
+            return None
+        _, rows = await connections.get(name).execute_query(self.lag_query)
+        if not rows:
+            return None
+        lag = next(iter(dict(rows[0]).values()), None)
+        return None if lag is None else float(lag)
+
+    def _in_use(self, name: str) -> int:
+        stats = connections.get(name).get_pool_stats()
+        return stats["in_use"] if stats else 0
+
+    def _schedule_checks(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        now = time.monotonic()
+        for replica in self._replicas:
+            if replica.checking or now - replica.checked_at < self.health_check_interval:
+                continue
+            replica.checking = True
+            task = loop.create_task(self._check(replica))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _check(self, replica: _Replica) -> None:
+        reason = "it lags behind"
+        try:
+            healthy = await asyncio.wait_for(
+                self.check_replica(replica.name), self.health_check_timeout
+            )
+        except Exception as exc:
+            healthy = False
+            reason = repr(exc)
+        if healthy != replica.healthy:
+            if healthy:
+                logger.info("Replica %s is healthy again", replica.name)
+            else:
+                logger.warning("Replica %s doesn't get reads: %s", replica.name, reason)
+        replica.healthy = healthy
+        replica.checked_at = time.monotonic()
+        replica.checking = False
+
 
 router = ConnectionRouter()
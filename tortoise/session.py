@@ -0,0 +1,132 @@
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+
+MODEL = TypeVar("MODEL", bound="Model")
+
+_current_session: ContextVar[Optional["Session"]] = ContextVar("_current_session", default=None)
+
+
+class Session:
+    """
+    An identity map of the model instances fetched in a scope, e.g. a request.
+
+    While a session is active, every row fetched for a model resolves to the instance already
+    in the map for its primary key, if any, and ``.get(pk=...)`` queries are answered from
+    the map without a query. Instances fetched with ``.only()`` aren't added to the map.
+
+    Instances in the map aren't refreshed by later fetches. Updates and deletes through
+    the ORM discard the instances they can make stale, but changes made with raw SQL or
+    rolled back transactions aren't tracked: use :meth:`clear` or ``.refresh_from_db()``
+    in such cases.
+    """
+
+    __slots__ = ("_instances", "_token")
+
+    def __init__(self) -> None:
+        self._instances: "Dict[Tuple[Type[Model], Any], Model]" = {}
+        self._token: Any = None
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    async def __aenter__(self) -> "Session":
+        self._token = _current_session.set(self)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        _current_session.reset(self._token)
+        self._instances.clear()
+
+    def get(self, model: "Type[MODEL]", pk: Any) -> Optional[MODEL]:
+        """
+        Returns the instance of the model with the primary key, if it is in the map.
+        """
+        return self._instances.get((model, pk))  # type: ignore
+
+    def add(self, instance: "Model") -> None:
+        """
+        Adds a fetched instance to the map, replacing the instance with the same primary key.
+        """
+        self._instances[(instance.__class__, instance.pk)] = instance
+
+    def discard(self, instance: "Model") -> None:
+        """
+        Removes the instance with the same model and primary key from the map.
+        """
+        self._instances.pop((instance.__class__, instance.pk), None)
+
+    def discard_model(self, model: "Type[Model]") -> None:
+        """
+        Removes all instances of the model from the map.
+        """
+        self._discard_models({model})
+
+    def discard_referencing(self, model: "Type[Model]") -> None:
+        """
+        Removes the instances of the models referencing the model, recursively,
+        as deleting from the model can cascade to them.
+        """
+        self._discard_models(_get_referencing_models(model))
+
+    def _discard_models(self, models: "Set[Type[Model]]") -> None:
+        if models:
+            for key in [key for key in self._instances if key[0] in models]:
+                del self._instances[key]
+
+    def clear(self) -> None:
+        """
+        Removes all instances from the map.
+        """
+        self._instances.clear()
+
+    def wrap_init(
+        self, model: "Type[Model]", init: "Callable[[Any], Model]", pk_key: str
+    ) -> "Callable[[Any], Model]":
+        """
+        Wraps a function creating instances of the model from rows, so that it returns
+        the instance in the map for the primary key of the row instead, if any.
+
+        :param model: The model of the instances.
+        :param init: The function creating an instance from a row.
+        :param pk_key: The key of the primary key in the rows.
+        """
+        instances = self._instances
+        to_python_value = model._meta.pk.to_python_value
+
+        def session_init(row: Any) -> "Model":
+            try:
+                key = (model, to_python_value(row[pk_key]))
+            except (KeyError, IndexError):
+                return init(row)
+            try:
+                return instances[key]
+            except KeyError:
+                instance = init(row)
+                if not instance._partial:
+                    instances[key] = instance
+                return instance
+
+        return session_init
+
+
+def get_session() -> Optional[Session]:
+    """
+    Returns the active session, if any.
+    """
+    return _current_session.get()
+
+
+def _get_referencing_models(model: "Type[Model]") -> "Set[Type[Model]]":
+    models: "Set[Type[Model]]" = set()
+    pending = [model]
+    while pending:
+        meta = pending.pop()._meta
+        for field_name in meta.backward_fk_fields | meta.backward_o2o_fields:
+            related_model = meta.fields_map[field_name].related_model  # type: ignore
+            if related_model not in models:
+                models.add(related_model)
+                pending.append(related_model)
+    return models